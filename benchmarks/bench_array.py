@@ -0,0 +1,52 @@
+"""Compares memory use and value_mapping/value_select speed of jdict and jarray with float values
+
+Run with `python benchmarks/bench_array.py`.
+"""
+import time
+import tracemalloc
+
+import numpy as np
+
+from jdict import jarray, jdict
+
+
+def measure(build):
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    size = 1_000_000
+    keys = [f"key{idx}" for idx in range(size)]
+
+    j, j_bytes = measure(lambda: jdict({key: float(idx) for idx, key in enumerate(keys)}))
+    a, a_bytes = measure(lambda: jarray({key: float(idx) for idx, key in enumerate(keys)}))
+    print(f"{size} items (excluding the key strings)")
+    print(f"  memory:        jdict {j_bytes / 2 ** 20:7.1f} MiB, jarray {a_bytes / 2 ** 20:7.1f} MiB")
+    _, index_bytes = measure(lambda: a[keys[-1]])
+    print(f"  jarray builds its key -> position map on the first lookup by key: +{index_bytes / 2 ** 20:.1f} MiB")
+    print(
+        f"  value_mapping: jdict {timed(lambda: j.value_mapping(lambda v: v * 2)):7.3f} s,   "
+        f"jarray {timed(lambda: a.value_mapping(lambda v: v * 2)):7.3f} s"
+    )
+    print(
+        f"  value_select:  jdict {timed(lambda: j.value_select(lambda v: v > size / 2)):7.3f} s,   "
+        f"jarray {timed(lambda: a.value_select(lambda v: v > size / 2)):7.3f} s"
+    )
+    print(
+        f"  value sum:     jdict {timed(lambda: sum(j.value_list)):7.3f} s,   "
+        f"jarray {timed(lambda: np.sum(a.value_list)):7.3f} s"
+    )
+
+
+if __name__ == "__main__":
+    main()
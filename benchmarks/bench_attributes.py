@@ -0,0 +1,30 @@
+"""Times attribute-style access on jdict against item access on jdict and on a plain dict
+
+Run with `python benchmarks/bench_attributes.py`.
+"""
+import timeit
+
+from jdict import jdict
+
+
+def main():
+    namespace = {"d": {"x": 1, "y": 2}, "j": jdict(x=1, y=2), "cached": jdict(x=1, y=2)}
+    # A jdict with cached lists, which have to be kept up to date on every write
+    namespace["cached"].key_list
+    cases = [
+        ("dict: d['x']", "d['x']"),
+        ("jdict: j['x']", "j['x']"),
+        ("jdict: j.x", "j.x"),
+        ("dict: d['x'] = 3", "d['x'] = 3"),
+        ("jdict: j['x'] = 3", "j['x'] = 3"),
+        ("jdict: j.x = 3", "j.x = 3"),
+        ("jdict with cached key_list: j.x = 3", "cached.x = 3"),
+    ]
+    number = 1_000_000
+    for name, stmt in cases:
+        elapsed = min(timeit.repeat(stmt, globals=namespace, number=number, repeat=5))
+        print(f"{name:<40} {elapsed / number * 1e9:>8.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
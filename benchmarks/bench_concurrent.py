@@ -0,0 +1,76 @@
+"""Times reads from several threads on jconcurrent against a jdict guarded by a lock, while another thread writes
+
+Run with `python benchmarks/bench_concurrent.py`.
+"""
+import threading
+import time
+
+from jdict import jconcurrent, jdict
+
+SIZE = 1_000
+READS = 20_000
+
+
+class LockedJdict:
+    """The usual alternative: every read and write takes the same lock"""
+
+    def __init__(self, data):
+        self.lock = threading.Lock()
+        self.j = jdict(data)
+
+    def read(self, key):
+        with self.lock:
+            return self.j[key], self.j.last
+
+    def write(self, key, value):
+        with self.lock:
+            self.j[key] = value
+
+
+def read_concurrent(conc, key):
+    return conc[key], conc.last
+
+
+def run(read, write, threads: int) -> float:
+    done = threading.Event()
+
+    def writer():
+        n = 0
+        while not done.is_set():
+            write(f"k{n % SIZE}", n)
+            n += 1
+            time.sleep(0.001)
+
+    def reader():
+        for n in range(READS):
+            read(f"k{n % SIZE}")
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    readers = [threading.Thread(target=reader) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in readers:
+        thread.start()
+    for thread in readers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    done.set()
+    writer_thread.join()
+    return threads * READS / elapsed
+
+
+def main():
+    data = {f"k{n}": n for n in range(SIZE)}
+    for threads in (1, 2, 4, 8):
+        locked = LockedJdict(data)
+        conc = jconcurrent(data)
+        locked_rate = run(locked.read, locked.write, threads)
+        conc_rate = run(lambda key: read_concurrent(conc, key), conc.__setitem__, threads)
+        print(
+            f"{threads} reader threads: "
+            f"jdict with lock {locked_rate:>10,.0f} reads/s, jconcurrent {conc_rate:>10,.0f} reads/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Times building, reopening and reading a jfile
+
+Run with `python benchmarks/bench_file.py [directory]`.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from jdict import jfile
+
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else tempfile.mkdtemp()
+    path = os.path.join(directory, "bench.jfile")
+    size = 200_000
+
+    start = time.perf_counter()
+    with jfile(path) as table:
+        for idx in range(size):
+            table[f"key{idx}"] = {"id": idx, "payload": "x" * 100}
+    print(f"write {size} items: {time.perf_counter() - start:.2f} s")
+    print(f"size on disk: {sum(os.path.getsize(path + suffix) for suffix in ('', '.ord', '.idx')) / 2 ** 20:.1f} MiB")
+
+    start = time.perf_counter()
+    table = jfile(path)
+    print(f"reopen: {(time.perf_counter() - start) * 1e3:.2f} ms")
+
+    start = time.perf_counter()
+    for idx in range(0, size, 7):
+        table[f"key{idx}"]
+    print(f"lookup by key: {(time.perf_counter() - start) / (size / 7) * 1e6:.1f} us")
+
+    start = time.perf_counter()
+    for idx in range(0, size, 7):
+        table.at(idx)
+    print(f"lookup by position: {(time.perf_counter() - start) / (size / 7) * 1e6:.1f} us")
+    table.close()
+
+
+if __name__ == "__main__":
+    main()
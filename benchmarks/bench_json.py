@@ -0,0 +1,36 @@
+"""Times reading json after changing one key, for jdict and for a plain json.dumps of the dict
+
+Run with `python benchmarks/bench_json.py`.
+"""
+import json
+import time
+
+from jdict import jdict
+
+
+def main():
+    size = 100_000
+    data = {f"key{idx}": {"id": idx, "name": f"name {idx}", "tags": ["a", "b"]} for idx in range(size)}
+    j = jdict(dict(data))
+    rounds = 20
+
+    start = time.perf_counter()
+    for idx in range(rounds):
+        data[f"key{idx}"] = {"id": -idx}
+        json.dumps(data)
+    dumps_time = (time.perf_counter() - start) / rounds
+
+    j.json
+    start = time.perf_counter()
+    for idx in range(rounds):
+        j[f"key{idx}"] = {"id": -idx}
+        j.json
+    jdict_time = (time.perf_counter() - start) / rounds
+
+    print(f"{size} items, one changed between reads")
+    print(f"  json.dumps: {dumps_time * 1e3:7.1f} ms per read")
+    print(f"  jdict.json: {jdict_time * 1e3:7.1f} ms per read (including building the per-item cache once)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""Measures the memory used per instance by small jdicts and jrecords, compared with plain dicts and tuples
+
+Run with `python benchmarks/bench_memory.py`.
+"""
+import tracemalloc
+
+from jdict import Schema, jdict
+
+
+def per_instance(build, count=100_000) -> float:
+    """the bytes allocated per object by build(idx)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(idx) for idx in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Don't count the list holding the objects
+    return (after - before) / len(objects) - 8
+
+
+def main():
+    def used(j):
+        j.key_list
+        j.last_value
+        return j
+
+    schema = Schema(["x", "y", "z"])
+    cases = {
+        "dict": lambda idx: {"x": idx, "y": idx, "z": idx},
+        "tuple": lambda idx: (idx, idx, idx),
+        "jdict": lambda idx: jdict({"x": idx, "y": idx, "z": idx}),
+        "jdict after key_list and last_value": lambda idx: used(jdict({"x": idx, "y": idx, "z": idx})),
+        "jrecord": lambda idx: schema(idx, idx, idx),
+    }
+    baseline = None
+    for name, build in cases.items():
+        size = per_instance(build)
+        baseline = baseline or size
+        print(f"{name}: {size:.0f} bytes per instance ({size - baseline:+.0f} compared with dict)")
+
+
+if __name__ == "__main__":
+    main()
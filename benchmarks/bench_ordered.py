@@ -0,0 +1,32 @@
+"""Edits the order of a large playlist in the middle: jordered against jdict, which rebuilds the dict on every edit
+
+Run with `python benchmarks/bench_ordered.py`.
+"""
+import random
+import time
+
+from jdict import jdict, jordered
+
+EDITS = 200
+
+
+def edit(cls, size: int) -> float:
+    rng = random.Random(0)
+    playlist = cls({f"track{idx}": idx for idx in range(size)})
+    keys = list(playlist)
+    start = time.perf_counter()
+    for step in range(EDITS):
+        playlist.move_to(rng.choice(keys), rng.randrange(size))
+        playlist.swap(rng.randrange(size), rng.randrange(size))
+        playlist.key_at(rng.randrange(size))
+    return (time.perf_counter() - start) / EDITS
+
+
+def main():
+    print(f"{'size':>10} {'jdict [us/edit]':>16} {'jordered [us/edit]':>19}")
+    for size in (1_000, 10_000, 100_000):
+        print(f"{size:>10} {edit(jdict, size) * 1e6:>16.1f} {edit(jordered, size) * 1e6:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Times top_k against sorting all the items, and sort_by_value in place against rebuilding a sorted jdict
+
+Run with `python benchmarks/bench_ordering.py`.
+"""
+import random
+import time
+
+from jdict import jdict
+
+SIZE = 1_000_000
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    j = jdict({f"k{idx}": rng.random() for idx in range(SIZE)})
+
+    full_sort = timed(lambda: jdict(dict(sorted(j.list, key=lambda item: item[1], reverse=True)[:10])))
+    top_k = timed(lambda: j.top_k(10))
+    print(f"10 largest of {SIZE:,}: sort everything {full_sort:.3f} s, top_k {top_k:.3f} s")
+
+    def rebuild():
+        rebuilt = jdict(dict(sorted(j.list, key=lambda item: item[1])))
+        rebuilt.key_list, rebuilt.value_list, rebuilt.list
+
+    def in_place():
+        j.sort_by_value()
+        j.key_list, j.value_list, j.list
+
+    print(f"sort {SIZE:,} by value: rebuild a jdict {timed(rebuild):.3f} s, sort_by_value {timed(in_place):.3f} s")
+
+
+if __name__ == "__main__":
+    main()
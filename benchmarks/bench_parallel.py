@@ -0,0 +1,50 @@
+"""Times value_mapping with an expensive function in thread and process pools of increasing size
+
+Run with `python benchmarks/bench_parallel.py`. The process pool should scale with the number of cores for CPU-bound
+functions, and the thread pool with the number of workers for functions that wait (here, sleep).
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import hashlib
+import os
+import time
+
+from jdict import jdict
+
+
+def cpu_bound(value: int) -> str:
+    digest = str(value).encode()
+    for _ in range(2000):
+        digest = hashlib.sha256(digest).digest()
+    return digest.hex()
+
+
+def io_bound(value: int) -> int:
+    time.sleep(0.001)
+    return value
+
+
+def timed(j: jdict, func, executor=None, chunksize=None) -> float:
+    start = time.perf_counter()
+    j.value_mapping(func, executor=executor, chunksize=chunksize)
+    return time.perf_counter() - start
+
+
+def main():
+    cpus = os.cpu_count() or 1
+    workers = sorted({1, 2, 4, cpus})
+
+    j = jdict({f"key{idx}": idx for idx in range(2000)})
+    print(f"CPU-bound, {len(j)} items: serial {timed(j, cpu_bound):.2f} s")
+    for count in workers:
+        with ProcessPoolExecutor(count) as executor:
+            print(f"  process pool, {count:>2} workers: {timed(j, cpu_bound, executor):.2f} s")
+
+    j = jdict({f"key{idx}": idx for idx in range(500)})
+    print(f"I/O-bound, {len(j)} items: serial {timed(j, io_bound):.2f} s")
+    for count in sorted({1, 4, 16, 64}):
+        with ThreadPoolExecutor(count) as executor:
+            print(f"  thread pool, {count:>2} workers: {timed(j, io_bound, executor, chunksize=4):.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Drains jdict and jqueue from the front and reports the time per pop_first
+
+Run with `python benchmarks/bench_queue.py`. The time per pop grows with the size for jdict, but stays flat for jqueue.
+"""
+import time
+
+from jdict import jdict, jqueue
+
+
+def drain(cls, size: int) -> float:
+    queue = cls({idx: idx for idx in range(size)})
+    start = time.perf_counter()
+    while queue:
+        queue.pop_first()
+    return (time.perf_counter() - start) / size
+
+
+def main():
+    print(f"{'size':>10} {'jdict [us/pop]':>15} {'jqueue [us/pop]':>16}")
+    for size in (10_000, 20_000, 40_000, 80_000):
+        print(f"{size:>10} {drain(jdict, size) * 1e6:>15.2f} {drain(jqueue, size) * 1e6:>16.2f}")
+    for size in (160_000, 320_000, 1_000_000):
+        print(f"{size:>10} {'-':>15} {drain(jqueue, size) * 1e6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
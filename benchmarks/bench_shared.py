@@ -0,0 +1,54 @@
+"""Compares handing a large jdict to a worker process by pickling it with attaching to a frozen jshared
+
+Run with `python benchmarks/bench_shared.py`.
+"""
+import multiprocessing
+import pickle
+import time
+
+from jdict import jdict, jshared
+
+
+def _unpickle(pickled):
+    start = time.perf_counter()
+    table = jdict(pickle.loads(pickled))
+    return time.perf_counter() - start, table["key7"]
+
+
+def _attach(name):
+    start = time.perf_counter()
+    with jshared(name) as table:
+        return time.perf_counter() - start, table["key7"]
+
+
+def main():
+    size = 200_000
+    source = jdict({f"key{idx}": {"id": idx, "payload": f"{idx:0100}"} for idx in range(size)})
+
+    start = time.perf_counter()
+    pickled = pickle.dumps(source.data)
+    print(f"pickle {size} items: {time.perf_counter() - start:.2f} s ({len(pickled) / 2 ** 20:.1f} MiB per worker)")
+
+    start = time.perf_counter()
+    with jshared.freeze(source) as frozen:
+        print(f"freeze {size} items: {time.perf_counter() - start:.2f} s ({frozen._table.shm.size / 2 ** 20:.1f} MiB shared)")
+
+        with multiprocessing.get_context("spawn").Pool(1) as pool:
+            elapsed, _ = pool.apply(_unpickle, (pickled,))
+            print(f"unpickle in worker: {elapsed * 1e3:.2f} ms")
+            elapsed, _ = pool.apply(_attach, (frozen.name,))
+            print(f"attach in worker: {elapsed * 1e3:.2f} ms")
+
+        start = time.perf_counter()
+        for idx in range(0, size, 7):
+            frozen[f"key{idx}"]
+        print(f"lookup by key: {(time.perf_counter() - start) / (size / 7) * 1e6:.1f} us")
+
+        start = time.perf_counter()
+        for idx in range(0, size, 7):
+            frozen.at(idx)
+        print(f"lookup by position: {(time.perf_counter() - start) / (size / 7) * 1e6:.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Keeps a table ordered by key while random keys are inserted and range queries are made: jsorted against rebuilding
+a sorted jdict before each query
+
+Run with `python benchmarks/bench_sorted.py`.
+"""
+import random
+import time
+
+from jdict import jdict, jsorted
+
+QUERIES = 200
+INSERTS_PER_QUERY = 50
+
+
+def rebuild(size: int, keys) -> float:
+    j = jdict({key: key for key in keys[:size]})
+    start = time.perf_counter()
+    pos = size
+    for _ in range(QUERIES):
+        for key in keys[pos : pos + INSERTS_PER_QUERY]:
+            j[key] = key
+        pos += INSERTS_PER_QUERY
+        j = jdict(dict(sorted(j.list)))
+        lo = j.key_at(len(j) // 2)
+        [key for key in j.key_list if lo <= key < lo + 1000]
+    return (time.perf_counter() - start) / QUERIES
+
+
+def sorted_(size: int, keys) -> float:
+    j = jsorted({key: key for key in keys[:size]})
+    start = time.perf_counter()
+    pos = size
+    for _ in range(QUERIES):
+        for key in keys[pos : pos + INSERTS_PER_QUERY]:
+            j[key] = key
+        pos += INSERTS_PER_QUERY
+        lo = j.key_at(len(j) // 2)
+        j.range_keys(lo, lo + 1000)
+    return (time.perf_counter() - start) / QUERIES
+
+
+def main():
+    print(f"{'size':>10} {'sort and rebuild [ms/query]':>28} {'jsorted [ms/query]':>19}")
+    for size in (10_000, 100_000):
+        keys = random.Random(0).sample(range(100 * size), size + QUERIES * INSERTS_PER_QUERY)
+        print(f"{size:>10} {rebuild(size, keys) * 1e3:>28.3f} {sorted_(size, keys) * 1e3:>19.3f}")
+
+
+if __name__ == "__main__":
+    main()
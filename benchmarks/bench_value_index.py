@@ -0,0 +1,37 @@
+"""Times looking up keys by value with and without the value index, and what the index costs on writes
+
+Run with `python benchmarks/bench_value_index.py`.
+"""
+import random
+import timeit
+
+from jdict import jdict
+
+SIZE = 1_000_000
+GROUPS = 1_000
+
+
+def main():
+    rng = random.Random(0)
+    data = {f"k{idx}": rng.randrange(GROUPS) for idx in range(SIZE)}
+    plain = jdict(dict(data))
+    plain.key_list
+    indexed = jdict(dict(data)).enable_value_index()
+    namespace = {"plain": plain, "indexed": indexed, "rng": rng, "SIZE": SIZE, "GROUPS": GROUPS}
+
+    cases = [
+        ("select(value_func=...)", "plain.select(value_func=lambda value: value == 7)", 5),
+        ("keys_of without index", "plain.keys_of(7)", 5),
+        ("keys_of with index", "indexed.keys_of(7)", 10_000),
+        ("group_by without index", "plain.group_by()", 3),
+        ("group_by with index", "indexed.group_by()", 3),
+        ("write without index", "plain[f'k{rng.randrange(SIZE)}'] = rng.randrange(GROUPS)", 100_000),
+        ("write with index", "indexed[f'k{rng.randrange(SIZE)}'] = rng.randrange(GROUPS)", 100_000),
+    ]
+    for name, stmt, number in cases:
+        elapsed = min(timeit.repeat(stmt, globals=namespace, number=number, repeat=3)) / number
+        print(f"{name:<28} {elapsed * 1e6:>12.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Times fetching many positions from a jdict: value_at in a loop against values_at and slicing
+
+Run with `python benchmarks/bench_view.py`.
+"""
+import random
+import time
+
+from jdict import jarray, jdict
+
+SIZE = 100_000
+GATHER = 1_000
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    positions = random.Random(0).sample(range(SIZE), GATHER)
+    j = jdict({f"k{idx}": float(idx) for idx in range(SIZE)})
+    array = jarray(dict(j.data))
+    # Builds the map from keys to positions, which jarray does on the first lookup by key
+    array["k0"]
+    cases = [
+        ("value_at in a loop", lambda: [j.value_at(pos) for pos in positions]),
+        ("values_at", lambda: list(j.values_at(positions))),
+        ("values_at(...).to_numpy()", lambda: j.values_at(positions).to_numpy()),
+        ("jarray: values_at(...).to_numpy()", lambda: array.values_at(positions).to_numpy()),
+        ("j[::100] as a jdict", lambda: j[::100].to_jdict()),
+        ("jarray: j[::100].to_numpy()", lambda: array[::100].to_numpy()),
+    ]
+    print(f"gathering {GATHER:,} positions from {SIZE:,} items")
+    for name, func in cases:
+        print(f"{name:<36} {timed(func) * 1e3:>10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
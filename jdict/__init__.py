@@ -1,7 +1,17 @@
 from collections import UserDict
+from collections.abc import MutableMapping
+import heapq
+from itertools import chain, repeat
+import inspect
 import json
+from operator import itemgetter
+import os
 import sys
-from typing import Any, Dict, Hashable, List, Optional, Tuple
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from ._grouping import ValueIndex
+from ._jsonstream import iter_object_items
+from ._order import OrderIndex
 
 f"""f-string triggers error when importing from Python versions earlier than 3.6"""
 
@@ -9,21 +19,114 @@ Key = Hashable
 Value = Any
 KeyValuePair = Tuple[Key, Value]
 
+_default_encoder = json.JSONEncoder()
 
-class jdict(UserDict):
-    """Dictionary extended with convenience methods that depend heavily on dictionaries being ordered by insertion order"""
+# Bits of _Housekeeping.flags, set while the corresponding cached list is valid
+_KEYS_VALID = 1
+_VALUES_VALID = 2
+_ITEMS_VALID = 4
 
-    # Protect attributes used for housekeeping
-    protected_keys = (
-        "data",
-        "_keys",
-        "_values",
-        "_items",
-        "_keysvalid",
-        "_valuesvalid",
-        "_itemsvalid",
+
+def _identity(x):
+    """Default mapping function (module level, so that it can be sent to a process pool)"""
+    return x
+
+
+def _always(x):
+    """Default selection function (module level, so that it can be sent to a process pool)"""
+    return True
+
+
+def _map_chunk(key_func, value_func, items: List[KeyValuePair]) -> List[KeyValuePair]:
+    """Maps a chunk of items (in a worker)"""
+    return [(key_func(key), value_func(value)) for key, value in items]
+
+
+def _select_chunk(key_func, value_func, items: List[KeyValuePair]) -> List[KeyValuePair]:
+    """Filters a chunk of items (in a worker)"""
+    return [(key, value) for key, value in items if key_func(key) and value_func(value)]
+
+
+def _item_key(by: str, key=None):
+    """Helper: a function which returns what to compare a (key, value)-pair by: its key or value (by), or key() of it"""
+    if by not in ("key", "value"):
+        raise ValueError(f'by must be "key" or "value", not {by!r}')
+    pos = 0 if by == "key" else 1
+    if key is None:
+        return itemgetter(pos)
+    return lambda item: key(item[pos])
+
+
+async def _resolve(result):
+    """Awaits the result if it is awaitable (so that both plain and async functions can be used)"""
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+def _worker_count(limit: Optional[int], count: int) -> int:
+    """Helper: the number of workers needed for count items with at most limit of them running at a time"""
+    if limit is None:
+        return count
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, not {limit}")
+    return min(limit, count)
+
+
+class _Housekeeping:
+    """Cached lists, position and value indices and cached representations of a jdict, which are only allocated once
+    one of them is needed (many jdicts never need any of them)"""
+
+    __slots__ = (
+        "keys",
+        "values",
+        "items",
+        "flags",
+        "index",
+        "groups",
+        "series",
+        "json",
+        "fragments",
+        "encoder",
+        "snapshot",
     )
 
+    def __init__(self):
+        self.keys = None  # type: Optional[List[Key]]
+        self.values = None  # type: Optional[List[Value]]
+        self.items = None  # type: Optional[List[KeyValuePair]]
+        self.flags = 0
+        self.index = None  # type: Optional[OrderIndex]
+        self.groups = None  # type: Optional[ValueIndex]
+        self.series = None
+        self.json = None  # type: Optional[str]
+        self.fragments = None  # type: Optional[Dict[Key, str]]
+        self.encoder = None
+        self.snapshot = None  # type: Optional[frozenjdict]
+
+
+class jdict(MutableMapping):
+    """Dictionary extended with convenience methods that depend heavily on dictionaries being ordered by insertion order
+
+    Like UserDict, it wraps a dict in the data attribute, but it has no instance __dict__, so that small jdicts are
+    cheap to keep around by the million. Everything else is kept in a _Housekeeping which is only allocated when it is
+    first needed."""
+
+    # Attributes used for housekeeping
+    __slots__ = ("data", "_state")
+
+    # Protect attributes used for housekeeping
+    protected_keys = frozenset(__slots__)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls._store is not jdict._store and cls.__setitem__ is jdict.__setitem__:
+            # The fast path of jdict.__setitem__ writes to data, which is wrong if the items are stored differently
+            cls.__setitem__ = jdict._setitem
+        if cls.__getitem__ is not jdict.__getitem__ and "_attribute" not in cls.__dict__:
+            # Likewise, attribute access must look the key up the same way as item access
+            cls._attribute = cls.__getitem__
+
     @staticmethod
     def _first(obj):
         """Helper: Returns the first element in the object"""
@@ -46,14 +149,52 @@ class jdict(UserDict):
                 return tuple(item)
         raise IndexError(idx)
 
-    def _pop(self, key: Key):
-        """Helper: pops the item at the key"""
-        if len(self.data) == 0:
+    def _pop(self, key: Key, idx: Optional[int] = None):
+        """Helper: pops the item at the key, which is at the index idx if known"""
+        if len(self) == 0:
             raise IndexError("pop from empty jdict")
-        value = self.data[key]
-        del self.data[key]
-        self._invalidate()
-        return key, value
+        return key, self._discard(key, idx)
+
+    def _store(self, key: Key, value: Value):
+        """Sets the item, keeping the cached lists and the position index up to date. All writes go through here."""
+        state = self._state
+        if state is None:
+            self.data[key] = value
+            return
+        if state.snapshot is not None:
+            self._unshare()
+        data = self.data
+        new = key not in data
+        if state.groups is not None:
+            if new:
+                state.groups.add(key, value)
+            else:
+                state.groups.replace(key, data[key], value)
+        data[key] = value
+        if new and state.index is not None:
+            state.index.append(key)
+        if state.flags:
+            self._patch_set(key, value, new)
+        self._drop_derived(key)
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        """Removes the item and returns the value, keeping the cached lists and the position index up to date.
+        All removals go through here."""
+        state = self._state
+        if state is None:
+            return self.data.pop(key)
+        if state.snapshot is not None:
+            self._unshare()
+        value = self.data.pop(key)
+        if idx is None:
+            idx = self._cached_index(key)
+        if state.index is not None:
+            state.index.remove(key)
+        if state.groups is not None:
+            state.groups.remove(key, value)
+        self._patch_removed(idx)
+        self._drop_derived(key)
+        return value
 
     def __init__(self, data=None, **kwargs):
         """Sets attributes used for housekeeping"""
@@ -66,71 +207,295 @@ class jdict(UserDict):
         else:
             self.data = kwargs
 
-        self._cleanse()
-        self._invalidate()
+        self._state = None
+
+    def _housekeeping(self) -> _Housekeeping:
+        """Helper: the housekeeping state, which is allocated first if it hasn't been yet"""
+        state = self._state
+        if state is None:
+            state = self._state = _Housekeeping()
+        return state
+
+    def _unshare(self):
+        """Helper: copies the dict if it is shared with a snapshot, so that it can be modified"""
+        state = self._state
+        if state is not None and state.snapshot is not None:
+            self.data = self.data.copy()
+            state.snapshot = None
+
+    def snapshot(self) -> "frozenjdict":
+        """a frozenjdict with the current items (a shallow copy, like copy)
+
+        If the items are kept in a flat dict (not for jtree, jarray, jrecord, jfile or jshared), this is O(1): the
+        snapshot shares the dict, which this jdict copies the next time it is modified. Until then, the same snapshot is
+        returned."""
+        if type(self).data is not jdict.data:
+            return frozenjdict._wrap(dict(self.data.items()))
+        state = self._housekeeping()
+        if state.snapshot is None:
+            state.snapshot = frozenjdict._wrap(self.data)
+        return state.snapshot
 
     def _cleanse(self):
         """Drops everything"""
-        self._keys = []
-        self._values = []
-        self._items = []
+        state = self._state
+        if state is not None:
+            state.keys = None
+            state.values = None
+            state.items = None
+            state.fragments = None
+            if state.groups is not None:
+                state.groups.clear()
 
     def _invalidate(self):
         """Sets all flags to invalid (so the key_list, value_list and itemlist must be recalculated)"""
-        self._keysvalid = False
-        self._valuesvalid = False
-        self._itemsvalid = False
+        state = self._state
+        if state is not None:
+            state.flags = 0
+            self._drop_derived()
+
+    def _drop_derived(self, *keys: Key):
+        """Drops the cached representations built from the items (series and json) after the items at the keys have
+        changed, or after the order has changed if no keys are given"""
+        state = self._state
+        if state is None:
+            return
+        state.series = None
+        state.json = None
+        if state.fragments is not None:
+            for key in keys:
+                state.fragments.pop(key, None)
 
-    def _key_is_protected(self, key: Key) -> bool:
-        """whether the key is protected (should not override default __setattr__ for this key)"""
-        return key in jdict.protected_keys
+    def _regroup(self, key: Key, value: Value):
+        """Helper: moves the key to the group of the value in the value index (if any), before it is set to the value.
+        For subclasses which don't store items through jdict._store."""
+        state = self._state
+        if state is not None and state.groups is not None:
+            if key in self:
+                state.groups.replace(key, self[key], value)
+            else:
+                state.groups.add(key, value)
+
+    def _ungroup(self, key: Key, value: Value):
+        """Helper: removes the key from the value index (if any) after the item has been removed. For subclasses which
+        don't remove items through jdict._discard."""
+        state = self._state
+        if state is not None and state.groups is not None:
+            state.groups.remove(key, value)
+
+    def _regroup_all(self, items: List[KeyValuePair]):
+        """Helper: rebuilds the value index (if any) from the list of all the (key, value)-pairs, e.g. after the items
+        have been reordered"""
+        state = self._state
+        if state is not None and state.groups is not None:
+            state.groups = ValueIndex(items, state.groups.projection)
+
+    def _cached_index(self, key: Key) -> Optional[int]:
+        """Helper: the index of the key if it can be found without scanning, otherwise None"""
+        state = self._state
+        if state is None:
+            return None
+        if state.index is not None:
+            return state.index.index_of(key)
+        keys = state.keys
+        if state.flags & _KEYS_VALID and keys:
+            if keys[-1] == key:
+                return len(keys) - 1
+            if keys[0] == key:
+                return 0
+        return None
+
+    def _patch_set(self, key: Key, value: Value, new: bool):
+        """Updates the cached lists in place after the key has been set to the value"""
+        state = self._state
+        if state is None or not state.flags:
+            return
+        flags = state.flags
+        if new:
+            if flags & _KEYS_VALID:
+                state.keys.append(key)
+            if flags & _VALUES_VALID:
+                state.values.append(value)
+            if flags & _ITEMS_VALID:
+                state.items.append((key, value))
+        elif flags & (_VALUES_VALID | _ITEMS_VALID):
+            idx = self._cached_index(key)
+            if idx is None:
+                state.flags = flags & _KEYS_VALID
+            else:
+                if flags & _VALUES_VALID:
+                    state.values[idx] = value
+                if flags & _ITEMS_VALID:
+                    state.items[idx] = (key, value)
+
+    def _patch_removed(self, idx: Optional[int]):
+        """Updates the cached lists in place after the item at the index has been removed"""
+        if idx is None:
+            self._invalidate()
+            return
+        state = self._state
+        if state is None:
+            return
+        flags = state.flags
+        if flags & _KEYS_VALID:
+            del state.keys[idx]
+        if flags & _VALUES_VALID:
+            del state.values[idx]
+        if flags & _ITEMS_VALID:
+            del state.items[idx]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self.data[key]
+        except KeyError:
+            if not isinstance(key, slice) and hasattr(self.__class__, "__missing__"):
+                return self.__class__.__missing__(self, key)
+            return self._slice_or_raise(key)
+        except TypeError:
+            # Slices are only hashable from Python 3.12
+            return self._slice_or_raise(key)
+
+    def _slice_or_raise(self, key: Key):
+        """Helper for __getitem__ when the key is not found: the items in the slice if the key is a slice (so that every
+        subclass supports j[start:stop:step]), otherwise re-raises the KeyError or TypeError being handled"""
+        if isinstance(key, slice):
+            return self.islice(key.start, key.stop, key.step)
+        raise
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self.data)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self.data
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+    def __or__(self, other):
+        if isinstance(other, (jdict, UserDict)):
+            return self.__class__(self.data | other.data)
+        if isinstance(other, dict):
+            return self.__class__(self.data | other)
+        return NotImplemented
+
+    def __ror__(self, other):
+        if isinstance(other, (jdict, UserDict)):
+            return self.__class__(other.data | self.data)
+        if isinstance(other, dict):
+            return self.__class__(other | self.data)
+        return NotImplemented
+
+    @classmethod
+    def fromkeys(cls, iterable, value=None):
+        result = cls()
+        for key in iterable:
+            result[key] = value
+        return result
 
     def __getattr__(self, key: Key):
         """Makes jdict.x equivalent to jdict['x']"""
+        if key in self.protected_keys:
+            # Not set yet (e.g. while unpickling), and looking it up as an item would recurse
+            raise AttributeError(key)
         try:
-            return self.data[key]
-        except KeyError as ke:
-            raise AttributeError(key) from ke
+            return self._attribute(key)
+        except KeyError:
+            pass
+        raise AttributeError(key)
+
+    def _attribute(self, key: Key) -> Value:
+        """Helper: the value of the attribute, which is the item at the key. Subclasses which override __getitem__ use
+        that instead (see __init_subclass__)."""
+        return self.data[key]
 
     def __setattr__(self, key: Key, value: Value):
         """Makes jdict.x = y equivalent to jdict['x'] = y"""
-        if self._key_is_protected(key):
-            return object.__setattr__(self, key, value)
+        if key in self.protected_keys:
+            object.__setattr__(self, key, value)
         else:
+            self._store(key, value)
+
+    def __setitem__(self, key: Key, value: Value):
+        # Same as self._store(key, value), which is too slow to call on every write when nothing is cached
+        if self._state is None:
             self.data[key] = value
-            self._invalidate()
+        else:
+            self._store(key, value)
+
+    def _setitem(self, key: Key, value: Value):
+        """__setitem__ for subclasses which override _store"""
+        self._store(key, value)
+
+    def __delitem__(self, key: Key):
+        self._discard(key)
 
     def __add__(self, other):
         return {**self.data, **other.data}
 
     def __iadd__(self, other):
         for key, value in other.data.items():
-            self.data[key] = value
+            self._store(key, value)
         return self
 
+    def __ior__(self, other):
+        items = other.data.items() if isinstance(other, (jdict, UserDict)) else other.items()
+        for key, value in items:
+            self._store(key, value)
+        return self
+
+    def clear(self):
+        """Removes all items"""
+        self._unshare()
+        self.data.clear()
+        if self._state is not None and self._state.index is not None:
+            self._state.index.clear()
+        self._cleanse()
+        self._invalidate()
+
+    def copy(self):
+        """a shallow copy which does not share any housekeeping state with the original"""
+        copied = self.__class__(self.data.copy())
+        state = self._state
+        if state is not None:
+            if state.encoder is not None:
+                copied.set_json_encoder(state.encoder)
+            if state.index is not None:
+                copied.enable_position_index()
+            if state.groups is not None:
+                copied.enable_value_index(state.groups.projection)
+        return copied
+
+    __copy__ = copy
+
     @property
     def list(self) -> List[KeyValuePair]:
         """a list of the items ((key, value)-pairs)"""
-        if not self._itemsvalid:
-            self._items = list(self.data.items())
-            self._itemsvalid = True
-        return self._items
+        state = self._housekeeping()
+        if not state.flags & _ITEMS_VALID:
+            state.items = list(self.data.items())
+            state.flags |= _ITEMS_VALID
+        return state.items
 
     @property
     def key_list(self) -> List[Key]:
         """a list of the keys"""
-        if not self._keysvalid:
-            self._keys = list(self.data)
-            self._keysvalid = True
-        return self._keys
+        state = self._housekeeping()
+        if not state.flags & _KEYS_VALID:
+            state.keys = list(self.data)
+            state.flags |= _KEYS_VALID
+        return state.keys
 
     @property
     def value_list(self) -> List[Value]:
         """a list of the values"""
-        if not self._valuesvalid:
-            self._values = list(self.data.values())
-            self._valuesvalid = True
-        return self._values
+        state = self._housekeeping()
+        if not state.flags & _VALUES_VALID:
+            state.values = list(self.data.values())
+            state.flags |= _VALUES_VALID
+        return state.values
 
     @property
     def first(self) -> KeyValuePair:
@@ -199,15 +564,102 @@ class jdict(UserDict):
 
     @property
     def json(self) -> str:
-        """a JSON representation"""
-        return json.dumps(self.data)
+        """a JSON representation (cached until the jdict is modified)
+
+        After the first modification, the encoded (key, value)-pairs are cached as well, so that only the items that
+        have changed since the last access are encoded again."""
+        state = self._housekeeping()
+        if state.json is None:
+            encoder = state.encoder or _default_encoder
+            if state.fragments is None or encoder.indent is not None or encoder.sort_keys:
+                state.json = encoder.encode(self.data)
+                state.fragments = {}
+            else:
+                state.json = "{" + encoder.item_separator.join(self._json_fragments(encoder)) + "}"
+        return state.json
+
+    def _json_fragments(self, encoder: "json.JSONEncoder") -> List[str]:
+        """Helper: the encoded (key, value)-pairs, using the cached ones where possible"""
+        fragments = self._state.fragments
+        separator = encoder.key_separator
+        result = []
+        for key, value in self.data.items():
+            fragment = fragments.get(key)
+            if fragment is None:
+                if isinstance(key, str):
+                    fragment = encoder.encode(key) + separator + encoder.encode(value)
+                else:
+                    # Let the encoder convert the key the same way as in encode(self.data)
+                    fragment = encoder.encode({key: value})[1:-1]
+                fragments[key] = fragment
+            if fragment:
+                # Empty if the encoder skipped the key (skipkeys)
+                result.append(fragment)
+        return result
+
+    @staticmethod
+    def iter_json_stream(fp, chunk_size: int = 65536) -> Iterator[KeyValuePair]:
+        """Parses the JSON object in the file-like object fp (text or binary) incrementally, reading chunk_size
+        characters at a time, and yields the (key, value)-pairs in order as soon as each has been parsed"""
+        return iter_object_items(fp, chunk_size)
+
+    @classmethod
+    def from_json_stream(cls, fp, key_func=_always, value_func=_always, chunk_size: int = 65536):
+        """a jdict with the JSON object in the file-like object fp, which is parsed incrementally so that the whole
+        document is never held in memory. Items where the key doesn't fulfill key_func or the value doesn't fulfill
+        value_func are dropped while loading."""
+        return cls(
+            {
+                key: value
+                for key, value in iter_object_items(fp, chunk_size)
+                if key_func(key) and value_func(value)
+            }
+        )
+
+    def set_json_encoder(self, encoder: Optional["json.JSONEncoder"]):
+        """Uses the encoder (a json.JSONEncoder or similar) for json, iter_json and dump_json, or the default if None"""
+        state = self._housekeeping()
+        state.encoder = encoder
+        state.fragments = None
+        self._drop_derived()
+        return self
+
+    def iter_json(self) -> Iterator[str]:
+        """Yields the JSON representation in chunks, without building all of it in memory (unless it is cached)"""
+        state = self._state
+        if state is not None and state.json is not None:
+            yield state.json
+        else:
+            yield from self._json_encoder().iterencode(self.data)
+
+    def _json_encoder(self) -> "json.JSONEncoder":
+        """Helper: the encoder set with set_json_encoder, or the default one"""
+        state = self._state
+        return (state.encoder if state is not None else None) or _default_encoder
+
+    def dump_json(self, fp, chunk_size: int = 65536):
+        """Writes the JSON representation to the file-like object fp, in chunks of about chunk_size characters"""
+        chunks = []
+        size = 0
+        for chunk in self.iter_json():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= chunk_size:
+                fp.write("".join(chunks))
+                chunks.clear()
+                size = 0
+        if chunks:
+            fp.write("".join(chunks))
 
     @property
     def series(self):
-        """a pandas Series representation"""
-        import pandas as pd
+        """a pandas Series representation (cached until the jdict is modified, so don't modify it)"""
+        state = self._housekeeping()
+        if state.series is None:
+            import pandas as pd
 
-        return pd.Series(index=self.key_list, data=self.value_list)
+            state.series = pd.Series(index=self.key_list, data=self.value_list)
+        return state.series
 
     @property
     def datacol(self):
@@ -223,8 +675,68 @@ class jdict(UserDict):
 
         return pd.DataFrame(index=[0], data=self.data)
 
+    @classmethod
+    def frame(cls, records, columns: Optional[List[Key]] = None, arrow: bool = False):
+        """a pandas DataFrame (or a pyarrow Table if arrow is True) with one row per record
+
+        The records (jdicts or dicts) must all have the same keys, which become the columns. The values are collected
+        column by column in a single pass over the records, which is much faster than concatenating datarows."""
+        records = iter(records)
+        if columns is None:
+            first = next(records, None)
+            columns = [] if first is None else list(first)
+            if first is not None:
+                records = chain([first], records)
+        columns = list(columns)
+        values = [[] for _ in columns]
+        appends = [column_values.append for column_values in values]
+        for row, record in enumerate(records):
+            data = record.data if isinstance(record, (jdict, UserDict)) else record
+            if len(data) != len(columns):
+                raise ValueError(f"record {row} has keys {list(data)}, expected {columns}")
+            try:
+                for append, column in zip(appends, columns):
+                    append(data[column])
+            except KeyError as ke:
+                raise ValueError(f"record {row} has keys {list(data)}, expected {columns}") from ke
+
+        if arrow:
+            import pyarrow as pa
+
+            return pa.table(dict(zip(map(str, columns), values)))
+
+        import pandas as pd
+
+        return pd.DataFrame(dict(zip(columns, values)), columns=columns)
+
+    def enable_position_index(self):
+        """Maintains an order-statistic index of the keys, making at, key_at, value_at and index_of O(log n)"""
+        state = self._housekeeping()
+        if state.index is None:
+            state.index = OrderIndex(self.data)
+        return self
+
+    def disable_position_index(self):
+        """Drops the order-statistic index"""
+        if self._state is not None:
+            self._state.index = None
+        return self
+
+    @property
+    def has_position_index(self) -> bool:
+        """whether the order-statistic index is maintained"""
+        return self._state is not None and self._state.index is not None
+
     def at(self, idx: int) -> KeyValuePair:
         """the item at the index"""
+        state = self._state
+        if state is not None:
+            if state.index is not None:
+                key = state.index.at(idx)
+                return key, self.data[key]
+            if state.flags & _KEYS_VALID and 0 <= idx < len(state.keys):
+                key = state.keys[idx]
+                return key, self.data[key]
         return self._at(idx, self.enum)
 
     def key_at(self, idx: int) -> Key:
@@ -235,13 +747,84 @@ class jdict(UserDict):
         """the value at the index"""
         return self.at(idx)[1]
 
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        if self.has_position_index:
+            return self._state.index.index_of(key)
+        if key not in self.data:
+            raise KeyError(key)
+        for idx, _key in self.enum_keys:
+            if _key == key:
+                return idx
+
+    def enable_value_index(self, projection=None):
+        """Maintains an index from each value (or projection(value), if given) to the keys that have it, making
+        keys_of and count_of O(1) (plus the number of keys found) and group_by O(n) without a scan. The values (or
+        their projections) must be hashable."""
+        state = self._housekeeping()
+        if state.groups is None or state.groups.projection is not projection:
+            state.groups = ValueIndex(self.data.items(), projection)
+        return self
+
+    def disable_value_index(self):
+        """Drops the value index"""
+        if self._state is not None:
+            self._state.groups = None
+        return self
+
+    @property
+    def has_value_index(self) -> bool:
+        """whether the value index is maintained"""
+        return self._state is not None and self._state.groups is not None
+
+    def keys_of(self, value: Value) -> List[Key]:
+        """a list of the keys which have the value (or whose values have it as their projection, see
+        enable_value_index). Scans all the items if there is no value index."""
+        if self.has_value_index:
+            return self._state.groups.keys_of(value)
+        return [key for key, _value in self.data.items() if _value == value]
+
+    def count_of(self, value: Value) -> int:
+        """the number of keys which have the value (see keys_of)"""
+        if self.has_value_index:
+            return self._state.groups.count_of(value)
+        return sum(1 for _value in self.data.values() if _value == value)
+
+    def group_by(self) -> "jdict":
+        """a jdict from each value (or projection, see enable_value_index) to a list of the keys which have it
+
+        Without a value index, the groups and their keys are in the order of the items. With the index, the groups are
+        in the order they were first created and the keys in the order they got the value, which is the same unless
+        keys have been given new values."""
+        if self.has_value_index:
+            return jdict(self._state.groups.groups())
+        groups = {}
+        for key, value in self.data.items():
+            group = groups.get(value)
+            if group is None:
+                group = groups[value] = []
+            group.append(key)
+        return jdict(groups)
+
+    def islice(self, start: Optional[int] = None, stop: Optional[int] = None, step: Optional[int] = None):
+        """a PositionView of the items at the positions in the slice (like j[start:stop:step], without copying)"""
+        return PositionView(self, range(*slice(start, stop, step).indices(len(self))))
+
+    def items_at(self, positions: Iterable[int]):
+        """a PositionView of the items at the positions (without copying)"""
+        return PositionView(self, positions if isinstance(positions, (range, list, tuple)) else list(positions))
+
+    def values_at(self, positions: Iterable[int]):
+        """a PositionView of the values at the positions (without copying)"""
+        return PositionView(self, positions if isinstance(positions, (range, list, tuple)) else list(positions), True)
+
     def pop_first(self) -> KeyValuePair:
         """Pops the first (key, value)-pair and returns it"""
-        return self._pop(self.first_key)
+        return self._pop(self.first_key, 0)
 
     def pop_last(self) -> KeyValuePair:
         """Pops the last (key, value)-pair and returns it"""
-        return self._pop(self.last_key)
+        return self._pop(self.last_key, -1)
 
     def pop_first_key(self) -> Key:
         """Pops the first (key, value)-pair and returns the key"""
@@ -259,8 +842,100 @@ class jdict(UserDict):
         """Pops the last (key, value)-pair and returns the key"""
         return self.pop_last()[1]
 
-    def mapping(self, key_func=lambda x: x, value_func=lambda x: x):
-        """Maps the keys by key_func and the values by value_func"""
+    def top_k(self, k: int, by: str = "value", key=None) -> "jdict":
+        """a jdict with the k items with the largest values (or keys if by is "key"), largest first. If key is given,
+        the items are compared by key(value) (or key(key)). Uses a heap, so it is O(n log k) rather than a full sort."""
+        return jdict(dict(heapq.nlargest(k, self.data.items(), key=_item_key(by, key))))
+
+    def bottom_k(self, k: int, by: str = "value", key=None) -> "jdict":
+        """a jdict with the k items with the smallest values (or keys if by is "key"), smallest first (see top_k)"""
+        return jdict(dict(heapq.nsmallest(k, self.data.items(), key=_item_key(by, key))))
+
+    def sort_by_key(self, key=None, reverse: bool = False):
+        """Sorts the items by their keys (or by key(key) if key is given) in place"""
+        self._reorder(sorted(self.data.items(), key=_item_key("key", key), reverse=reverse))
+
+    def sort_by_value(self, key=None, reverse: bool = False):
+        """Sorts the items by their values (or by key(value) if key is given) in place"""
+        self._reorder(sorted(self.data.items(), key=_item_key("value", key), reverse=reverse))
+
+    def insert_at(self, idx: int, key: Key, value: Value):
+        """Sets the item and moves it to the index (0 <= idx <= the number of other items). Inserting anywhere but at
+        the end rebuilds the dict, which is O(n); use a jordered to edit the order of large jdicts."""
+        new = key not in self
+        if not 0 <= idx <= len(self) - (0 if new else 1):
+            raise IndexError(idx)
+        # Stored first, so that subclasses can convert the value, evict items etc. as for any other write
+        self._store(key, value)
+        data = self.data
+        if new and idx == len(data) - 1:
+            return
+        items = [item for item in data.items() if item[0] != key]
+        items.insert(min(idx, len(items)), (key, data[key]))
+        self._reorder(items)
+
+    def move_to(self, key: Key, idx: int):
+        """Moves the item at the key to the index"""
+        self.insert_at(idx, key, self[key])
+
+    def move_to_end(self, key: Key, last: bool = True):
+        """Moves the item at the key to the end (O(1)), or to the start if last is False (like OrderedDict)"""
+        if not last:
+            self.move_to(key, 0)
+        elif key not in self.data:
+            raise KeyError(key)
+        else:
+            self._store(key, self._discard(key))
+
+    def swap(self, i: int, j: int):
+        """Swaps the items at the indices i and j"""
+        items = list(self.data.items())
+        for idx in (i, j):
+            if not 0 <= idx < len(items):
+                raise IndexError(idx)
+        items[i], items[j] = items[j], items[i]
+        self._reorder(items)
+
+    def _reorder(self, items: List[KeyValuePair]):
+        """Helper: puts the items in the order of the list of all the (key, value)-pairs, which becomes the cached list
+        of items. The other cached lists and the position index are rebuilt once, instead of patched for every item."""
+        self._unshare()
+        data = self.data
+        data.clear()
+        data.update(items)
+        state = self._state
+        if state is None:
+            return
+        if state.index is not None:
+            state.index = OrderIndex(data)
+        self._regroup_all(items)
+        flags = state.flags
+        if flags & _KEYS_VALID:
+            state.keys = [key for key, _ in items]
+        if flags & _VALUES_VALID:
+            state.values = [value for _, value in items]
+        state.items = items
+        state.flags = flags | _ITEMS_VALID
+        self._drop_derived()
+
+    def _chunked(self, executor, chunksize: Optional[int], chunk_func, key_func, value_func):
+        """Helper: runs chunk_func over chunks of the items in the executor, keeping the order of the items"""
+        items = list(self.data.items())
+        if chunksize is None:
+            chunksize = max(1, -(-len(items) // (4 * (os.cpu_count() or 1))))
+        chunks = [items[start : start + chunksize] for start in range(0, len(items), chunksize)]
+        result = {}
+        for chunk in executor.map(chunk_func, repeat(key_func), repeat(value_func), chunks):
+            result.update(chunk)
+        return jdict(result)
+
+    def mapping(self, key_func=_identity, value_func=_identity, executor=None, chunksize: Optional[int] = None):
+        """Maps the keys by key_func and the values by value_func
+
+        If an executor (such as a ThreadPoolExecutor or ProcessPoolExecutor) is given, the items are mapped in chunks of
+        chunksize items in the executor. By default, there are about 4 chunks per CPU."""
+        if executor is not None:
+            return self._chunked(executor, chunksize, _map_chunk, key_func, value_func)
         return jdict(
             {key_func(key): value_func(value) for key, value in self.data.items()}
         )
@@ -269,16 +944,20 @@ class jdict(UserDict):
         """Maps the key-value pairs by item_func"""
         return jdict(dict(item_func(key, value) for key, value in self.data.items()))
 
-    def key_mapping(self, key_func=lambda x: x):
+    def key_mapping(self, key_func=_identity, executor=None, chunksize: Optional[int] = None):
         """Maps the keys by key_func"""
-        return self.mapping(key_func=key_func)
+        return self.mapping(key_func=key_func, executor=executor, chunksize=chunksize)
 
-    def value_mapping(self, value_func=lambda x: x):
+    def value_mapping(self, value_func=_identity, executor=None, chunksize: Optional[int] = None):
         """Maps the values by value_func"""
-        return self.mapping(value_func=value_func)
+        return self.mapping(value_func=value_func, executor=executor, chunksize=chunksize)
+
+    def select(self, key_func=_always, value_func=_always, executor=None, chunksize: Optional[int] = None):
+        """Filters out items where the key doesn't fulfill key_func or the value doesn't fulfill value_func
 
-    def select(self, key_func=lambda x: True, value_func=lambda x: True):
-        """Filters out items where the key doesn't fulfill key_func or the value doesn't fulfill value_func"""
+        If an executor is given, the items are filtered in chunks in the executor like in mapping."""
+        if executor is not None:
+            return self._chunked(executor, chunksize, _select_chunk, key_func, value_func)
         return jdict(
             {
                 key: value
@@ -297,10 +976,101 @@ class jdict(UserDict):
             }
         )
 
-    def key_select(self, key_func=lambda x: True):
+    def key_select(self, key_func=_always, executor=None, chunksize: Optional[int] = None):
         """Filters out items where the key doesn't fulfill key_func"""
-        return self.select(key_func=key_func)
+        return self.select(key_func=key_func, executor=executor, chunksize=chunksize)
 
-    def value_select(self, value_func=lambda x: True):
+    def value_select(self, value_func=_always, executor=None, chunksize: Optional[int] = None):
         """Filters out items where the value doesn't fulfill value_func"""
-        return self.select(value_func=value_func)
+        return self.select(value_func=value_func, executor=executor, chunksize=chunksize)
+
+    async def _async_run(self, item_func, limit: Optional[int]) -> list:
+        """Helper: awaits item_func(key, value) for every item with at most limit calls running at a time,
+        and returns the results in the order of the items"""
+        import asyncio
+
+        items = list(self.data.items())
+        results = [None] * len(items)
+        pending = iter(enumerate(items))
+
+        async def worker():
+            for idx, (key, value) in pending:
+                results[idx] = await item_func(key, value)
+
+        tasks = [asyncio.ensure_future(worker()) for _ in range(_worker_count(limit, len(items)))]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # If one of the calls raised, the other workers would otherwise go on with the remaining items
+            for task in tasks:
+                task.cancel()
+        return results
+
+    async def async_mapping(self, key_func=_identity, value_func=_identity, limit: Optional[int] = None):
+        """Maps the keys by key_func and the values by value_func, which may be async functions.
+        At most limit items are mapped concurrently (no limit by default)."""
+
+        async def map_item(key, value):
+            return await _resolve(key_func(key)), await _resolve(value_func(value))
+
+        return jdict(dict(await self._async_run(map_item, limit)))
+
+    async def async_value_mapping(self, value_func=_identity, limit: Optional[int] = None):
+        """Maps the values by value_func, which may be an async function"""
+        return await self.async_mapping(value_func=value_func, limit=limit)
+
+    async def async_select(self, key_func=_always, value_func=_always, limit: Optional[int] = None):
+        """Filters out items where the key doesn't fulfill key_func or the value doesn't fulfill value_func,
+        which may be async functions. At most limit items are checked concurrently (no limit by default)."""
+
+        async def check_item(key, value):
+            return await _resolve(key_func(key)) and await _resolve(value_func(value))
+
+        keep = await self._async_run(check_item, limit)
+        return jdict({key: value for (key, value), kept in zip(self.data.items(), keep) if kept})
+
+    async def async_iter_value_mapping(self, value_func=_identity, limit: Optional[int] = None):
+        """Maps the values by value_func, which may be an async function, and yields the (key, mapped value)-pairs
+        in the order they complete. At most limit items are mapped concurrently (no limit by default)."""
+        import asyncio
+
+        items = list(self.data.items())
+        done = asyncio.Queue()
+        pending = iter(items)
+
+        async def worker():
+            for key, value in pending:
+                try:
+                    done.put_nowait((key, await _resolve(value_func(value)), None))
+                except Exception as exc:
+                    done.put_nowait((key, None, exc))
+
+        tasks = [asyncio.ensure_future(worker()) for _ in range(_worker_count(limit, len(items)))]
+        try:
+            for _ in items:
+                key, value, exc = await done.get()
+                if exc is not None:
+                    raise exc
+                yield key, value
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def query(self) -> "Query":
+        """a lazy query over the items, for chaining selections and mappings without intermediate copies"""
+        return Query(self)
+
+
+from ._queue import jqueue  # noqa: E402 (needs jdict to be defined)
+from ._cache import CacheInfo, jcache  # noqa: E402
+from ._query import Query  # noqa: E402
+from ._array import jarray  # noqa: E402
+from ._file import jfile  # noqa: E402
+from ._shared import jshared  # noqa: E402
+from ._record import Schema, jrecord  # noqa: E402
+from ._tree import jtree  # noqa: E402
+from ._frozen import frozenjdict  # noqa: E402
+from ._concurrent import jconcurrent  # noqa: E402
+from ._sorted import jsorted  # noqa: E402
+from ._ordered import jordered  # noqa: E402
+from ._view import PositionView  # noqa: E402
@@ -0,0 +1,287 @@
+from typing import Dict, List, Optional
+
+from jdict import Key, KeyValuePair, Value, _always, _identity, jdict
+
+
+def _numpy():
+    """Helper: imports numpy when it is first needed, so that jdict does not depend on it"""
+    import numpy
+
+    return numpy
+
+
+class _KeyIndex:
+    """The keys of a jarray in order, with a map from each key to its position which is built when first needed.
+    Shared between jarrays with the same keys (such as the results of value_mapping) until one of them changes its keys.
+    """
+
+    __slots__ = ("keys", "_positions")
+
+    def __init__(self, keys: List[Key]):
+        self.keys = keys
+        self._positions = None  # type: Optional[Dict[Key, int]]
+
+    @property
+    def positions(self) -> Dict[Key, int]:
+        if self._positions is None:
+            self._positions = {key: pos for pos, key in enumerate(self.keys)}
+        return self._positions
+
+    def copy(self) -> "_KeyIndex":
+        copied = _KeyIndex(list(self.keys))
+        if self._positions is not None:
+            copied._positions = dict(self._positions)
+        return copied
+
+
+class jarray(jdict):
+    """Columnar jdict for numeric values
+
+    The keys are kept in a list and the values in a typed NumPy array, which is much more compact than boxed Python
+    numbers. value_list is a view of the array (not a copy), and value_func in mapping, value_mapping, select and
+    value_select is called once with the whole array, so it should be a ufunc or some other vectorized function.
+    The results of value_mapping share the keys with the original until either of them adds or removes a key.
+
+    The dtype is inferred from the initial values unless given, and values assigned later are cast to it. Access by key
+    or position is O(1); removing anything other than the last item is O(n). data is a dict built on each access.
+    The executor and chunksize arguments of mapping and select are ignored, since the work is vectorized."""
+
+    __slots__ = ("_keyindex", "_shared", "_buffer", "_size")
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, data=None, dtype=None, **kwargs):
+        np = _numpy()
+        if data is None:
+            data = kwargs
+        elif not isinstance(data, dict):
+            kwargs["data"] = data
+            data = kwargs
+        values = list(data.values())
+        self._state = None
+        self._keyindex = _KeyIndex(list(data))
+        self._shared = False
+        self._buffer = np.array(values, dtype=dtype if dtype is not None else (None if values else float))
+        self._size = len(values)
+
+    @classmethod
+    def _from_columns(cls, keys, values) -> "jarray":
+        """Helper: a jarray with the given keys (a list, or a _KeyIndex to share) and values (an array)"""
+        if isinstance(keys, list) and len(set(keys)) != len(keys):
+            return cls(dict(zip(keys, values.tolist())), dtype=values.dtype)
+        result = cls.__new__(cls)
+        object.__setattr__(result, "_state", None)
+        object.__setattr__(result, "_keyindex", keys if isinstance(keys, _KeyIndex) else _KeyIndex(keys))
+        object.__setattr__(result, "_shared", isinstance(keys, _KeyIndex))
+        object.__setattr__(result, "_buffer", values)
+        object.__setattr__(result, "_size", len(values))
+        return result
+
+    def __reduce__(self):
+        return self._from_columns, (list(self._keyindex.keys), self.value_list)
+
+    def _share_keys(self) -> _KeyIndex:
+        """Helper: the keys, marked as shared so that they are copied before they are changed"""
+        self._shared = True
+        return self._keyindex
+
+    def _own_keys(self) -> _KeyIndex:
+        """Helper: the keys, copied first if they are shared with another jarray"""
+        if self._shared:
+            self._keyindex = self._keyindex.copy()
+            self._shared = False
+        return self._keyindex
+
+    @property
+    def data(self) -> dict:
+        """a dict with the keys and values (as Python numbers)"""
+        return dict(zip(self._keyindex.keys, self.value_list.tolist()))
+
+    @property
+    def dtype(self):
+        """the dtype of the values"""
+        return self._buffer.dtype
+
+    def _store(self, key: Key, value: Value):
+        self._drop_derived(key)
+        # The value index is updated with the value as stored, after NumPy has cast it to the dtype
+        groups = self._state.groups if self._state is not None else None
+        pos = self._keyindex.positions.get(key)
+        if pos is not None:
+            old = self._buffer[pos].item()
+            self._buffer[pos] = value
+            if groups is not None:
+                groups.replace(key, old, self._buffer[pos].item())
+            return
+        keyindex = self._own_keys()
+        if self._size == len(self._buffer):
+            grown = _numpy().empty(max(8, 2 * self._size), dtype=self._buffer.dtype)
+            grown[: self._size] = self._buffer[: self._size]
+            self._buffer = grown
+        pos = self._size
+        self._buffer[pos] = value
+        keyindex.positions[key] = pos
+        keyindex.keys.append(key)
+        self._size += 1
+        if groups is not None:
+            groups.add(key, self._buffer[pos].item())
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        self._drop_derived(key)
+        keyindex = self._own_keys()
+        positions = keyindex.positions
+        pos = positions[key]
+        value = self._buffer[pos].item()
+        self._ungroup(key, value)
+        del positions[key]
+        last = self._size - 1
+        if pos != last:
+            self._buffer[pos:last] = self._buffer[pos + 1 : self._size]
+            for moved in keyindex.keys[pos + 1 :]:
+                positions[moved] -= 1
+        del keyindex.keys[pos]
+        self._size = last
+        return value
+
+    def _reorder(self, items: List[KeyValuePair]):
+        self._keyindex = _KeyIndex([key for key, _ in items])
+        self._shared = False
+        self._buffer = _numpy().array([value for _, value in items], dtype=self.dtype)
+        self._size = len(items)
+        self._regroup_all(items)
+        self._invalidate()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        return iter(self._keyindex.keys)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._keyindex.positions
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self._buffer[self._keyindex.positions[key]].item()
+        except (KeyError, TypeError):
+            return self._slice_or_raise(key)
+
+    def __repr__(self) -> str:
+        return repr(self.data)
+
+    def clear(self):
+        self._keyindex = _KeyIndex([])
+        self._shared = False
+        self._buffer = _numpy().empty(0, dtype=self.dtype)
+        self._size = 0
+        self._cleanse()
+        self._invalidate()
+
+    def copy(self):
+        """a copy which does not share any values with the original"""
+        return self._from_columns(self._share_keys(), self.value_list.copy())
+
+    __copy__ = copy
+
+    def enable_position_index(self):
+        """Does nothing: positional access is always O(1) for jarray"""
+        return self
+
+    @property
+    def has_position_index(self) -> bool:
+        """whether positional access is O(1)"""
+        return True
+
+    @property
+    def list(self) -> List[KeyValuePair]:
+        """a list of the items ((key, value)-pairs)"""
+        return list(zip(self._keyindex.keys, self.value_list.tolist()))
+
+    @property
+    def key_list(self) -> List[Key]:
+        """a list of the keys"""
+        return self._keyindex.keys
+
+    @property
+    def value_list(self):
+        """the values as a NumPy array (a view, not a copy)"""
+        return self._buffer[: self._size]
+
+    @property
+    def first(self) -> KeyValuePair:
+        """the first item ((key, value)-pair)"""
+        return self.at(0) if self._size else None
+
+    @property
+    def first_key(self) -> Key:
+        """the first key"""
+        return self._keyindex.keys[0] if self._size else None
+
+    @property
+    def first_value(self) -> Value:
+        """the first value"""
+        return self._buffer[0].item() if self._size else None
+
+    @property
+    def last(self) -> KeyValuePair:
+        """the last item ((key, value)-pair)"""
+        return self.at(self._size - 1) if self._size else None
+
+    @property
+    def last_key(self) -> Key:
+        """the last key"""
+        return self._keyindex.keys[-1] if self._size else None
+
+    @property
+    def last_value(self) -> Value:
+        """the last value"""
+        return self._buffer[self._size - 1].item() if self._size else None
+
+    @property
+    def enum(self):
+        """(idx, key, value)-tuples"""
+        return zip(self.range, self._keyindex.keys, self.value_list.tolist())
+
+    @property
+    def enum_keys(self):
+        """(idx, key)-pairs"""
+        return enumerate(self._keyindex.keys)
+
+    @property
+    def enum_values(self):
+        """(idx, value)-pairs"""
+        return enumerate(self.value_list.tolist())
+
+    def at(self, idx: int) -> KeyValuePair:
+        """the item at the index"""
+        if not 0 <= idx < self._size:
+            raise IndexError(idx)
+        return self._keyindex.keys[idx], self._buffer[idx].item()
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        return self._keyindex.positions[key]
+
+    def mapping(self, key_func=_identity, value_func=_identity, executor=None, chunksize: Optional[int] = None):
+        """Maps the keys by key_func and the values by value_func (called once with the whole array)"""
+        np = _numpy()
+        if key_func is _identity:
+            keys = self._share_keys()
+        else:
+            keys = [key_func(key) for key in self._keyindex.keys]
+        values = np.asarray(value_func(self.value_list))
+        if np.may_share_memory(values, self._buffer):
+            values = values.copy()
+        return self._from_columns(keys, values)
+
+    def select(self, key_func=_always, value_func=_always, executor=None, chunksize: Optional[int] = None):
+        """Filters out items where the key doesn't fulfill key_func or the value doesn't fulfill value_func
+        (called once with the whole array, returning a boolean array)"""
+        np = _numpy()
+        keys = self._keyindex.keys
+        mask = np.ones(self._size, dtype=bool)
+        if value_func is not _always:
+            mask &= np.asarray(value_func(self.value_list), dtype=bool)
+        if key_func is not _always:
+            mask &= np.fromiter((key_func(key) for key in keys), dtype=bool, count=self._size)
+        selected = [key for key, keep in zip(keys, mask.tolist()) if keep]
+        return self._from_columns(selected, self.value_list[mask])
@@ -0,0 +1,187 @@
+from collections import OrderedDict, UserDict, namedtuple
+import time
+from typing import Callable, Dict, Optional
+
+from jdict import Key, Value, jdict
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"])
+
+
+class jcache(jdict):
+    """jdict bounded to maxsize items, for use as a cache
+
+    When the cache is full, the first item is evicted. With the "lru" policy, reading or writing an item moves it to
+    the end, so the least recently used item is evicted; with the "fifo" policy the order is the insertion order.
+    Items older than ttl seconds (if given) are treated as missing by lookups (cache[key], get, attribute access and
+    `in`), which drop them. Only lookups check the ttl: until an expired item is looked up or expire() is called, it is
+    still counted by len() and included by iteration, items(), key_list, first, == and the like. Only lookups count as
+    uses (hits or misses, and moving the item to the end). on_evict(key, value) is called for every item that is
+    evicted or expires."""
+
+    __slots__ = (
+        "maxsize",
+        "policy",
+        "ttl",
+        "on_evict",
+        "hits",
+        "misses",
+        "evictions",
+        "_expires",
+        "_timer",
+    )
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    policies = ("lru", "fifo")
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        policy: str = "lru",
+        ttl: Optional[float] = None,
+        on_evict: Optional[Callable[[Key, Value], None]] = None,
+        data=None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if policy not in self.policies:
+            raise ValueError(f"policy must be one of {self.policies}, not {policy!r}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        super().__init__(OrderedDict())
+        self.maxsize = maxsize
+        self.policy = policy
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._expires = {}  # type: Dict[Key, float]
+        self._timer = timer
+
+        if data is not None:
+            for key, value in dict(data).items():
+                self._store(key, value)
+
+    def _expired(self, key: Key) -> bool:
+        """Helper: whether the item at the key has outlived the ttl"""
+        return self.ttl is not None and self._expires[key] <= self._timer()
+
+    def _evict(self, key: Key):
+        """Helper: removes the item at the key and reports it to on_evict"""
+        value = self._discard(key)
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value)
+
+    def _touch(self, key: Key):
+        """Helper: moves the key to the end (most recently used)"""
+        if self.policy == "lru" and next(reversed(self.data)) != key:
+            self._unshare()
+            self.data.move_to_end(key)
+            if self.has_position_index:
+                self._state.index.remove(key)
+                self._state.index.append(key)
+            self._invalidate()
+
+    def _lookup(self, key: Key) -> Value:
+        """Helper: the value at the key, counting the hit or miss"""
+        try:
+            value = self.data[key]
+        except KeyError:
+            self.misses += 1
+            raise
+        if self._expired(key):
+            self._evict(key)
+            self.misses += 1
+            raise KeyError(key)
+        self.hits += 1
+        self._touch(key)
+        return value
+
+    def _store(self, key: Key, value: Value):
+        new = key not in self.data
+        super()._store(key, value)
+        if self.ttl is not None:
+            self._expires[key] = self._timer() + self.ttl
+        if not new:
+            self._touch(key)
+        while len(self.data) > self.maxsize:
+            self._evict(self.first_key)
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        self._expires.pop(key, None)
+        return super()._discard(key, idx)
+
+    def __getitem__(self, key: Key) -> Value:
+        if isinstance(key, slice):
+            # Checked first, so that slices (hashable from Python 3.12) aren't counted as misses
+            return self._slice_or_raise(key)
+        return self._lookup(key)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self.data and not self._expired(key)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.data))
+
+    def items(self):
+        """the items (read without counting them as uses)"""
+        return dict(self.data).items()
+
+    def values(self):
+        """the values (read without counting them as uses)"""
+        return dict(self.data).values()
+
+    def __or__(self, other):
+        """a copy with the same settings (and fresh counters), updated with the items of the other mapping"""
+        if not isinstance(other, (jdict, UserDict, dict)):
+            return NotImplemented
+        return self._merged(self, other)
+
+    def __ror__(self, other):
+        """a jcache with the same settings with the items of the other mapping, updated with the items"""
+        if not isinstance(other, (jdict, UserDict, dict)):
+            return NotImplemented
+        return self._merged(other, self)
+
+    def _merged(self, first, second) -> "jcache":
+        """Helper: an empty jcache with the same settings, to which the items of first and then second are written (so
+        they all get a fresh ttl). Items which don't fit are evicted without calling on_evict, since they are still in
+        the original."""
+        merged = self._like()
+        merged.on_evict = None
+        merged |= first
+        merged |= second
+        merged.on_evict = self.on_evict
+        merged.evictions = 0
+        return merged
+
+    def _like(self) -> "jcache":
+        """Helper: an empty jcache with the same settings"""
+        return self.__class__(self.maxsize, self.policy, self.ttl, self.on_evict, timer=self._timer)
+
+    def clear(self):
+        super().clear()
+        self._expires.clear()
+
+    def copy(self):
+        """a shallow copy with the same settings, but fresh counters"""
+        copied = self._like()
+        copied.data.update(self.data)
+        copied._expires.update(self._expires)
+        return copied
+
+    __copy__ = copy
+
+    def expire(self) -> int:
+        """Evicts all expired items and returns how many there were"""
+        if self.ttl is None:
+            return 0
+        expired = [key for key in self.data if self._expired(key)]
+        for key in expired:
+            self._evict(key)
+        return len(expired)
+
+    def cache_info(self) -> CacheInfo:
+        """hit, miss and eviction counters along with the maximum and current size"""
+        return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self.data))
@@ -0,0 +1,283 @@
+from contextlib import contextmanager
+import json
+import threading
+from types import MappingProxyType
+from typing import Iterator, Optional
+
+from jdict import Key, KeyValuePair, Value, frozenjdict, jdict
+
+_MISSING = object()
+
+# Reading methods and properties which jconcurrent forwards to the current version
+_READS = (
+    "list",
+    "key_list",
+    "value_list",
+    "first",
+    "first_key",
+    "first_value",
+    "last",
+    "last_key",
+    "last_value",
+    "any",
+    "any_key",
+    "any_value",
+    "range",
+    "enum",
+    "enum_keys",
+    "enum_values",
+    "json",
+    "iter_json",
+    "dump_json",
+    "series",
+    "datacol",
+    "datarow",
+    "at",
+    "key_at",
+    "value_at",
+    "index_of",
+    "islice",
+    "items_at",
+    "values_at",
+    "top_k",
+    "bottom_k",
+    "keys_of",
+    "count_of",
+    "group_by",
+    "mapping",
+    "item_mapping",
+    "key_mapping",
+    "value_mapping",
+    "select",
+    "item_select",
+    "key_select",
+    "value_select",
+    "async_mapping",
+    "async_value_mapping",
+    "async_select",
+    "async_iter_value_mapping",
+    "query",
+)
+
+
+def _read_from_version(name: str) -> property:
+    """Helper: a property which gets the attribute from the current version, so that it sees a single version"""
+    return property(lambda self: getattr(self._version, name), doc=getattr(jdict, name).__doc__)
+
+
+class jconcurrent(jdict):
+    """Thread-safe jdict where readers never take a lock
+
+    The items are published as a series of immutable versions (frozenjdicts). Writers take a lock, copy the current
+    version, modify the copy and publish it as the new version. Readers only read the current version, so each read
+    (such as key_list, last, at or json) sees one consistent version, and the cached lists of a version never change
+    once they have been built. Use snapshot() to get the current version for several reads in a row.
+
+    Every write copies all the items, so batch several writes with `with j.batch() as draft:`, or with update."""
+
+    __slots__ = ("_lock", "_version", "_encoder", "_projection")
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, data=None, **kwargs):
+        if data is None:
+            data = kwargs
+        elif not isinstance(data, dict):
+            kwargs["data"] = data
+            data = kwargs
+        self._state = None
+        self._lock = threading.Lock()
+        self._encoder = None
+        self._projection = _MISSING
+        self._version = frozenjdict._wrap(dict(data))
+
+    @property
+    def data(self):
+        """a read-only view of the items in the current version"""
+        return MappingProxyType(self._version.data)
+
+    @contextmanager
+    def batch(self) -> Iterator[jdict]:
+        """Holds the write lock and yields a jdict with a copy of the items. When the with block ends, the jdict is
+        published as the new version, unless the block raised an exception."""
+        with self._lock:
+            draft = jdict(self._version.data.copy())
+            yield draft
+            self._publish(draft.data)
+
+    def _publish(self, data: dict):
+        """Helper: makes the dict the current version (with the write lock held)"""
+        version = frozenjdict._wrap(data)
+        if self._encoder is not None:
+            version.set_json_encoder(self._encoder)
+        if self._projection is not _MISSING:
+            version.enable_value_index(self._projection)
+        self._version = version
+
+    def _store(self, key: Key, value: Value):
+        with self.batch() as draft:
+            draft[key] = value
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        with self.batch() as draft:
+            return draft._discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._publish({})
+
+    def update(self, *args, **kwargs):
+        """Updates the items like dict.update, publishing a single new version"""
+        with self.batch() as draft:
+            draft.update(*args, **kwargs)
+
+    def __iadd__(self, other):
+        self.update(other.data)
+        return self
+
+    def __ior__(self, other):
+        self.update(other.data if isinstance(other, jdict) else other)
+        return self
+
+    def pop(self, key: Key, default: Value = _MISSING) -> Value:
+        with self.batch() as draft:
+            if default is _MISSING:
+                return draft.pop(key)
+            return draft.pop(key, default)
+
+    def popitem(self) -> KeyValuePair:
+        with self.batch() as draft:
+            return draft.popitem()
+
+    def setdefault(self, key: Key, default: Value = None) -> Value:
+        with self.batch() as draft:
+            return draft.setdefault(key, default)
+
+    def pop_first(self) -> KeyValuePair:
+        """Pops the first (key, value)-pair and returns it"""
+        with self.batch() as draft:
+            return draft.pop_first()
+
+    def pop_last(self) -> KeyValuePair:
+        """Pops the last (key, value)-pair and returns it"""
+        with self.batch() as draft:
+            return draft.pop_last()
+
+    def sort_by_key(self, key=None, reverse: bool = False):
+        """Sorts the items by their keys (or by key(key) if key is given), publishing a single new version"""
+        with self.batch() as draft:
+            draft.sort_by_key(key, reverse)
+
+    def sort_by_value(self, key=None, reverse: bool = False):
+        """Sorts the items by their values (or by key(value) if key is given), publishing a single new version"""
+        with self.batch() as draft:
+            draft.sort_by_value(key, reverse)
+
+    def insert_at(self, idx: int, key: Key, value: Value):
+        """Sets the item and moves it to the index, publishing a single new version"""
+        with self.batch() as draft:
+            draft.insert_at(idx, key, value)
+
+    def move_to(self, key: Key, idx: int):
+        """Moves the item at the key to the index, publishing a single new version"""
+        with self.batch() as draft:
+            draft.move_to(key, idx)
+
+    def move_to_end(self, key: Key, last: bool = True):
+        """Moves the item at the key to the end (or the start if last is False), publishing a single new version"""
+        with self.batch() as draft:
+            draft.move_to_end(key, last)
+
+    def swap(self, i: int, j: int):
+        """Swaps the items at the indices i and j, publishing a single new version"""
+        with self.batch() as draft:
+            draft.swap(i, j)
+
+    def snapshot(self) -> frozenjdict:
+        """the current version (O(1))"""
+        return self._version
+
+    def copy(self):
+        """a jconcurrent which starts out with the current version (O(1))"""
+        copied = self.__class__()
+        copied._encoder = self._encoder
+        copied._projection = self._projection
+        copied._version = self._version
+        return copied
+
+    __copy__ = copy
+
+    def set_json_encoder(self, encoder: Optional[json.JSONEncoder]):
+        """Uses the encoder (a json.JSONEncoder or similar) for json, iter_json and dump_json, or the default if None"""
+        with self._lock:
+            self._encoder = encoder
+            self._publish(self._version.data)
+        return self
+
+    def enable_value_index(self, projection=None):
+        """Builds a value index (see jdict.enable_value_index) for each new version, which adds O(n) to every write"""
+        with self._lock:
+            self._projection = projection
+            self._publish(self._version.data)
+        return self
+
+    def disable_value_index(self):
+        """Stops building value indices"""
+        with self._lock:
+            self._projection = _MISSING
+            self._publish(self._version.data)
+        return self
+
+    @property
+    def has_value_index(self) -> bool:
+        """whether each version has a value index"""
+        return self._projection is not _MISSING
+
+    def enable_position_index(self):
+        """Does nothing: positional access is O(1) for each version once its key_list has been built"""
+        return self
+
+    def disable_position_index(self):
+        """Does nothing (see enable_position_index)"""
+        return self
+
+    @property
+    def has_position_index(self) -> bool:
+        """whether positional access is O(1) (once key_list has been built)"""
+        return True
+
+    def __len__(self) -> int:
+        return len(self._version.data)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._version.data)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._version.data
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self._version.data[key]
+        except (KeyError, TypeError):
+            return self._slice_or_raise(key)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, jconcurrent):
+            other = other._version
+        return self._version == other
+
+    def __repr__(self) -> str:
+        return f"jconcurrent({self._version.data!r})"
+
+    def keys(self):
+        return self._version.data.keys()
+
+    def values(self):
+        return self._version.data.values()
+
+    def items(self):
+        return self._version.data.items()
+
+
+for _name in _READS:
+    setattr(jconcurrent, _name, _read_from_version(_name))
+del _name
@@ -0,0 +1,353 @@
+import mmap
+import os
+import struct
+from typing import Iterator, Optional
+
+from jdict import Key, Value
+from jdict._storage import (
+    DELETED,
+    StoredJdict,
+    dump_key,
+    key_hash,
+    pack_record,
+    record_key,
+    record_key_bytes,
+    record_size,
+    record_value,
+    table_capacity,
+    table_find,
+)
+
+LOG_MAGIC = b"JDICTLOG"
+ORDER_MAGIC = b"JDICTORD"
+INDEX_MAGIC = b"JDICTIDX"
+
+# Order file header: magic, end of the log, first and last + 1 position in use, number of items, number of holes
+ORDER_HEADER = struct.Struct("<8s5Q")
+# Index file header: magic, capacity, slots in use (including deleted ones), deleted slots
+INDEX_HEADER = struct.Struct("<8s3Q")
+
+
+def _map(fp, size: int) -> mmap.mmap:
+    """Helper: grows the file to at least size bytes and maps all of it"""
+    if os.fstat(fp.fileno()).st_size < size:
+        fp.truncate(size)
+    return mmap.mmap(fp.fileno(), 0)
+
+
+class _FileTable:
+    """Ordered map of pickled keys and values in three memory-mapped files
+
+    * path: the log, where a record with the key and value is appended for every write
+    * path.ord: the log offset of the record of each key, in order (0 for removed keys), after a header
+    * path.idx: hash table from the hash of each pickled key to its position in path.ord, after a header"""
+
+    def __init__(self, path: str):
+        self.path = path
+        new = not os.path.exists(path)
+        mode = "w+b" if new else "r+b"
+        self.log_file = open(path, mode)
+        self.order_file = open(path + ".ord", mode)
+        self.index_file = open(path + ".idx", mode)
+        self.log = _map(self.log_file, 4096)
+        self.order_map = _map(self.order_file, 4096)
+        self.index_map = _map(self.index_file, INDEX_HEADER.size + 16 * table_capacity(0))
+        if new:
+            self.log[: len(LOG_MAGIC)] = LOG_MAGIC
+            self.log_end = len(LOG_MAGIC)
+            self.start = self.end = self.count = self.holes = 0
+            self.capacity = table_capacity(0)
+            self.used = self.deleted = 0
+            self._write_headers()
+        else:
+            magic, self.log_end, self.start, self.end, self.count, self.holes = ORDER_HEADER.unpack_from(
+                self.order_map
+            )
+            index_magic, self.capacity, self.used, self.deleted = INDEX_HEADER.unpack_from(self.index_map)
+            if self.log[: len(LOG_MAGIC)] != LOG_MAGIC or magic != ORDER_MAGIC or index_magic != INDEX_MAGIC:
+                self._close_files()
+                raise ValueError(f"{path} is not a jfile")
+        self._views()
+
+    def _views(self):
+        """Helper: creates the uint64 views of the order array and the hash table slots"""
+        self.order = memoryview(self.order_map)[ORDER_HEADER.size :].cast("Q")
+        self.slots = memoryview(self.index_map)[INDEX_HEADER.size :].cast("Q")
+
+    def _release(self):
+        """Helper: releases the views so that the maps can be closed"""
+        self.order.release()
+        self.slots.release()
+
+    def _write_headers(self):
+        """Helper: writes the counters to the file headers"""
+        ORDER_HEADER.pack_into(
+            self.order_map, 0, ORDER_MAGIC, self.log_end, self.start, self.end, self.count, self.holes
+        )
+        INDEX_HEADER.pack_into(self.index_map, 0, INDEX_MAGIC, self.capacity, self.used, self.deleted)
+
+    def _find(self, key: Key):
+        """Helper: the pickled key, its hash, its position (or None) and its hash table slot"""
+        key_bytes = dump_key(key)
+        hash_ = key_hash(key_bytes)
+        log = self.log
+        order = self.order
+        pos, slot = table_find(
+            self.slots, self.capacity, hash_, lambda pos: record_key_bytes(log, order[pos]) == key_bytes
+        )
+        return key_bytes, hash_, pos, slot
+
+    def _append_record(self, record: bytes) -> int:
+        """Helper: appends the record to the log and returns its offset"""
+        offset = self.log_end
+        if offset + len(record) > len(self.log):
+            size = max(2 * len(self.log), offset + len(record))
+            self.log.close()
+            self.log = _map(self.log_file, size)
+        self.log[offset : offset + len(record)] = record
+        self.log_end = offset + len(record)
+        return offset
+
+    def _remap(self, order_size: Optional[int] = None, index_size: Optional[int] = None):
+        """Helper: grows the order and/or index files"""
+        self._release()
+        if order_size is not None:
+            self.order_map.close()
+            self.order_map = _map(self.order_file, order_size)
+        if index_size is not None:
+            self.index_map.close()
+            self.index_map = _map(self.index_file, index_size)
+        self._views()
+
+    def _rehash(self, capacity: int):
+        """Helper: rebuilds the hash table with the capacity"""
+        self._remap(index_size=INDEX_HEADER.size + 16 * capacity)
+        slots = self.slots
+        for idx in range(2 * capacity):
+            slots[idx] = 0
+        self.capacity = capacity
+        self.used = self.deleted = 0
+        log = self.log
+        order = self.order
+        for pos in range(self.start, self.end):
+            offset = order[pos]
+            if offset:
+                hash_ = key_hash(record_key_bytes(log, offset))
+                _, slot = table_find(slots, capacity, hash_, lambda pos: False)
+                slots[2 * slot] = hash_
+                slots[2 * slot + 1] = pos + 1
+                self.used += 1
+
+    def positions(self) -> Iterator[int]:
+        """the positions in use, in order"""
+        order = self.order
+        for pos in range(self.start, self.end):
+            if order[pos]:
+                yield pos
+
+    def position_at(self, idx: int) -> int:
+        """the position of the idx'th key (O(1) unless keys have been removed from the middle)"""
+        if not 0 <= idx < self.count:
+            raise IndexError(idx)
+        if not self.holes:
+            return self.start + idx
+        for seen, pos in enumerate(self.positions()):
+            if seen == idx:
+                return pos
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        pos = self._find(key)[2]
+        if pos is None:
+            raise KeyError(key)
+        if not self.holes:
+            return pos - self.start
+        order = self.order
+        return sum(1 for before in range(self.start, pos) if order[before])
+
+    def key(self, pos: int) -> Key:
+        """the key at the position"""
+        return record_key(self.log, self.order[pos])
+
+    def value(self, pos: int) -> Value:
+        """the value at the position"""
+        return record_value(self.log, self.order[pos])
+
+    def get(self, key: Key) -> Value:
+        """the value at the key"""
+        pos = self._find(key)[2]
+        if pos is None:
+            raise KeyError(key)
+        return self.value(pos)
+
+    def __contains__(self, key: Key) -> bool:
+        return self._find(key)[2] is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def put(self, key: Key, value: Value):
+        """Sets the value at the key (keeping the position of an existing key)"""
+        key_bytes, hash_, pos, slot = self._find(key)
+        offset = self._append_record(pack_record(key_bytes, value))
+        if pos is None:
+            pos = self.end
+            if pos >= len(self.order):
+                self._remap(order_size=ORDER_HEADER.size + 8 * max(512, 2 * len(self.order)))
+            self.end += 1
+            self.count += 1
+            if self.slots[2 * slot + 1] == DELETED:
+                self.deleted -= 1
+            else:
+                self.used += 1
+            self.slots[2 * slot] = hash_
+            self.slots[2 * slot + 1] = pos + 1
+        self.order[pos] = offset
+        if 2 * self.used > self.capacity:
+            self._rehash(table_capacity(self.count))
+        self._write_headers()
+
+    def delete(self, key: Key) -> Value:
+        """Removes the key and returns the value"""
+        _, _, pos, slot = self._find(key)
+        if pos is None:
+            raise KeyError(key)
+        value = self.value(pos)
+        order = self.order
+        order[pos] = 0
+        self.slots[2 * slot + 1] = DELETED
+        self.deleted += 1
+        self.count -= 1
+        if pos == self.start:
+            while self.start < self.end and not order[self.start]:
+                self.start += 1
+            self.holes -= self.start - pos - 1
+        elif pos == self.end - 1:
+            while self.end > self.start and not order[self.end - 1]:
+                self.end -= 1
+            self.holes -= pos - self.end
+        else:
+            self.holes += 1
+        self._write_headers()
+        return value
+
+    def clear(self):
+        """Removes all the keys"""
+        self.log_end = len(LOG_MAGIC)
+        self.start = self.end = self.count = self.holes = 0
+        self._rehash(table_capacity(0))
+        self._write_headers()
+
+    def compact(self):
+        """Rewrites the files with only the records of the keys in use, and without holes"""
+        for suffix in ("", ".ord", ".idx"):
+            if os.path.exists(self.path + ".compact" + suffix):
+                os.remove(self.path + ".compact" + suffix)
+        tmp = _FileTable(self.path + ".compact")
+        try:
+            log = self.log
+            for pos in self.positions():
+                offset = self.order[pos]
+                size = record_size(log, offset)
+                tmp._append_record(log[offset : offset + size])
+                tmp.order_append(tmp.log_end - size)
+            tmp._rehash(table_capacity(tmp.count))
+            tmp._write_headers()
+        finally:
+            tmp.close()
+        self.close()
+        for suffix in ("", ".ord", ".idx"):
+            os.replace(self.path + ".compact" + suffix, self.path + suffix)
+        self.__init__(self.path)
+
+    def order_append(self, offset: int):
+        """Helper for compact: adds the offset at the end of the order array, without updating the hash table"""
+        if self.end >= len(self.order):
+            self._remap(order_size=ORDER_HEADER.size + 8 * max(512, 2 * len(self.order)))
+        self.order[self.end] = offset
+        self.end += 1
+        self.count += 1
+
+    def flush(self):
+        """Writes changes to disk"""
+        self._write_headers()
+        self.log.flush()
+        self.order_map.flush()
+        self.index_map.flush()
+
+    def close(self):
+        """Writes changes to disk and closes the files"""
+        if self.log_file.closed:
+            return
+        self.flush()
+        self._release()
+        self._close_files()
+
+    def _close_files(self):
+        """Helper: closes the maps and the files"""
+        for mapped in (self.log, self.order_map, self.index_map):
+            mapped.close()
+        for fp in (self.log_file, self.order_file, self.index_file):
+            fp.close()
+
+
+class jfile(StoredJdict):
+    """Persistent jdict kept in memory-mapped files, for ordered maps that are too large to keep in memory
+
+    The items are stored in an append-only log at path, with an array of record offsets in insertion order
+    (path.ord) and an on-disk hash index (path.idx) next to it. Opening an existing jfile only maps the files, and
+    values are unpickled when they are accessed. Keys and values must be picklable, and keys are identified by their
+    pickled representation (so e.g. 1 and 1.0 are different keys).
+
+    Lookups by key are O(1). Lookups by position are O(1) as long as no key has been removed from the middle (keys
+    removed with pop_first and pop_last are fine); otherwise they are O(n) until the next compact(). Overwritten and
+    removed items still take up space in the log until compact() rewrites the files.
+
+    data is a read-only view of the items, and list, key_list, value_list and json load all the items."""
+
+    __slots__ = ()
+
+    def __init__(self, path: str):
+        super().__init__(_FileTable(os.fspath(path)))
+
+    def close(self):
+        """Writes changes to disk and closes the files"""
+        self._table.close()
+
+    def flush(self):
+        """Writes changes to disk"""
+        self._table.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def compact(self):
+        """Rewrites the files without overwritten or removed items (which also makes positional access O(1) again)"""
+        self._table.compact()
+
+    @property
+    def path(self) -> str:
+        """the path to the log file"""
+        return self._table.path
+
+    def _store(self, key: Key, value: Value):
+        self._regroup(key, value)
+        self._table.put(key, value)
+        self._drop_derived(key)
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        value = self._table.delete(key)
+        self._ungroup(key, value)
+        self._drop_derived(key)
+        return value
+
+    def __repr__(self) -> str:
+        return f"jfile({self.path!r})"
+
+    def clear(self):
+        self._table.clear()
+        self._cleanse()
+        self._invalidate()
@@ -0,0 +1,63 @@
+from typing import List, Optional
+
+from jdict import Key, KeyValuePair, Value, jdict
+
+
+class frozenjdict(jdict):
+    """Immutable jdict, which is hashable if its values are
+
+    The hash is that of the frozenset of the items, so it agrees with ==, which doesn't depend on the order. It is
+    computed on first use and cached. Snapshots of jdicts are frozenjdicts, which makes them usable as cache keys and
+    safe to hand to other threads."""
+
+    __slots__ = ("_hash",)
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, data=None, **kwargs):
+        if isinstance(data, dict):
+            # Copied, so that modifying the caller's dict can't change this one (or make its hash stale)
+            data = dict(data)
+        super().__init__(data, **kwargs)
+        self._hash = None  # type: Optional[int]
+
+    @classmethod
+    def _wrap(cls, data: dict) -> "frozenjdict":
+        """Helper: a frozenjdict that shares the dict, which the caller must not modify afterwards"""
+        frozen = cls.__new__(cls)
+        jdict.__init__(frozen, data)
+        frozen._hash = None
+        return frozen
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self.data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"frozenjdict({self.data!r})"
+
+    def _store(self, key: Key, value: Value):
+        raise TypeError("frozenjdict is immutable")
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        raise TypeError("frozenjdict is immutable")
+
+    def clear(self):
+        raise TypeError("frozenjdict is immutable")
+
+    def _reorder(self, items: List[KeyValuePair]):
+        raise TypeError("frozenjdict is immutable")
+
+    def copy(self):
+        """the frozenjdict itself, since it can't be modified"""
+        return self
+
+    __copy__ = copy
+
+    def snapshot(self) -> "frozenjdict":
+        """the frozenjdict itself, since it can't be modified"""
+        return self
+
+    def thaw(self) -> jdict:
+        """a jdict with a copy of the items, which can be modified"""
+        return jdict(self.data.copy())
@@ -0,0 +1,63 @@
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+Key = Hashable
+
+
+class ValueIndex:
+    """Secondary index from each value (or projection of a value) to the keys which have it
+
+    The keys of each group are kept in a dict used as an ordered set, so adding and removing a key is O(1), and the
+    groups are in the order they were first created."""
+
+    __slots__ = ("projection", "_groups")
+
+    def __init__(self, items: Iterable[Tuple[Key, object]] = (), projection: Optional[Callable] = None):
+        self.projection = projection
+        self._groups = {}  # type: Dict[Hashable, Dict[Key, None]]
+        for key, value in items:
+            self.add(key, value)
+
+    def _project(self, value) -> Hashable:
+        """Helper: what the value is grouped by"""
+        return value if self.projection is None else self.projection(value)
+
+    def add(self, key: Key, value):
+        """Adds the key to the group of the value"""
+        group_value = self._project(value)
+        group = self._groups.get(group_value)
+        if group is None:
+            group = self._groups[group_value] = {}
+        group[key] = None
+
+    def remove(self, key: Key, value):
+        """Removes the key from the group of the value"""
+        group_value = self._project(value)
+        group = self._groups[group_value]
+        del group[key]
+        if not group:
+            del self._groups[group_value]
+
+    def replace(self, key: Key, old, new):
+        """Moves the key from the group of the old value to that of the new value (if they are different groups)"""
+        old_group = self._project(old)
+        new_group = self._project(new)
+        if old_group == new_group:
+            return
+        self.remove(key, old)
+        self.add(key, new)
+
+    def keys_of(self, group_value: Hashable) -> List[Key]:
+        """the keys in the group"""
+        return list(self._groups.get(group_value, ()))
+
+    def count_of(self, group_value: Hashable) -> int:
+        """the number of keys in the group"""
+        return len(self._groups.get(group_value, ()))
+
+    def groups(self) -> Dict[Hashable, List[Key]]:
+        """a dict from each group to its keys"""
+        return {group_value: list(group) for group_value, group in self._groups.items()}
+
+    def clear(self):
+        """Removes all the keys"""
+        self._groups.clear()
@@ -0,0 +1,115 @@
+import codecs
+import json
+from json.decoder import WHITESPACE, JSONDecodeError, scanstring
+from typing import Any, Callable, Iterator, Tuple
+
+_decoder = json.JSONDecoder()
+
+# Characters that may continue a number, so a number followed by one of them (or by nothing) might be incomplete
+_NUMBER_CHARS = frozenset("0123456789+-.eE")
+
+
+def _parse_key(buf: str, pos: int) -> Tuple[str, int]:
+    """Helper: parses the string at pos and returns it with the position after it"""
+    if buf[pos : pos + 1] != '"':
+        raise JSONDecodeError("Expecting property name enclosed in double quotes", buf, pos)
+    return scanstring(buf, pos + 1)
+
+
+class _Reader:
+    """Buffer over a text or binary file-like object, which is read in chunks as the parser runs out of input
+
+    Only the part of the input which hasn't been parsed yet is kept in the buffer."""
+
+    def __init__(self, fp, chunk_size: int):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.utf8 = None
+
+    def read(self) -> bool:
+        """Reads the next chunk into the buffer. Returns False at the end of the input."""
+        if self.eof:
+            return False
+        raw = self.fp.read(self.size)
+        if isinstance(raw, bytes):
+            if self.utf8 is None:
+                self.utf8 = codecs.getincrementaldecoder("utf-8")()
+            chunk = self.utf8.decode(raw, final=not raw)
+        else:
+            chunk = raw
+        if not raw:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+        # Read more at a time if a value spans several chunks, so that it isn't parsed over and over
+        self.size *= 2
+        return True
+
+    def char(self) -> str:
+        """Consumes and returns the next character that is not whitespace"""
+        while True:
+            pos = WHITESPACE.match(self.buf, self.pos).end()
+            if pos < len(self.buf):
+                self.pos = pos + 1
+                return self.buf[pos]
+            self.pos = pos
+            if not self.read():
+                raise JSONDecodeError("Unexpected end of input", self.buf, pos)
+
+    def expect(self, expected: str, message: str):
+        """Consumes the next character that is not whitespace, which must be the expected one"""
+        if self.char() != expected:
+            raise JSONDecodeError(message, self.buf, self.pos - 1)
+
+    def parse(self, parse_func: Callable[[str, int], Tuple[Any, int]]) -> Any:
+        """Consumes and returns the next token with parse_func, reading more input until it is complete"""
+        while True:
+            pos = WHITESPACE.match(self.buf, self.pos).end()
+            try:
+                result, end = parse_func(self.buf, pos)
+            except JSONDecodeError:
+                if not self.read():
+                    raise
+                continue
+            # A number at the end of the buffer might continue in the next chunk
+            if (end < len(self.buf) and self.buf[end] not in _NUMBER_CHARS) or not self.read():
+                self.pos = end
+                self.size = self.chunk_size
+                return result
+
+    def expect_end(self):
+        """Consumes the rest of the input, which must be whitespace"""
+        while True:
+            pos = WHITESPACE.match(self.buf, self.pos).end()
+            if pos < len(self.buf):
+                raise JSONDecodeError("Extra data", self.buf, pos)
+            self.pos = pos
+            if not self.read():
+                return
+
+
+def iter_object_items(fp, chunk_size: int = 65536) -> Iterator[Tuple[str, Any]]:
+    """Parses the JSON object in the file-like object fp (opened in text or binary mode) incrementally,
+    and yields its (key, value)-pairs in order"""
+    reader = _Reader(fp, chunk_size)
+    reader.expect("{", "Expecting '{'")
+    if reader.char() == "}":
+        reader.expect_end()
+        return
+    reader.pos -= 1
+    while True:
+        key = reader.parse(_parse_key)
+        reader.expect(":", "Expecting ':' delimiter")
+        value = reader.parse(_decoder.raw_decode)
+        yield key, value
+        separator = reader.char()
+        if separator == "}":
+            break
+        if separator != ",":
+            raise JSONDecodeError("Expecting ',' delimiter", reader.buf, reader.pos - 1)
+    reader.expect_end()
@@ -0,0 +1,135 @@
+from bisect import bisect_right
+from typing import Hashable, Iterable, Iterator, List
+
+Key = Hashable
+
+
+class OrderIndex:
+    """Order-statistic index over a sequence of keys
+
+    The keys are kept in a list of blocks of roughly `load` keys each, so that finding the key at a position,
+    finding the position of a key and removing a key cost O(log n + load) instead of O(n)."""
+
+    load = 512
+
+    __slots__ = ("_blocks", "_block_of", "_block_pos", "_starts", "_dirty", "_len")
+
+    def __init__(self, keys: Iterable[Key] = ()):
+        keys = list(keys)
+        load = self.load
+        self._blocks = [keys[i : i + load] for i in range(0, len(keys), load)] or [[]]
+        self._block_of = {key: block for block in self._blocks for key in block}
+        self._block_pos = {}
+        self._starts = []
+        self._dirty = 0
+        self._len = len(keys)
+        self._renumber(0)
+
+    def _renumber(self, start: int):
+        """Helper: updates the block number of every block from start and onwards"""
+        for pos in range(start, len(self._blocks)):
+            self._block_pos[id(self._blocks[pos])] = pos
+        self._dirty = min(self._dirty, start)
+
+    def _refresh(self):
+        """Helper: recalculates the stale part of the block start positions"""
+        dirty = min(self._dirty, len(self._blocks))
+        starts = self._starts
+        del starts[dirty:]
+        total = starts[-1] + len(self._blocks[dirty - 1]) if dirty else 0
+        for block in self._blocks[dirty:]:
+            starts.append(total)
+            total += len(block)
+        self._dirty = len(self._blocks)
+
+    def _split(self, pos: int):
+        """Helper: splits the block at pos in two"""
+        block = self._blocks[pos]
+        tail = block[self.load :]
+        del block[self.load :]
+        self._blocks.insert(pos + 1, tail)
+        for key in tail:
+            self._block_of[key] = tail
+        self._renumber(pos + 1)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Key]:
+        for block in self._blocks:
+            yield from block
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._block_of
+
+    def keys(self) -> List[Key]:
+        """the keys in order"""
+        return list(self)
+
+    def at(self, idx: int) -> Key:
+        """the key at the index"""
+        if not 0 <= idx < self._len:
+            raise IndexError(idx)
+        self._refresh()
+        pos = bisect_right(self._starts, idx) - 1
+        return self._blocks[pos][idx - self._starts[pos]]
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        block = self._block_of[key]
+        pos = self._block_pos[id(block)]
+        self._refresh()
+        return self._starts[pos] + block.index(key)
+
+    def append(self, key: Key):
+        """Adds the key at the end"""
+        block = self._blocks[-1]
+        block.append(key)
+        self._block_of[key] = block
+        self._len += 1
+        if len(block) > 2 * self.load:
+            self._split(len(self._blocks) - 1)
+
+    def insert(self, idx: int, key: Key):
+        """Inserts the key at the index"""
+        if not 0 <= idx <= self._len:
+            raise IndexError(idx)
+        if idx == self._len:
+            self.append(key)
+            return
+        self._refresh()
+        pos = bisect_right(self._starts, idx) - 1
+        block = self._blocks[pos]
+        block.insert(idx - self._starts[pos], key)
+        self._block_of[key] = block
+        self._len += 1
+        self._dirty = min(self._dirty, pos + 1)
+        if len(block) > 2 * self.load:
+            self._split(pos)
+
+    def swap(self, first: Key, second: Key):
+        """Swaps the positions of the two keys"""
+        first_block = self._block_of[first]
+        second_block = self._block_of[second]
+        first_pos = first_block.index(first)
+        second_pos = second_block.index(second)
+        first_block[first_pos] = second
+        second_block[second_pos] = first
+        self._block_of[first] = second_block
+        self._block_of[second] = first_block
+
+    def remove(self, key: Key):
+        """Removes the key"""
+        block = self._block_of.pop(key)
+        pos = self._block_pos[id(block)]
+        block.remove(key)
+        self._len -= 1
+        self._dirty = min(self._dirty, pos + 1)
+        if not block and len(self._blocks) > 1:
+            del self._blocks[pos]
+            del self._block_pos[id(block)]
+            self._renumber(pos)
+
+    def clear(self):
+        """Removes all the keys"""
+        self.__init__()
@@ -0,0 +1,170 @@
+from typing import Dict, Iterator, List, Optional
+
+from jdict import Key, KeyValuePair, Value, frozenjdict, jdict
+from jdict._order import OrderIndex
+
+
+class jordered(jdict):
+    """jdict whose order can be edited in the middle, for priority lists, playlists and the like
+
+    The order of the keys is kept in an order-statistic index next to the dict, so insert_at, move_to, move_to_end and
+    swap are O(log n) (plus a move within a block of a few hundred keys), and so are at, key_at, value_at and
+    index_of. The dict itself is only put back in order when data is accessed after the order has been edited, and the
+    cached lists are rebuilt the next time they are read."""
+
+    __slots__ = ("_data", "_order", "_unsorted")
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, data=None, **kwargs):
+        if data is None:
+            data = kwargs
+        elif not isinstance(data, dict):
+            kwargs["data"] = data
+            data = kwargs
+        self._state = None
+        self._data = dict(data)  # type: Dict[Key, Value]
+        self._order = OrderIndex(self._data)
+        self._unsorted = False
+
+    def __reduce__(self):
+        return self.__class__, (self.data,)
+
+    @property
+    def data(self) -> dict:
+        """the dict with the items, in order"""
+        if self._unsorted:
+            data = self._data
+            self._data = {key: data[key] for key in self._order}
+            self._unsorted = False
+        return self._data
+
+    def _store(self, key: Key, value: Value):
+        self._regroup(key, value)
+        data = self._data
+        new = key not in data
+        data[key] = value
+        if new:
+            self._order.append(key)
+        if self._state is not None:
+            self._patch_set(key, value, new)
+            self._drop_derived(key)
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        value = self._data.pop(key)
+        self._ungroup(key, value)
+        idx = self._order.index_of(key)
+        self._order.remove(key)
+        if self._state is not None:
+            self._patch_removed(idx)
+            self._drop_derived(key)
+        return value
+
+    def _reordered(self):
+        """Helper: marks the dict as out of order and drops the cached lists after the order has been edited"""
+        self._unsorted = True
+        self._invalidate()
+
+    def _reorder(self, items: List[KeyValuePair]):
+        self._unsorted = False
+        super()._reorder(items)
+        self._order = OrderIndex(self._data)
+
+    def _cached_index(self, key: Key) -> Optional[int]:
+        return self._order.index_of(key)
+
+    def insert_at(self, idx: int, key: Key, value: Value):
+        """Sets the item and moves it to the index (0 <= idx <= the number of other items)"""
+        if key in self._data:
+            if not 0 <= idx < len(self._data):
+                raise IndexError(idx)
+            self._order.remove(key)
+        self._order.insert(idx, key)
+        self._regroup(key, value)
+        self._data[key] = value
+        self._reordered()
+        self._drop_derived(key)
+
+    def move_to_end(self, key: Key, last: bool = True):
+        """Moves the item at the key to the end, or to the start if last is False"""
+        self.move_to(key, len(self._data) - 1 if last else 0)
+
+    def swap(self, i: int, j: int):
+        """Swaps the items at the indices i and j"""
+        self._order.swap(self._order.at(i), self._order.at(j))
+        self._reordered()
+
+    def clear(self):
+        self._data = {}
+        self._order = OrderIndex()
+        self._unsorted = False
+        self._cleanse()
+        self._invalidate()
+
+    def snapshot(self) -> frozenjdict:
+        """a frozenjdict with a copy of the items, in order
+
+        The dict is modified in place by later writes, so unlike for jdict it can't be shared with the snapshot."""
+        return frozenjdict._wrap(self.data.copy())
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._order)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self._data[key]
+        except (KeyError, TypeError):
+            return self._slice_or_raise(key)
+
+    def enable_position_index(self):
+        """Does nothing: jordered always keeps its order in an order-statistic index"""
+        return self
+
+    @property
+    def has_position_index(self) -> bool:
+        """whether positional access is O(log n)"""
+        return True
+
+    @property
+    def first(self) -> KeyValuePair:
+        """the first item ((key, value)-pair)"""
+        return self.at(0) if self._data else None
+
+    @property
+    def first_key(self) -> Key:
+        """the first key"""
+        return self._order.at(0) if self._data else None
+
+    @property
+    def first_value(self) -> Value:
+        """the first value"""
+        return self._data[self._order.at(0)] if self._data else None
+
+    @property
+    def last(self) -> KeyValuePair:
+        """the last item ((key, value)-pair)"""
+        return self.at(len(self._data) - 1) if self._data else None
+
+    @property
+    def last_key(self) -> Key:
+        """the last key"""
+        return self._order.at(len(self._data) - 1) if self._data else None
+
+    @property
+    def last_value(self) -> Value:
+        """the last value"""
+        return self._data[self._order.at(len(self._data) - 1)] if self._data else None
+
+    def at(self, idx: int) -> KeyValuePair:
+        """the item at the index"""
+        key = self._order.at(idx)
+        return key, self._data[key]
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        return self._order.index_of(key)
@@ -0,0 +1,84 @@
+from itertools import islice
+from typing import Callable, Iterator, Optional, Tuple
+
+from jdict import KeyValuePair, jdict
+
+_WHERE_KEY, _WHERE_VALUE, _WHERE, _MAP_KEY, _MAP_VALUE, _MAP_ITEM = range(6)
+
+
+class Query:
+    """Lazy chain of selections and mappings over the items of a jdict
+
+    Nothing is computed until the query is iterated or materialized, and then all the steps are applied to each item
+    in a single pass, so no intermediate dicts are built. Each step returns a new Query, so a query can be extended in
+    several directions. The items are read from the jdict when the query is run, not when it is built."""
+
+    __slots__ = ("_source", "_steps")
+
+    def __init__(self, source: jdict, steps: Tuple[Tuple[int, Callable], ...] = ()):
+        self._source = source
+        self._steps = steps
+
+    def _then(self, kind: int, func: Callable) -> "Query":
+        """Helper: a new query with the step added at the end"""
+        return Query(self._source, self._steps + ((kind, func),))
+
+    def where_key(self, key_func: Callable) -> "Query":
+        """Drops items where the key doesn't fulfill key_func"""
+        return self._then(_WHERE_KEY, key_func)
+
+    def where_value(self, value_func: Callable) -> "Query":
+        """Drops items where the value doesn't fulfill value_func"""
+        return self._then(_WHERE_VALUE, value_func)
+
+    def where(self, item_func: Callable) -> "Query":
+        """Drops items where the (key, value)-pair doesn't fulfill item_func"""
+        return self._then(_WHERE, item_func)
+
+    def map_key(self, key_func: Callable) -> "Query":
+        """Maps the keys by key_func"""
+        return self._then(_MAP_KEY, key_func)
+
+    def map_value(self, value_func: Callable) -> "Query":
+        """Maps the values by value_func"""
+        return self._then(_MAP_VALUE, value_func)
+
+    def map_item(self, item_func: Callable) -> "Query":
+        """Maps the (key, value)-pairs by item_func"""
+        return self._then(_MAP_ITEM, item_func)
+
+    def __iter__(self) -> Iterator[KeyValuePair]:
+        steps = self._steps
+        for key, value in self._source.data.items():
+            for kind, func in steps:
+                if kind == _WHERE_KEY:
+                    if not func(key):
+                        break
+                elif kind == _WHERE_VALUE:
+                    if not func(value):
+                        break
+                elif kind == _WHERE:
+                    if not func(key, value):
+                        break
+                elif kind == _MAP_KEY:
+                    key = func(key)
+                elif kind == _MAP_VALUE:
+                    value = func(value)
+                else:
+                    key, value = func(key, value)
+            else:
+                yield key, value
+
+    def collect(self) -> jdict:
+        """Runs the query and returns the result as a jdict"""
+        return jdict(dict(self))
+
+    def first(self) -> Optional[KeyValuePair]:
+        """Runs the query until the first result and returns it (or None if there are no results)"""
+        for item in self:
+            return item
+        return None
+
+    def take(self, n: int) -> jdict:
+        """Runs the query until the first n results and returns them as a jdict"""
+        return jdict(dict(islice(self, n)))
@@ -0,0 +1,87 @@
+from collections import deque
+from typing import Dict, List, Optional
+
+from jdict import Key, KeyValuePair, Value, jdict
+
+
+class jqueue(jdict):
+    """jdict tuned for use as an ordered work queue
+
+    CPython has to skip the slots left behind by earlier deletions to find the first key of a dict, so draining a dict
+    from the front is quadratic. jqueue keeps the keys in a deque next to the dict, which makes pop_first, pop_first_key
+    and pop_first_value amortised O(1) no matter how much churn there has been."""
+
+    __slots__ = ("_order", "_skip")
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, data=None, **kwargs):
+        super().__init__(data, **kwargs)
+        self._order = deque(self.data)
+        self._skip = {}  # type: Dict[Key, int]
+
+    def _head(self) -> Optional[Key]:
+        """Helper: drops stale keys from the front of the deque and returns the first key"""
+        order = self._order
+        skip = self._skip
+        while order:
+            key = order[0]
+            if key not in skip:
+                return key
+            order.popleft()
+            if skip[key] == 1:
+                del skip[key]
+            else:
+                skip[key] -= 1
+        return None
+
+    def _store(self, key: Key, value: Value):
+        new = key not in self.data
+        super()._store(key, value)
+        if new:
+            self._order.append(key)
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        value = super()._discard(key, idx)
+        if self._order and self._order[0] == key:
+            self._order.popleft()
+        else:
+            # Keys removed from elsewhere than the front are skipped when they reach it
+            self._skip[key] = self._skip.get(key, 0) + 1
+        return value
+
+    def _patch_removed(self, idx: Optional[int]):
+        # Shifting the cached lists would make every pop from the front O(n)
+        if idx == 0:
+            self._invalidate()
+        else:
+            super()._patch_removed(idx)
+
+    def clear(self):
+        super().clear()
+        self._order.clear()
+        self._skip.clear()
+
+    def _reorder(self, items: List[KeyValuePair]):
+        super()._reorder(items)
+        self._order = deque(self.data)
+        self._skip.clear()
+
+    @property
+    def first(self) -> KeyValuePair:
+        """the first item ((key, value)-pair)"""
+        if not self.data:
+            return None
+        key = self._head()
+        return key, self.data[key]
+
+    @property
+    def first_key(self) -> Key:
+        """the first key"""
+        return self._head()
+
+    @property
+    def first_value(self) -> Value:
+        """the first value"""
+        if not self.data:
+            return None
+        return self.data[self._head()]
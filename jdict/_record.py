@@ -0,0 +1,231 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jdict import Key, KeyValuePair, Value, _identity, jdict
+
+
+class Schema:
+    """An ordered set of keys, shared by all the jrecords created from it
+
+    The positions of the keys are computed once here, so that each jrecord only has to store its values."""
+
+    __slots__ = ("keys", "positions")
+
+    def __init__(self, keys: Iterable[Key]):
+        self.keys = tuple(keys)  # type: Tuple[Key, ...]
+        self.positions = {key: pos for pos, key in enumerate(self.keys)}  # type: Dict[Key, int]
+        if len(self.positions) != len(self.keys):
+            raise ValueError(f"duplicate keys in {self.keys}")
+
+    def __call__(self, *values: Value) -> "jrecord":
+        """a jrecord with the values in the order of the keys"""
+        if len(values) != len(self.keys):
+            raise ValueError(f"expected {len(self.keys)} values for {self.keys}, got {len(values)}")
+        return jrecord._from_row(self, list(values))
+
+    def from_dict(self, data: Dict[Key, Value]) -> "jrecord":
+        """a jrecord with the values in the dict, which must have exactly the keys of the schema (in any order)"""
+        if len(data) != len(self.keys):
+            raise ValueError(f"got keys {list(data)}, expected {list(self.keys)}")
+        try:
+            return jrecord._from_row(self, [data[key] for key in self.keys])
+        except KeyError as ke:
+            raise ValueError(f"got keys {list(data)}, expected {list(self.keys)}") from ke
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self.keys)
+
+    def __repr__(self) -> str:
+        return f"Schema({list(self.keys)!r})"
+
+
+class jrecord(jdict):
+    """jdict that stores only a list of values, and shares its keys with every other jrecord of the same Schema
+
+    Meant for large numbers of rows with the same keys in the same order, which are created with schema(*values).
+    Access by key or position is O(1), and value_list is the list of values itself (not a copy). Adding or removing a
+    key gives the jrecord a schema of its own first, which is O(n). data is a dict built on each access."""
+
+    __slots__ = ("_schema",)
+    protected_keys = jdict.protected_keys.union(__slots__, ("_row",))
+
+    # The list of values is kept in the slot of data, which jrecord replaces by a property, so that it costs no more
+    # memory per row
+    _row = jdict.data
+
+    def __init__(self, data=None, **kwargs):
+        if data is None:
+            data = kwargs
+        elif not isinstance(data, dict):
+            kwargs["data"] = data
+            data = kwargs
+        self._setup(Schema(data), list(data.values()))
+
+    def _setup(self, schema: Schema, row: List[Value]):
+        """Helper: sets the housekeeping attributes"""
+        self._state = None
+        self._schema = schema
+        self._row = row
+
+    @classmethod
+    def _from_row(cls, schema: Schema, row: List[Value]) -> "jrecord":
+        """Helper: a jrecord with the schema and the list of values (which is not copied)"""
+        result = cls.__new__(cls)
+        result._setup(schema, row)
+        return result
+
+    def __reduce__(self):
+        return self._from_row, (self._schema, self._row)
+
+    @property
+    def schema(self) -> Schema:
+        """the schema with the keys"""
+        return self._schema
+
+    @property
+    def data(self) -> dict:
+        """a dict with the keys and values"""
+        return dict(zip(self._schema.keys, self._row))
+
+    def _store(self, key: Key, value: Value):
+        self._drop_derived(key)
+        self._regroup(key, value)
+        pos = self._schema.positions.get(key)
+        if pos is not None:
+            self._row[pos] = value
+            return
+        self._schema = Schema(self._schema.keys + (key,))
+        self._row.append(value)
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        self._drop_derived(key)
+        pos = self._schema.positions[key]
+        keys = self._schema.keys
+        self._schema = Schema(keys[:pos] + keys[pos + 1 :])
+        value = self._row.pop(pos)
+        self._ungroup(key, value)
+        return value
+
+    def _reorder(self, items: List[KeyValuePair]):
+        self._schema = Schema(key for key, _ in items)
+        self._row = [value for _, value in items]
+        self._regroup_all(items)
+        self._invalidate()
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._schema.keys)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._schema.positions
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self._row[self._schema.positions[key]]
+        except (KeyError, TypeError):
+            return self._slice_or_raise(key)
+
+    def clear(self):
+        self._schema = Schema(())
+        self._row = []
+        self._cleanse()
+        self._invalidate()
+
+    def copy(self):
+        """a copy which shares the schema but not the values with the original"""
+        copied = self._from_row(self._schema, list(self._row))
+        if self._state is not None and self._state.encoder is not None:
+            copied.set_json_encoder(self._state.encoder)
+        return copied
+
+    __copy__ = copy
+
+    def enable_position_index(self):
+        """Does nothing: positional access is always O(1) for jrecord"""
+        return self
+
+    @property
+    def has_position_index(self) -> bool:
+        """whether positional access is O(1)"""
+        return True
+
+    @property
+    def list(self) -> List[KeyValuePair]:
+        """a list of the items ((key, value)-pairs)"""
+        return list(zip(self._schema.keys, self._row))
+
+    @property
+    def key_list(self) -> List[Key]:
+        """a list of the keys"""
+        return list(self._schema.keys)
+
+    @property
+    def value_list(self) -> List[Value]:
+        """the list of values (not a copy)"""
+        return self._row
+
+    @property
+    def first(self) -> KeyValuePair:
+        """the first item ((key, value)-pair)"""
+        return (self._schema.keys[0], self._row[0]) if self._row else None
+
+    @property
+    def first_key(self) -> Key:
+        """the first key"""
+        return self._schema.keys[0] if self._row else None
+
+    @property
+    def first_value(self) -> Value:
+        """the first value"""
+        return self._row[0] if self._row else None
+
+    @property
+    def last(self) -> KeyValuePair:
+        """the last item ((key, value)-pair)"""
+        return (self._schema.keys[-1], self._row[-1]) if self._row else None
+
+    @property
+    def last_key(self) -> Key:
+        """the last key"""
+        return self._schema.keys[-1] if self._row else None
+
+    @property
+    def last_value(self) -> Value:
+        """the last value"""
+        return self._row[-1] if self._row else None
+
+    @property
+    def enum(self):
+        """(idx, key, value)-tuples"""
+        return zip(self.range, self._schema.keys, self._row)
+
+    @property
+    def enum_keys(self):
+        """(idx, key)-pairs"""
+        return enumerate(self._schema.keys)
+
+    @property
+    def enum_values(self):
+        """(idx, value)-pairs"""
+        return enumerate(self._row)
+
+    def at(self, idx: int) -> KeyValuePair:
+        """the item at the index"""
+        if not 0 <= idx < len(self._row):
+            raise IndexError(idx)
+        return self._schema.keys[idx], self._row[idx]
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        return self._schema.positions[key]
+
+    def mapping(self, key_func=_identity, value_func=_identity, executor=None, chunksize: Optional[int] = None):
+        """Maps the keys by key_func and the values by value_func. If the keys are not mapped, the result is a jrecord
+        with the same schema."""
+        if key_func is not _identity or executor is not None:
+            return super().mapping(key_func, value_func, executor, chunksize)
+        return self._from_row(self._schema, [value_func(value) for value in self._row])
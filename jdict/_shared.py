@@ -0,0 +1,250 @@
+import struct
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from jdict import Key, Value
+from jdict._storage import (
+    StoredJdict,
+    dump_key,
+    key_hash,
+    pack_record,
+    record_key,
+    record_key_bytes,
+    record_value,
+    table_capacity,
+    table_find,
+)
+
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+MAGIC = b"JDICTSHM"
+
+# Segment header: magic, number of items, hash table capacity. It is followed by the record offset of each key in
+# order, the hash table slots and the records.
+HEADER = struct.Struct("<8s2Q")
+
+# The names of the segments that the current thread is attaching to, which must not be registered
+_attaching = threading.local()
+_register_lock = threading.Lock()
+_register = None  # The resource tracker's register function, once it has been wrapped
+
+
+def _shared_memory():
+    """Helper: imports multiprocessing.shared_memory when it is first needed, since it requires Python 3.8"""
+    from multiprocessing import shared_memory
+
+    return shared_memory
+
+
+def _register_unless_attaching(name: str, rtype: str):
+    """Helper: registers the resource with the resource tracker, unless it is a segment this thread is attaching to"""
+    if rtype == "shared_memory" and name.lstrip("/") in getattr(_attaching, "names", ()):
+        return
+    _register(name, rtype)
+
+
+def _attach(name: str) -> "shared_memory.SharedMemory":
+    """Helper: attaches to the segment without registering it with the resource tracker
+
+    Only the process which created the segment should unlink it, but the resource tracker unlinks registered segments
+    when the processes using it exit."""
+    global _register
+    shared_memory = _shared_memory()
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        pass
+    # track was added in Python 3.13, and before that attaching always registers the segment. The resource tracker's
+    # register is wrapped (once) to skip the segments that this thread is attaching to, so that segments created by
+    # other threads in the meantime are still registered.
+    from multiprocessing import resource_tracker
+
+    with _register_lock:
+        if _register is None:
+            _register = resource_tracker.register
+            resource_tracker.register = _register_unless_attaching
+    names = _attaching.__dict__.setdefault("names", set())
+    names.add(name.lstrip("/"))
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        names.discard(name.lstrip("/"))
+
+
+class _SharedTable:
+    """Read-only ordered map of pickled keys and values in a shared memory segment"""
+
+    def __init__(self, shm: "shared_memory.SharedMemory", owner: bool):
+        self.shm = shm
+        self.owner = owner
+        self.closed = True  # Until the views below exist
+        self.buf = shm.buf.toreadonly()
+        magic, self.count, self.capacity = HEADER.unpack_from(self.buf)
+        if magic != MAGIC:
+            self.buf.release()
+            shm.close()
+            raise ValueError(f"{shm.name} is not a jshared segment")
+        order_end = HEADER.size + 8 * self.count
+        self.order = self.buf[HEADER.size : order_end].cast("Q")
+        self.slots = self.buf[order_end : order_end + 16 * self.capacity].cast("Q")
+        self.closed = False
+
+    def __del__(self):
+        # The views must be released before the segment is closed: otherwise SharedMemory.__del__ fails with
+        # BufferError when a jshared is garbage collected without being closed (e.g. one unpickled in a worker)
+        self.close()
+
+    @classmethod
+    def create(cls, items, name: Optional[str] = None) -> "_SharedTable":
+        """Helper: a new segment with the (key, value)-pairs"""
+        keys = []
+        records = []
+        for key, value in items:
+            key_bytes = dump_key(key)
+            keys.append(key_bytes)
+            records.append(pack_record(key_bytes, value))
+        count = len(records)
+        capacity = table_capacity(count)
+        records_start = HEADER.size + 8 * count + 16 * capacity
+        size = records_start + sum(len(record) for record in records)
+        shm = _shared_memory().SharedMemory(name=name, create=True, size=size)
+        try:
+            buf = shm.buf
+            HEADER.pack_into(buf, 0, MAGIC, count, capacity)
+            order = buf[HEADER.size : HEADER.size + 8 * count].cast("Q")
+            slots = buf[HEADER.size + 8 * count : records_start].cast("Q")
+            offset = records_start
+            for pos, (key_bytes, record) in enumerate(zip(keys, records)):
+                order[pos] = offset
+                buf[offset : offset + len(record)] = record
+                offset += len(record)
+                hash_ = key_hash(key_bytes)
+                _, slot = table_find(slots, capacity, hash_, lambda pos: False)
+                slots[2 * slot] = hash_
+                slots[2 * slot + 1] = pos + 1
+            order.release()
+            slots.release()
+            del buf
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        return cls(shm, owner=True)
+
+    def _find(self, key: Key) -> Optional[int]:
+        """Helper: the position of the key, or None"""
+        key_bytes = dump_key(key)
+        buf = self.buf
+        order = self.order
+        return table_find(
+            self.slots, self.capacity, key_hash(key_bytes), lambda pos: record_key_bytes(buf, order[pos]) == key_bytes
+        )[0]
+
+    def positions(self) -> range:
+        """the positions in use, in order"""
+        return range(self.count)
+
+    def position_at(self, idx: int) -> int:
+        """the position of the idx'th key"""
+        if not 0 <= idx < self.count:
+            raise IndexError(idx)
+        return idx
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        pos = self._find(key)
+        if pos is None:
+            raise KeyError(key)
+        return pos
+
+    def key(self, pos: int) -> Key:
+        """the key at the position"""
+        return record_key(self.buf, self.order[pos])
+
+    def value(self, pos: int) -> Value:
+        """the value at the position"""
+        return record_value(self.buf, self.order[pos])
+
+    def get(self, key: Key) -> Value:
+        """the value at the key"""
+        return self.value(self.index_of(key))
+
+    def __contains__(self, key: Key) -> bool:
+        return self._find(key) is not None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self):
+        """Detaches from the segment"""
+        if self.closed:
+            return
+        self.closed = True
+        self.order.release()
+        self.slots.release()
+        self.buf.release()
+        self.shm.close()
+
+
+class jshared(StoredJdict):
+    """Read-only jdict in a shared memory segment, for lookup tables which are shared by several processes
+
+    jshared.freeze(j) copies the items of a jdict into a new segment: the pickled items, the record offsets in order and
+    a hash index. jshared(name) attaches to an existing segment by name without copying it, and values are unpickled
+    when they are accessed. Pickling a jshared (e.g. to send it to a worker process) only pickles the name.
+
+    Lookups by key and by position are O(1). The process which froze the jdict owns the segment, and must call
+    unlink() (or use it as a context manager) when all the processes are done with it."""
+
+    __slots__ = ()
+
+    def __init__(self, name: str):
+        super().__init__(_SharedTable(_attach(name), owner=False))
+
+    @classmethod
+    def freeze(cls, j, name: Optional[str] = None) -> "jshared":
+        """a jshared with the items of j in a new shared memory segment (with a random name unless one is given)"""
+        shared = cls.__new__(cls)
+        items = j._iter_items() if isinstance(j, StoredJdict) else j.items()
+        StoredJdict.__init__(shared, _SharedTable.create(items, name))
+        return shared
+
+    @property
+    def name(self) -> str:
+        """the name of the shared memory segment"""
+        return self._table.shm.name
+
+    def close(self):
+        """Detaches from the segment (which is still available to other processes until it is unlinked)"""
+        self._table.close()
+
+    def unlink(self):
+        """Detaches from the segment and frees it once every process has detached"""
+        self.close()
+        self._table.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        """Closes, and unlinks the segment if it was created by freeze"""
+        if self._table.owner:
+            self.unlink()
+        else:
+            self.close()
+
+    def __reduce__(self):
+        return jshared, (self.name,)
+
+    def __repr__(self) -> str:
+        return f"jshared({self.name!r})"
+
+    def _store(self, key: Key, value: Value):
+        raise TypeError("jshared is read-only")
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        raise TypeError("jshared is read-only")
+
+    def clear(self):
+        raise TypeError("jshared is read-only")
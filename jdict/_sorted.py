@@ -0,0 +1,220 @@
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from jdict import Key, KeyValuePair, Value, _ITEMS_VALID, _VALUES_VALID, frozenjdict, jdict
+
+
+class jsorted(jdict):
+    """jdict which is ordered by its keys instead of by insertion order
+
+    The keys are kept in a sorted list next to the dict, so first, last, at, index_of, pop_first and pop_last follow the
+    key order, and range_keys, irange, floor and ceiling are O(log n + k) bisections of that list. Inserting a key is a
+    bisection plus a move of the keys after it (a memmove, which is fast even for large jdicts); appending keys in
+    order is O(1). The dict itself is only put back in key order when data is accessed after keys have been inserted
+    out of order. The keys must be comparable with each other."""
+
+    __slots__ = ("_data", "_keys", "_unsorted")
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, data=None, **kwargs):
+        if data is None:
+            data = kwargs
+        elif not isinstance(data, dict):
+            kwargs["data"] = data
+            data = kwargs
+        self._state = None
+        self._keys = sorted(data)  # type: List[Key]
+        self._data = {key: data[key] for key in self._keys}  # type: Dict[Key, Value]
+        self._unsorted = False
+
+    def __reduce__(self):
+        return self.__class__, (self.data,)
+
+    @property
+    def data(self) -> dict:
+        """the dict with the items, in key order"""
+        if self._unsorted:
+            data = self._data
+            self._data = {key: data[key] for key in self._keys}
+            self._unsorted = False
+        return self._data
+
+    def _store(self, key: Key, value: Value):
+        self._regroup(key, value)
+        data = self._data
+        if key in data:
+            data[key] = value
+            if self._state is not None:
+                self._patch_set(key, value, False)
+                self._drop_derived(key)
+            return
+        keys = self._keys
+        if not keys or keys[-1] < key:
+            idx = len(keys)
+            keys.append(key)
+        else:
+            idx = bisect_left(keys, key)
+            keys.insert(idx, key)
+            self._unsorted = True
+        data[key] = value
+        if self._state is not None:
+            self._patch_inserted(idx, key, value)
+            self._drop_derived(key)
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        value = self._data.pop(key)
+        self._ungroup(key, value)
+        idx = bisect_left(self._keys, key)
+        del self._keys[idx]
+        if self._state is not None:
+            self._patch_removed(idx)
+            self._drop_derived(key)
+        return value
+
+    def _patch_inserted(self, idx: int, key: Key, value: Value):
+        """Updates the cached lists in place after the key has been inserted at the index"""
+        state = self._state
+        if state.flags & _VALUES_VALID:
+            state.values.insert(idx, value)
+        if state.flags & _ITEMS_VALID:
+            state.items.insert(idx, (key, value))
+
+    def _reorder(self, items: List[KeyValuePair]):
+        raise TypeError("jsorted is always ordered by its keys")
+
+    def insert_at(self, idx: int, key: Key, value: Value):
+        raise TypeError("jsorted is always ordered by its keys")
+
+    def move_to_end(self, key: Key, last: bool = True):
+        raise TypeError("jsorted is always ordered by its keys")
+
+    def _cached_index(self, key: Key) -> Optional[int]:
+        return bisect_left(self._keys, key)
+
+    def clear(self):
+        self._data = {}
+        self._keys = []
+        self._unsorted = False
+        self._cleanse()
+        self._invalidate()
+
+    def snapshot(self) -> frozenjdict:
+        """a frozenjdict with a copy of the items, in key order
+
+        The dict is modified in place by later writes, so unlike for jdict it can't be shared with the snapshot."""
+        return frozenjdict._wrap(self.data.copy())
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._keys)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._data
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self._data[key]
+        except (KeyError, TypeError):
+            return self._slice_or_raise(key)
+
+    def enable_position_index(self):
+        """Does nothing: positional access is always O(1) (and index_of O(log n)) for jsorted"""
+        return self
+
+    @property
+    def has_position_index(self) -> bool:
+        """whether positional access is O(1)"""
+        return True
+
+    @property
+    def key_list(self) -> List[Key]:
+        """the sorted list of keys (not a copy)"""
+        return self._keys
+
+    @property
+    def first(self) -> KeyValuePair:
+        """the item with the smallest key"""
+        return (self._keys[0], self._data[self._keys[0]]) if self._keys else None
+
+    @property
+    def first_key(self) -> Key:
+        """the smallest key"""
+        return self._keys[0] if self._keys else None
+
+    @property
+    def first_value(self) -> Value:
+        """the value at the smallest key"""
+        return self._data[self._keys[0]] if self._keys else None
+
+    @property
+    def last(self) -> KeyValuePair:
+        """the item with the largest key"""
+        return (self._keys[-1], self._data[self._keys[-1]]) if self._keys else None
+
+    @property
+    def last_key(self) -> Key:
+        """the largest key"""
+        return self._keys[-1] if self._keys else None
+
+    @property
+    def last_value(self) -> Value:
+        """the value at the largest key"""
+        return self._data[self._keys[-1]] if self._keys else None
+
+    def at(self, idx: int) -> KeyValuePair:
+        """the item at the index"""
+        if not 0 <= idx < len(self._keys):
+            raise IndexError(idx)
+        key = self._keys[idx]
+        return key, self._data[key]
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        if key not in self._data:
+            raise KeyError(key)
+        return bisect_left(self._keys, key)
+
+    def _bounds(self, lo: Optional[Key], hi: Optional[Key], inclusive: Tuple[bool, bool]) -> Tuple[int, int]:
+        """Helper: the start and stop indices of the keys between lo and hi (no bound if None)"""
+        keys = self._keys
+        if lo is None:
+            start = 0
+        else:
+            start = (bisect_left if inclusive[0] else bisect_right)(keys, lo)
+        if hi is None:
+            stop = len(keys)
+        else:
+            stop = (bisect_right if inclusive[1] else bisect_left)(keys, hi)
+        return start, max(start, stop)
+
+    def range_keys(self, lo: Optional[Key] = None, hi: Optional[Key] = None) -> List[Key]:
+        """a list of the keys from lo up to but not including hi (like range), in order"""
+        start, stop = self._bounds(lo, hi, (True, False))
+        return self._keys[start:stop]
+
+    def irange(
+        self,
+        lo: Optional[Key] = None,
+        hi: Optional[Key] = None,
+        inclusive: Tuple[bool, bool] = (True, True),
+        reverse: bool = False,
+    ) -> Iterator[Key]:
+        """Yields the keys between lo and hi in order (or in reverse order), including lo and hi themselves according
+        to inclusive. The jsorted must not be modified while iterating."""
+        start, stop = self._bounds(lo, hi, inclusive)
+        keys = self._keys
+        positions = range(stop - 1, start - 1, -1) if reverse else range(start, stop)
+        for idx in positions:
+            yield keys[idx]
+
+    def floor(self, key: Key) -> Key:
+        """the largest key which is less than or equal to the key, or None if there is none"""
+        idx = bisect_right(self._keys, key)
+        return self._keys[idx - 1] if idx else None
+
+    def ceiling(self, key: Key) -> Key:
+        """the smallest key which is greater than or equal to the key, or None if there is none"""
+        idx = bisect_left(self._keys, key)
+        return self._keys[idx] if idx < len(self._keys) else None
@@ -0,0 +1,335 @@
+"""Binary encoding of keys, values and hash tables shared by the jdicts which live outside the Python heap"""
+from collections import UserDict
+import hashlib
+import io
+import pickle
+import struct
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from jdict import Key, KeyValuePair, Value, jdict
+
+PROTOCOL = 4
+
+# A record is the lengths of the pickled key and value followed by the pickled key and value
+RECORD = struct.Struct("<II")
+
+# A hash table slot is two uint64s: the hash of the key and the position of the key + 1 (0 for an empty slot)
+EMPTY = 0
+DELETED = 2 ** 64 - 1
+
+
+class _FrozensetItems(tuple):
+    """The elements of a frozenset in a fixed order, which are pickled as that frozenset"""
+
+    def __reduce__(self):
+        return frozenset, (tuple(self),)
+
+
+def _canonical(key: Key) -> Key:
+    """Helper: the key with the frozensets in it (also inside tuples) replaced by their elements in a fixed order, since
+    the order in which a frozenset is pickled depends on the hash seed of the process"""
+    if type(key) is frozenset:
+        return _FrozensetItems(sorted((_canonical(elem) for elem in key), key=dump_key))
+    if type(key) is tuple:
+        return tuple(_canonical(elem) for elem in key)
+    return key
+
+
+def dump_key(key: Key) -> bytes:
+    """the pickled key (keys are identified by this, so e.g. 1 and 1.0 are different keys)
+
+    The key is pickled without the memo, which would make the bytes depend on which parts of the key are the same
+    object: ("a1", "a1") must be found whether or not the two strings are. Frozensets are pickled with their elements
+    in a fixed order, so that they are found from other processes."""
+    buf = io.BytesIO()
+    pickler = pickle.Pickler(buf, PROTOCOL)
+    pickler.fast = True
+    pickler.dump(_canonical(key))
+    return buf.getvalue()
+
+
+def key_hash(key_bytes: bytes) -> int:
+    """a hash of the pickled key which is stable across processes (and never 0)"""
+    return int.from_bytes(hashlib.blake2b(key_bytes, digest_size=8).digest(), "little") or 1
+
+
+def pack_record(key_bytes: bytes, value: Value) -> bytes:
+    """the record for the pickled key and the value"""
+    value_bytes = pickle.dumps(value, PROTOCOL)
+    return RECORD.pack(len(key_bytes), len(value_bytes)) + key_bytes + value_bytes
+
+
+def record_key_bytes(buf, offset: int) -> bytes:
+    """the pickled key of the record at the offset"""
+    key_len, _ = RECORD.unpack_from(buf, offset)
+    start = offset + RECORD.size
+    return bytes(buf[start : start + key_len])
+
+
+def record_key(buf, offset: int) -> Key:
+    """the key of the record at the offset"""
+    key_len, _ = RECORD.unpack_from(buf, offset)
+    start = offset + RECORD.size
+    return pickle.loads(buf[start : start + key_len])
+
+
+def record_value(buf, offset: int) -> Value:
+    """the value of the record at the offset"""
+    key_len, value_len = RECORD.unpack_from(buf, offset)
+    start = offset + RECORD.size + key_len
+    return pickle.loads(buf[start : start + value_len])
+
+
+def record_size(buf, offset: int) -> int:
+    """the size of the record at the offset"""
+    key_len, value_len = RECORD.unpack_from(buf, offset)
+    return RECORD.size + key_len + value_len
+
+
+def table_capacity(count: int) -> int:
+    """a power-of-two number of hash table slots which keeps the load factor of count keys at most 1/2"""
+    capacity = 8
+    while capacity < 2 * count:
+        capacity *= 2
+    return capacity
+
+
+def table_find(
+    slots, capacity: int, hash_: int, is_key: Callable[[int], bool]
+) -> Tuple[Optional[int], int]:
+    """Looks up a key in a linear probing hash table
+
+    slots is a sequence of 2 * capacity uint64s (such as a memoryview cast to "Q"), and is_key(position) tells
+    whether the key at the position is the one to look up. Returns the position of the key (or None if it is not in
+    the table) and the slot where it is (or where it should be inserted)."""
+    mask = capacity - 1
+    slot = hash_ & mask
+    free = None
+    while True:
+        slot_hash = slots[2 * slot]
+        if slot_hash == EMPTY:
+            return None, slot if free is None else free
+        stored = slots[2 * slot + 1]
+        if stored == DELETED:
+            if free is None:
+                free = slot
+        elif slot_hash == hash_ and is_key(stored - 1):
+            return stored - 1, slot
+        slot = (slot + 1) & mask
+
+
+class StoredJdict(jdict):
+    """Base for jdicts whose items are stored outside the Python heap, in a table which is indexed by position
+
+    The table must support len(), `in`, get(key), index_of(key), positions() (the positions in use, in order),
+    position_at(idx) and key(pos)/value(pos) for a position. Subclasses implement writes."""
+
+    __slots__ = ("_table",)
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, table):
+        self._state = None
+        self._table = table
+
+    @property
+    def data(self) -> "StoredItems":
+        """a read-only view of the items"""
+        return StoredItems(self)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __iter__(self) -> Iterator[Key]:
+        table = self._table
+        return (table.key(pos) for pos in table.positions())
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._table
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self._table.get(key)
+        except (KeyError, TypeError):
+            return self._slice_or_raise(key)
+
+    def _reorder(self, items: List[KeyValuePair]):
+        raise TypeError(f"{type(self).__name__} can't be reordered, copy it first")
+
+    def copy(self):
+        """an in-memory jdict with all the items"""
+        return jdict(dict(self._iter_items()))
+
+    __copy__ = copy
+
+    def __or__(self, other):
+        """an in-memory jdict with all the items, updated with those of the other mapping"""
+        if isinstance(other, (jdict, UserDict)):
+            return jdict(self.data | other.data)
+        if isinstance(other, dict):
+            return jdict(self.data | other)
+        return NotImplemented
+
+    def __ror__(self, other):
+        """an in-memory jdict with the items of the other mapping, updated with all the items"""
+        if isinstance(other, (jdict, UserDict)):
+            return jdict(other.data | self.data)
+        if isinstance(other, dict):
+            return jdict(other | self.data)
+        return NotImplemented
+
+    @property
+    def datarow(self):
+        """a representation as a pandas DataFrame with one row (of all the items, which are loaded into memory)"""
+        return self.copy().datarow
+
+    def enable_position_index(self):
+        """Does nothing: the items are always stored with their own position index"""
+        return self
+
+    @property
+    def has_position_index(self) -> bool:
+        """whether the items are stored with a position index"""
+        return True
+
+    def _iter_items(self) -> Iterator[KeyValuePair]:
+        """Helper: the items in order, read sequentially rather than looked up by key"""
+        table = self._table
+        return ((table.key(pos), table.value(pos)) for pos in table.positions())
+
+    def _iter_values(self) -> Iterator[Value]:
+        """Helper: the values in order, read sequentially rather than looked up by key"""
+        table = self._table
+        return (table.value(pos) for pos in table.positions())
+
+    @property
+    def list(self) -> List[KeyValuePair]:
+        """a list of the items ((key, value)-pairs)"""
+        return list(self._iter_items())
+
+    @property
+    def key_list(self) -> List[Key]:
+        """a list of the keys"""
+        return list(self)
+
+    @property
+    def value_list(self) -> List[Value]:
+        """a list of the values"""
+        return list(self._iter_values())
+
+    @property
+    def first(self) -> KeyValuePair:
+        """the first item ((key, value)-pair)"""
+        return self.at(0) if len(self) else None
+
+    @property
+    def first_key(self) -> Key:
+        """the first key"""
+        return self.key_at(0) if len(self) else None
+
+    @property
+    def first_value(self) -> Value:
+        """the first value"""
+        return self.value_at(0) if len(self) else None
+
+    @property
+    def last(self) -> KeyValuePair:
+        """the last item ((key, value)-pair)"""
+        return self.at(len(self) - 1) if len(self) else None
+
+    @property
+    def last_key(self) -> Key:
+        """the last key"""
+        return self.key_at(len(self) - 1) if len(self) else None
+
+    @property
+    def last_value(self) -> Value:
+        """the last value"""
+        return self.value_at(len(self) - 1) if len(self) else None
+
+    @property
+    def enum(self):
+        """(idx, key, value)-tuples"""
+        return ((idx, key, value) for idx, (key, value) in enumerate(self._iter_items()))
+
+    @property
+    def enum_keys(self):
+        """(idx, key)-pairs"""
+        return enumerate(self)
+
+    @property
+    def enum_values(self):
+        """(idx, value)-pairs"""
+        return enumerate(self._iter_values())
+
+    @property
+    def json(self) -> str:
+        """a JSON representation (of all the items, which are loaded into memory)"""
+        state = self._housekeeping()
+        if state.json is None:
+            state.json = self._json_encoder().encode(dict(self._iter_items()))
+        return state.json
+
+    def iter_json(self) -> Iterator[str]:
+        """Yields the JSON representation in chunks (of all the items, which are loaded into memory)"""
+        yield self.json
+
+    def at(self, idx: int) -> KeyValuePair:
+        """the item at the index"""
+        pos = self._table.position_at(idx)
+        return self._table.key(pos), self._table.value(pos)
+
+    def key_at(self, idx: int) -> Key:
+        """the key at the index"""
+        return self._table.key(self._table.position_at(idx))
+
+    def value_at(self, idx: int) -> Value:
+        """the value at the index"""
+        return self._table.value(self._table.position_at(idx))
+
+    def index_of(self, key: Key) -> int:
+        """the index of the key"""
+        return self._table.index_of(key)
+
+
+class StoredItems:
+    """Read-only view of the items of a StoredJdict, used as its data"""
+
+    __slots__ = ("_owner",)
+
+    def __init__(self, owner: StoredJdict):
+        self._owner = owner
+
+    def __len__(self) -> int:
+        return len(self._owner)
+
+    def __iter__(self) -> Iterator[Key]:
+        return iter(self._owner)
+
+    def __contains__(self, key: Key) -> bool:
+        return key in self._owner
+
+    def __getitem__(self, key: Key) -> Value:
+        return self._owner[key]
+
+    def keys(self) -> Iterator[Key]:
+        return iter(self._owner)
+
+    def values(self) -> Iterator[Value]:
+        return self._owner._iter_values()
+
+    def items(self) -> Iterator[KeyValuePair]:
+        return self._owner._iter_items()
+
+    def __or__(self, other) -> dict:
+        if not isinstance(other, (dict, StoredItems)):
+            return NotImplemented
+        merged = dict(self.items())
+        merged.update(other.items())
+        return merged
+
+    def __ror__(self, other) -> dict:
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = dict(other)
+        merged.update(self.items())
+        return merged
@@ -0,0 +1,116 @@
+from typing import Dict, List, Optional
+
+from jdict import Key, KeyValuePair, Value, _identity, jdict
+from jdict._frozen import frozenjdict
+
+
+def _map_tree(data: dict, key_func, value_func) -> dict:
+    """Maps the keys by key_func and the values that aren't dicts by value_func, recursing into the dicts"""
+    return {
+        key_func(key): _map_tree(value, key_func, value_func) if isinstance(value, dict) else value_func(value)
+        for key, value in data.items()
+    }
+
+
+def _map_tree_chunk(key_func, value_func, items: List[KeyValuePair]) -> List[KeyValuePair]:
+    """Maps a chunk of items like _map_tree (in a worker)"""
+    return list(_map_tree(dict(items), key_func, value_func).items())
+
+
+class jtree(jdict):
+    """jdict for nested data, where values that are dicts are returned as jtrees themselves, so that j.a.b.c works
+
+    The nested jtrees are created the first time each sub-dict is accessed (by attribute or by key), cached, and share
+    the sub-dict with the parent instead of copying it. Writes through a nested jtree drop the cached json and series
+    of its parents. Assigning a jdict stores its data, so that the tree is plain dicts all the way down, and json and
+    mapping handle the whole tree in one pass. The list properties (value_list, first etc.) return the plain dicts."""
+
+    __slots__ = ("_parent", "_key", "_children")
+    protected_keys = jdict.protected_keys.union(__slots__)
+
+    def __init__(self, data=None, **kwargs):
+        super().__init__(data, **kwargs)
+        self._parent = None  # type: Optional[jtree]
+        self._key = None
+        self._children = None  # type: Optional[Dict[Key, jtree]]
+
+    def _wrap(self, key: Key, value: Value) -> Value:
+        """Helper: the value, or the cached jtree over it if it is a dict"""
+        if not isinstance(value, dict):
+            return value
+        children = self._children
+        if children is None:
+            children = self._children = {}
+        child = children.get(key)
+        if child is None or child.data is not value:
+            child = self.__class__(value)
+            child._parent = self
+            child._key = key
+            children[key] = child
+        return child
+
+    def _forget(self, key: Key):
+        """Helper: detaches the nested jtree at the key (if any) after its value has been replaced or removed"""
+        if self._children is not None:
+            child = self._children.pop(key, None)
+            if child is not None:
+                child._parent = None
+
+    def _changed(self):
+        """Helper: drops the cached representations of the parents, which include the items of this jtree"""
+        child = self
+        parent = self._parent
+        while parent is not None:
+            parent._drop_derived(child._key)
+            child = parent
+            parent = parent._parent
+
+    def _store(self, key: Key, value: Value):
+        if isinstance(value, jdict):
+            value = value.data
+        super()._store(key, value)
+        self._forget(key)
+        self._changed()
+
+    def _discard(self, key: Key, idx: Optional[int] = None) -> Value:
+        value = super()._discard(key, idx)
+        self._forget(key)
+        self._changed()
+        return value
+
+    def clear(self):
+        super().clear()
+        for child in (self._children or {}).values():
+            child._parent = None
+        self._children = None
+        self._changed()
+
+    def _reorder(self, items: List[KeyValuePair]):
+        super()._reorder(items)
+        self._changed()
+
+    def __getitem__(self, key: Key) -> Value:
+        try:
+            return self._wrap(key, self.data[key])
+        except (KeyError, TypeError):
+            return self._slice_or_raise(key)
+
+    def copy(self):
+        """a copy of the whole tree of dicts (but not of the other values)"""
+        return self.mapping()
+
+    __copy__ = copy
+
+    def snapshot(self) -> frozenjdict:
+        """a frozenjdict with a copy of the whole tree of dicts, like copy
+
+        The nested dicts are shared with the nested jtrees, which modify them in place, so they can't be shared with
+        the snapshot as well."""
+        return frozenjdict._wrap(_map_tree(self.data, _identity, _identity))
+
+    def mapping(self, key_func=_identity, value_func=_identity, executor=None, chunksize: Optional[int] = None):
+        """Maps the keys by key_func and the values by value_func throughout the tree: dicts are mapped recursively
+        instead of being passed to value_func. With an executor, the top-level items are mapped in chunks."""
+        if executor is not None:
+            return self.__class__(self._chunked(executor, chunksize, _map_tree_chunk, key_func, value_func).data)
+        return self.__class__(_map_tree(self.data, key_func, value_func))
@@ -0,0 +1,69 @@
+from collections.abc import Sequence
+from typing import Iterator, Sequence as SequenceType
+
+from jdict import jdict
+
+
+class PositionView(Sequence):
+    """Read-only view of the items (or only the values) of a jdict at a sequence of positions
+
+    Nothing is copied: each item is read from the jdict by position when it is accessed, so the view follows changes to
+    the jdict, and must not be used after the jdict has shrunk below the positions. Reading by position is O(1) for
+    the cached key_list (which is built when the view is created) or with an index. Use to_jdict() or to_numpy() to
+    materialize the view."""
+
+    __slots__ = ("_source", "_positions", "_values_only")
+
+    def __init__(self, source: jdict, positions: SequenceType[int], values_only: bool = False):
+        size = len(source)
+        if isinstance(positions, range):
+            bounds = (positions[0], positions[-1]) if positions else ()
+        else:
+            bounds = positions
+        for pos in bounds:
+            if not 0 <= pos < size:
+                raise IndexError(pos)
+        if not source.has_position_index:
+            # Makes at() O(1) for as long as the cached list is valid
+            source.key_list
+        self._source = source
+        self._positions = positions
+        self._values_only = values_only
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return PositionView(self._source, self._positions[idx], self._values_only)
+        if self._values_only:
+            return self._source.value_at(self._positions[idx])
+        return self._source.at(self._positions[idx])
+
+    def __iter__(self) -> Iterator:
+        if self._values_only:
+            return map(self._source.value_at, self._positions)
+        return map(self._source.at, self._positions)
+
+    def __repr__(self) -> str:
+        return f"PositionView({list(self)!r})"
+
+    def to_jdict(self) -> jdict:
+        """a jdict with the items"""
+        return jdict(dict(map(self._source.at, self._positions)))
+
+    def to_numpy(self, dtype=None):
+        """a NumPy array of the values (a view of the array rather than a copy if the jdict is a jarray and the
+        positions are a slice)"""
+        import numpy as np
+
+        values = self._source.value_list
+        if not isinstance(values, np.ndarray):
+            return np.array(list(map(self._source.value_at, self._positions)), dtype=dtype)
+        positions = self._positions
+        if isinstance(positions, range):
+            stop = positions.stop if positions.stop >= 0 else None
+            result = values[positions.start : stop : positions.step]
+        else:
+            result = values[np.asarray(positions, dtype=np.intp)]
+        return result if dtype is None else result.astype(dtype, copy=False)
@@ -0,0 +1,161 @@
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from jdict import jarray, jdict
+
+
+@pytest.fixture
+def nonempty():
+    return jarray(x=3.0, y=4.0, z=5.0)
+
+
+@pytest.fixture
+def empty():
+    return jarray()
+
+
+def test_constructors(nonempty, empty):
+    assert isinstance(nonempty, jdict)
+    assert nonempty == {"x": 3.0, "y": 4.0, "z": 5.0}
+    assert len(empty) == 0
+    assert jarray({"x": 1, "y": 2}).dtype == np.int64
+    assert jarray({"x": 1, "y": 2}, dtype=np.float32).dtype == np.float32
+    assert empty.dtype == np.float64
+
+
+def test_access(nonempty, empty):
+    assert nonempty.x == 3.0
+    assert nonempty["y"] == 4.0
+    assert "z" in nonempty
+    assert "w" not in nonempty
+    with pytest.raises(AttributeError):
+        nonempty.w
+    with pytest.raises(KeyError):
+        nonempty["w"]
+
+    assert nonempty.first == ("x", 3.0)
+    assert nonempty.last == ("z", 5.0)
+    assert nonempty.first_value == 3.0
+    assert nonempty.last_key == "z"
+    assert nonempty.at(1) == ("y", 4.0)
+    assert nonempty.index_of("z") == 2
+    with pytest.raises(IndexError):
+        nonempty.at(3)
+    assert empty.first is None
+    assert empty.last is None
+
+
+def test_value_list_is_a_view(nonempty):
+    values = nonempty.value_list
+    assert isinstance(values, np.ndarray)
+    values[0] = 30.0
+    assert nonempty.x == 30.0
+    assert nonempty.value_list.base is values.base
+
+
+def test_writes(nonempty):
+    nonempty.y = 40
+    for idx in range(20):
+        nonempty[f"k{idx}"] = idx
+    assert nonempty.y == 40.0
+    assert len(nonempty) == 23
+    assert nonempty.last == ("k19", 19.0)
+
+    assert nonempty.pop_first() == ("x", 3.0)
+    del nonempty["k0"]
+    assert nonempty.pop_last() == ("k19", 19.0)
+    assert nonempty.key_list == ["y", "z"] + [f"k{idx}" for idx in range(1, 19)]
+    assert nonempty.index_of("k1") == 2
+    assert nonempty.list[:3] == [("y", 40.0), ("z", 5.0), ("k1", 1.0)]
+
+    nonempty.clear()
+    assert len(nonempty) == 0
+
+
+def test_vectorized_mapping(nonempty):
+    assert nonempty.value_mapping(np.sqrt) == jdict(x=3.0 ** 0.5, y=2.0, z=5.0 ** 0.5)
+    assert nonempty.mapping(lambda k: k * 2, lambda v: v * 2) == jdict(xx=6.0, yy=8.0, zz=10.0)
+    assert nonempty.key_mapping(lambda k: "same").list == [("same", 5.0)]
+    assert isinstance(nonempty.value_mapping(np.negative), jarray)
+
+
+def test_vectorized_select(nonempty):
+    assert nonempty.value_select(lambda v: v > 3) == jdict(y=4.0, z=5.0)
+    assert nonempty.select(lambda k: k != "z", lambda v: v > 3) == jdict(y=4.0)
+    assert nonempty.key_select(lambda k: k == "x").list == [("x", 3.0)]
+    assert len(nonempty.value_select(lambda v: v > 100)) == 0
+
+
+def test_serialization(nonempty):
+    assert nonempty.json == '{"x": 3.0, "y": 4.0, "z": 5.0}'
+    assert list(nonempty.series) == [3.0, 4.0, 5.0]
+
+
+def test_pickle_and_deepcopy():
+    ints = jarray({"x": 1, "y": 2}, dtype=np.int32)
+    ints.z = 3
+    for restored in (pickle.loads(pickle.dumps(ints)), copy.deepcopy(ints)):
+        assert isinstance(restored, jarray)
+        assert restored.dtype == np.int32
+        assert restored.list == [("x", 1), ("y", 2), ("z", 3)]
+        restored.w = 4
+        assert len(restored) == 4
+        assert "w" not in ints
+
+
+def test_copy(nonempty):
+    copied = nonempty.copy()
+    copied.x = 30
+    copied.w = 6
+    assert nonempty.list == [("x", 3.0), ("y", 4.0), ("z", 5.0)]
+
+
+def test_value_mapping_shares_keys_until_changed(nonempty):
+    doubled = nonempty.value_mapping(lambda v: v * 2)
+    assert doubled.key_list is nonempty.key_list
+
+    doubled.w = 12
+    nonempty.pop_first()
+    assert doubled.list == [("x", 6.0), ("y", 8.0), ("z", 10.0), ("w", 12.0)]
+    assert nonempty.list == [("y", 4.0), ("z", 5.0)]
+    assert nonempty.index_of("z") == 1
+    assert doubled.index_of("z") == 2
+
+
+def test_mapping_does_not_alias_values(nonempty):
+    same = nonempty.value_mapping(lambda v: v)
+    same.x = 30
+    assert nonempty.x == 3.0
+
+
+def test_top_k_and_sort(nonempty):
+    assert nonempty.top_k(2).list == [("z", 5.0), ("y", 4.0)]
+    nonempty.sort_by_value(reverse=True)
+    assert nonempty.key_list == ["z", "y", "x"]
+    assert nonempty.value_list.tolist() == [5.0, 4.0, 3.0]
+    assert nonempty.x == 3.0
+    assert nonempty.dtype == np.float64
+
+
+def test_value_index(nonempty):
+    nonempty.enable_value_index()
+    nonempty.w = 3
+    nonempty.y = 5
+    del nonempty["z"]
+    assert nonempty.group_by() == {3.0: ["x", "w"], 5.0: ["y"]}
+
+
+def test_value_index_uses_stored_values():
+    ints = jarray({"x": 1, "y": 2}).enable_value_index()
+    ints.x = 2.7
+    ints.z = 3.9
+    assert ints.x == 2
+    assert ints.group_by() == {2: ["y", "x"], 3: ["z"]}
+    del ints["x"]
+    assert ints.keys_of(2) == ["y"]
+    with pytest.raises(KeyError):
+        del ints["w"]
+    assert ints.list == [("y", 2), ("z", 3)]
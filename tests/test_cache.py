@@ -0,0 +1,150 @@
+import pytest
+
+from jdict import CacheInfo, jcache, jdict
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_is_jdict():
+    cache = jcache(2, data={"x": 3})
+    assert isinstance(cache, jdict)
+    assert cache.x == 3
+    assert cache.first == ("x", 3)
+
+
+def test_invalid_settings():
+    with pytest.raises(ValueError):
+        jcache(0)
+    with pytest.raises(ValueError):
+        jcache(2, policy="random")
+
+
+def test_lru_eviction():
+    cache = jcache(2)
+    cache["x"] = 3
+    cache["y"] = 4
+    assert cache["x"] == 3
+    cache["z"] = 5
+    assert cache.key_list == ["x", "z"]
+    assert "y" not in cache
+
+
+def test_lru_write_counts_as_use():
+    cache = jcache(2, data={"x": 3, "y": 4})
+    cache.x = 30
+    cache.z = 5
+    assert cache.list == [("x", 30), ("z", 5)]
+
+
+def test_fifo_eviction():
+    cache = jcache(2, policy="fifo")
+    cache["x"] = 3
+    cache["y"] = 4
+    assert cache.x == 3
+    cache["z"] = 5
+    assert cache.key_list == ["y", "z"]
+
+
+def test_counters_and_callback():
+    evicted = []
+    cache = jcache(1, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.x = 3
+    assert cache.x == 3
+    assert cache.get("y") is None
+    with pytest.raises(AttributeError):
+        cache.y
+    cache.y = 4
+    assert evicted == [("x", 3)]
+    assert cache.cache_info() == CacheInfo(hits=1, misses=2, evictions=1, maxsize=1, currsize=1)
+
+
+def test_ttl():
+    timer = FakeTimer()
+    evicted = []
+    cache = jcache(10, ttl=5, timer=timer, on_evict=lambda key, value: evicted.append(key))
+    cache.x = 3
+    timer.now = 3
+    cache.y = 4
+    timer.now = 6
+    assert "x" not in cache
+    assert "y" in cache
+    with pytest.raises(KeyError):
+        cache["x"]
+    assert cache.misses == 1
+    assert evicted == ["x"]
+
+    timer.now = 9
+    assert cache.expire() == 1
+    assert len(cache) == 0
+    assert evicted == ["x", "y"]
+
+
+def test_position_index_follows_recency():
+    cache = jcache(3, data={"x": 3, "y": 4, "z": 5}).enable_position_index()
+    cache.x
+    assert [cache.key_at(idx) for idx in cache.range] == ["y", "z", "x"]
+    assert cache.index_of("x") == 2
+
+
+def test_copy():
+    cache = jcache(2, policy="fifo", data={"x": 3})
+    cache.x
+    copied = cache.copy()
+    copied.y = 4
+    copied.z = 5
+    assert copied.maxsize == 2
+    assert copied.policy == "fifo"
+    assert copied.hits == 0
+    assert cache.key_list == ["x"]
+    assert copied.key_list == ["y", "z"]
+
+
+def test_bulk_reads_do_not_count_or_touch():
+    cache = jcache(3, data={"x": 3, "y": 4, "z": 5})
+    assert list(cache.items()) == [("x", 3), ("y", 4), ("z", 5)]
+    assert list(cache.values()) == [3, 4, 5]
+    assert cache == {"x": 3, "y": 4, "z": 5}
+    assert dict(cache.items()) == {"x": 3, "y": 4, "z": 5}
+    assert cache.key_list == ["x", "y", "z"]
+    assert cache.cache_info().hits == 0
+
+    cache.get("x")
+    assert cache.key_list == ["y", "z", "x"]
+    assert cache.cache_info().hits == 1
+
+
+def test_only_lookups_check_ttl():
+    timer = FakeTimer()
+    cache = jcache(3, ttl=5, data={"x": 3}, timer=timer)
+    timer.now = 3
+    cache.y = 4
+    timer.now = 6
+    assert len(cache) == 2
+    assert cache.key_list == ["x", "y"]
+    assert list(cache.items()) == [("x", 3), ("y", 4)]
+    assert cache == {"x": 3, "y": 4}
+    assert "x" not in cache
+    assert cache.get("x") is None
+    assert len(cache) == 1
+    assert list(cache.items()) == [("y", 4)]
+
+
+def test_merge():
+    evicted = []
+    cache = jcache(2, on_evict=lambda key, value: evicted.append(key), data={"x": 3, "y": 4})
+    merged = cache | {"z": 5}
+    assert isinstance(merged, jcache)
+    assert merged.maxsize == 2
+    assert merged.list == [("y", 4), ("z", 5)]
+    assert ({"z": 5, "w": 6} | cache).list == [("x", 3), ("y", 4)]
+    assert (jdict(w=6) | cache).list == [("x", 3), ("y", 4)]
+    assert cache.list == [("x", 3), ("y", 4)]
+    assert evicted == []
+    merged.w = 6
+    assert evicted == ["y"]
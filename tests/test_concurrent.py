@@ -0,0 +1,173 @@
+import threading
+
+import pytest
+
+from jdict import frozenjdict, jconcurrent, jdict
+
+
+@pytest.fixture
+def conc():
+    return jconcurrent(x=3, y=4, z=5)
+
+
+def test_is_jdict(conc):
+    assert isinstance(conc, jdict)
+    assert conc == {"x": 3, "y": 4, "z": 5}
+    assert conc == jconcurrent(x=3, y=4, z=5)
+    assert repr(conc) == "jconcurrent({'x': 3, 'y': 4, 'z': 5})"
+
+
+def test_access(conc):
+    assert conc.x == 3
+    assert conc["y"] == 4
+    assert "z" in conc
+    assert len(conc) == 3
+    assert list(conc) == ["x", "y", "z"]
+    assert conc.first == ("x", 3)
+    assert conc.last == ("z", 5)
+    assert conc.at(1) == ("y", 4)
+    assert conc.index_of("z") == 2
+    assert conc.key_list == ["x", "y", "z"]
+    assert conc.json == '{"x": 3, "y": 4, "z": 5}'
+    assert conc.value_mapping(str) == {"x": "3", "y": "4", "z": "5"}
+    with pytest.raises(AttributeError):
+        conc.w
+
+
+def test_writes(conc):
+    conc.w = 6
+    conc["x"] = 7
+    del conc["y"]
+    assert conc == {"x": 7, "z": 5, "w": 6}
+    assert conc.pop("z") == 5
+    assert conc.pop("z", None) is None
+    with pytest.raises(KeyError):
+        conc.pop("z")
+    assert conc.setdefault("v", 8) == 8
+    assert conc.setdefault("v", 9) == 8
+    assert conc.pop_first() == ("x", 7)
+    assert conc.pop_last() == ("v", 8)
+    conc.update(a=1, b=2)
+    conc |= {"c": 3}
+    assert conc.key_list == ["w", "a", "b", "c"]
+    conc.clear()
+    assert conc == {}
+
+
+def test_data_is_read_only(conc):
+    with pytest.raises(TypeError):
+        conc.data["x"] = 6
+
+
+def test_batch(conc):
+    with conc.batch() as draft:
+        draft.x += 1
+        draft.w = 6
+        assert conc == {"x": 3, "y": 4, "z": 5}
+    assert conc == {"x": 4, "y": 4, "z": 5, "w": 6}
+
+
+def test_batch_with_exception_is_not_published(conc):
+    with pytest.raises(ValueError):
+        with conc.batch() as draft:
+            draft.x = 6
+            raise ValueError
+    assert conc.x == 3
+    conc.x = 7
+    assert conc.x == 7
+
+
+def test_sort_publishes_one_version(conc):
+    snapshot = conc.snapshot()
+    conc.sort_by_value(reverse=True)
+    assert conc.key_list == ["z", "y", "x"]
+    assert snapshot.key_list == ["x", "y", "z"]
+    conc.sort_by_key()
+    assert conc.key_list == ["x", "y", "z"]
+    conc.move_to("z", 0)
+    conc.swap(1, 2)
+    conc.insert_at(1, "w", 6)
+    conc.move_to_end("z")
+    assert conc.key_list == ["w", "y", "x", "z"]
+    assert conc.top_k(1) == {"w": 6}
+
+
+def test_value_index(conc):
+    conc.enable_value_index(lambda value: value % 2)
+    assert conc.has_value_index
+    assert conc.snapshot().has_value_index
+    conc.w = 7
+    assert conc.keys_of(1) == ["x", "z", "w"]
+    assert conc.count_of(0) == 1
+    assert conc.group_by() == {1: ["x", "z", "w"], 0: ["y"]}
+    conc.disable_value_index()
+    assert not conc.snapshot().has_value_index
+    assert conc.keys_of(4) == ["y"]
+
+
+def test_slices_read_one_version(conc):
+    view = conc[1:]
+    conc.y = 40
+    assert list(view) == [("y", 4), ("z", 5)]
+    assert list(conc.values_at([1])) == [40]
+
+
+def test_snapshot_and_copy(conc):
+    snapshot = conc.snapshot()
+    assert isinstance(snapshot, frozenjdict)
+    copied = conc.copy()
+    conc.x = 6
+    assert snapshot == {"x": 3, "y": 4, "z": 5}
+    assert copied == {"x": 3, "y": 4, "z": 5}
+    copied.y = 7
+    assert conc == {"x": 6, "y": 4, "z": 5}
+
+
+def test_json_encoder(conc):
+    class Encoder:
+        def encode(self, obj):
+            return "encoded"
+
+        def iterencode(self, obj):
+            yield "encoded"
+
+    conc.set_json_encoder(Encoder())
+    assert conc.json == "encoded"
+    conc.w = 6
+    assert conc.json == "encoded"
+
+
+def test_readers_see_one_version():
+    conc = jconcurrent(k0=0)
+    done = threading.Event()
+    errors = []
+
+    def write():
+        for n in range(1, 500):
+            conc[f"k{n}"] = n
+            with conc.batch() as draft:
+                draft.k0 = -n
+                draft.total = n
+        done.set()
+
+    def read():
+        while not done.is_set():
+            key, value = conc.last
+            if key != "total" and key != f"k{value}":
+                errors.append(("last", key, value))
+            snapshot = conc.snapshot()
+            if "total" in snapshot and snapshot.k0 != -snapshot.total:
+                errors.append(("batch", snapshot.k0, snapshot.total))
+            keys = conc.key_list
+            expected = [f"k{n}" for n in range(len(keys) - ("total" in keys))]
+            if [key for key in keys if key != "total"] != expected:
+                errors.append(("key_list", keys))
+
+    readers = [threading.Thread(target=read) for _ in range(3)]
+    for reader in readers:
+        reader.start()
+    write()
+    for reader in readers:
+        reader.join()
+    assert errors == []
+    assert len(conc) == 501
@@ -0,0 +1,149 @@
+import random
+
+import pytest
+
+from jdict import jdict, jfile
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "table")
+
+
+@pytest.fixture
+def nonempty(path):
+    table = jfile(path)
+    table.update({"x": 3, "y": [4], "z": {"five": 5}})
+    yield table
+    table.close()
+
+
+def test_is_jdict(nonempty):
+    assert isinstance(nonempty, jdict)
+    assert nonempty == {"x": 3, "y": [4], "z": {"five": 5}}
+
+
+def test_access(nonempty):
+    assert nonempty.x == 3
+    assert nonempty["y"] == [4]
+    assert "z" in nonempty
+    assert "w" not in nonempty
+    with pytest.raises(AttributeError):
+        nonempty.w
+    assert nonempty.get("w") is None
+
+    assert nonempty.first == ("x", 3)
+    assert nonempty.last_key == "z"
+    assert nonempty.at(1) == ("y", [4])
+    assert nonempty.index_of("z") == 2
+    assert nonempty.key_list == ["x", "y", "z"]
+    assert nonempty.json == '{"x": 3, "y": [4], "z": {"five": 5}}'
+    with pytest.raises(IndexError):
+        nonempty.at(3)
+
+
+def test_empty(path):
+    with jfile(path) as table:
+        assert len(table) == 0
+        assert table.first is None
+        assert table.last is None
+        with pytest.raises(IndexError):
+            table.pop_first()
+
+
+def test_persistence(nonempty, path):
+    nonempty.x = 30
+    nonempty.w = 6
+    nonempty.pop_first()
+    nonempty.close()
+
+    with jfile(path) as reopened:
+        assert reopened.list == [("y", [4]), ("z", {"five": 5}), ("w", 6)]
+
+
+def test_mapping_and_select(nonempty):
+    assert nonempty.key_mapping(lambda k: k * 2) == jdict(xx=3, yy=[4], zz={"five": 5})
+    assert nonempty.key_select(lambda k: k != "y") == jdict(x=3, z={"five": 5})
+    assert nonempty.copy() == jdict(x=3, y=[4], z={"five": 5})
+
+
+def test_keys_are_found_by_equality(path):
+    key = "".join(["a", "1"])
+    with jfile(path) as table:
+        table[(key, key)] = 1
+        assert table[("a" + str(1), "a" + str(1))] == 1
+        assert ("a1", "".join(["a", "1"])) in table
+
+
+def test_merge_and_datarow(nonempty):
+    assert nonempty | {"w": 6} == jdict(x=3, y=[4], z={"five": 5}, w=6)
+    assert type(nonempty | {"w": 6}) is jdict
+    assert ({"x": 1, "w": 6} | nonempty).key_list == ["x", "w", "y", "z"]
+    assert (jdict(x=1) | nonempty).x == 3
+    datarow = nonempty.datarow
+    assert list(datarow.columns) == ["x", "y", "z"]
+    assert len(datarow) == 1
+    assert datarow.x[0] == 3
+
+
+def test_compact(nonempty, path):
+    for idx in range(100):
+        nonempty.x = idx
+    del nonempty["y"]
+    size_before = nonempty._table.log_end
+    nonempty.compact()
+    assert nonempty._table.log_end < size_before
+    assert nonempty.list == [("x", 99), ("z", {"five": 5})]
+    assert nonempty.at(1) == ("z", {"five": 5})
+
+
+def test_not_a_jfile(tmp_path):
+    path = tmp_path / "other"
+    path.write_bytes(b"something else" * 1000)
+    for suffix in (".ord", ".idx"):
+        (tmp_path / ("other" + suffix)).write_bytes(b"\0" * 4096)
+    with pytest.raises(ValueError):
+        jfile(str(path))
+
+
+def test_matches_jdict(path):
+    rng = random.Random(0)
+    table = jfile(path)
+    reference = jdict()
+    for step in range(3000):
+        action = rng.random()
+        if action < 0.5:
+            key = rng.randrange(300)
+            table[key] = step
+            reference[key] = step
+        elif action < 0.7 and reference:
+            key = rng.choice(reference.key_list)
+            del table[key]
+            del reference[key]
+        elif action < 0.8 and reference:
+            assert table.pop_first() == reference.pop_first()
+        elif action < 0.9 and reference:
+            assert table.pop_last() == reference.pop_last()
+        elif action < 0.92:
+            table.compact()
+        elif action < 0.94:
+            table.close()
+            table = jfile(path)
+
+        assert len(table) == len(reference)
+        if reference:
+            idx = rng.randrange(len(reference))
+            assert table.at(idx) == reference.at(idx)
+            assert table.index_of(reference.key_at(idx)) == idx
+    assert table.list == reference.list
+    table.close()
+
+
+def test_value_index(nonempty):
+    nonempty.enable_value_index(type)
+    nonempty.w = 6
+    nonempty.y = "four"
+    del nonempty["x"]
+    assert nonempty.group_by() == {str: ["y"], dict: ["z"], int: ["w"]}
+    nonempty.clear()
+    assert nonempty.count_of(int) == 0
@@ -0,0 +1,148 @@
+import pytest
+
+from jdict import frozenjdict, jcache, jdict, jfile, jqueue, jrecord, jshared, jtree
+
+
+@pytest.fixture
+def frozen():
+    return frozenjdict(x=3, y=4, z=5)
+
+
+def test_is_jdict(frozen):
+    assert isinstance(frozen, jdict)
+    assert frozen == {"x": 3, "y": 4, "z": 5}
+    assert repr(frozen) == "frozenjdict({'x': 3, 'y': 4, 'z': 5})"
+
+
+def test_access(frozen):
+    assert frozen.x == 3
+    assert frozen.first == ("x", 3)
+    assert frozen.last == ("z", 5)
+    assert frozen.at(1) == ("y", 4)
+    assert frozen.key_list == ["x", "y", "z"]
+    assert frozen.json == '{"x": 3, "y": 4, "z": 5}'
+
+
+def test_copies_the_dict():
+    data = {"x": 3}
+    frozen = frozenjdict(data)
+    hashed = hash(frozen)
+    data["y"] = 4
+    assert frozen == {"x": 3}
+    assert hash(frozen) == hashed == hash(frozenjdict(x=3))
+
+
+def test_immutable(frozen):
+    with pytest.raises(TypeError):
+        frozen.w = 6
+    with pytest.raises(TypeError):
+        frozen["x"] = 6
+    with pytest.raises(TypeError):
+        del frozen["x"]
+    with pytest.raises(TypeError):
+        frozen.update(w=6)
+    with pytest.raises(TypeError):
+        frozen.pop_last()
+    with pytest.raises(TypeError):
+        frozen.clear()
+    with pytest.raises(TypeError):
+        frozen.sort_by_key()
+    assert frozen == {"x": 3, "y": 4, "z": 5}
+    assert frozen.copy() is frozen
+
+
+def test_hash(frozen):
+    same = frozenjdict(z=5, y=4, x=3)
+    assert hash(frozen) == hash(same)
+    assert frozen == same
+    assert hash(frozen) == frozen._hash
+    assert {frozen: "value"}[same] == "value"
+    assert hash(frozenjdict(x=3)) != hash(frozen)
+    with pytest.raises(TypeError):
+        hash(frozenjdict(x=[3]))
+
+
+def test_thaw(frozen):
+    thawed = frozen.thaw()
+    thawed.w = 6
+    assert type(thawed) is jdict
+    assert frozen == {"x": 3, "y": 4, "z": 5}
+
+
+def test_snapshot_shares_until_modified():
+    j = jdict(x=3, y=4)
+    snapshot = j.snapshot()
+    assert isinstance(snapshot, frozenjdict)
+    assert snapshot.data is j.data
+    assert j.snapshot() is snapshot
+    j.z = 5
+    assert snapshot == {"x": 3, "y": 4}
+    assert j == {"x": 3, "y": 4, "z": 5}
+    assert snapshot.data is not j.data
+
+    again = j.snapshot()
+    assert again is not snapshot
+    del j["x"]
+    assert again == {"x": 3, "y": 4, "z": 5}
+    newest = j.snapshot()
+    j.clear()
+    assert newest == {"y": 4, "z": 5}
+    assert snapshot.snapshot() is snapshot
+
+
+def test_snapshot_keeps_caches_and_index():
+    j = jdict(x=3, y=4).enable_position_index()
+    assert j.key_list == ["x", "y"]
+    snapshot = j.snapshot()
+    j.z = 5
+    j.pop_first()
+    assert j.key_list == ["y", "z"]
+    assert j.at(1) == ("z", 5)
+    assert snapshot.key_list == ["x", "y"]
+
+
+@pytest.mark.parametrize("cls", [jqueue, jtree, jrecord])
+def test_snapshot_of_subclasses(cls):
+    j = cls({"x": 3, "y": 4})
+    snapshot = j.snapshot()
+    j.z = 5
+    del j["x"]
+    assert snapshot == {"x": 3, "y": 4}
+    assert j.snapshot() == {"y": 4, "z": 5}
+
+
+def test_snapshot_of_cache():
+    cache = jcache(2, data={"x": 3, "y": 4})
+    snapshot = cache.snapshot()
+    cache.x
+    cache.z = 5
+    assert snapshot.list == [("x", 3), ("y", 4)]
+    assert cache.list == [("x", 3), ("z", 5)]
+
+
+def test_snapshot_of_nested_tree():
+    tree = jtree({"a": {"b": 1}})
+    nested = tree.a
+    snapshot = nested.snapshot()
+    nested.b = 2
+    assert tree.a.b == 2
+    assert tree == {"a": {"b": 2}}
+    assert snapshot == {"b": 1}
+
+    snapshot = tree.snapshot()
+    tree.a.c = 3
+    assert snapshot == {"a": {"b": 2}}
+
+
+def test_snapshot_of_stored(tmp_path):
+    with jfile(str(tmp_path / "table")) as table:
+        table.update({"x": 3, "y": 4})
+        snapshot = table.snapshot()
+        table.z = 5
+        assert snapshot == {"x": 3, "y": 4}
+
+
+def test_snapshot_of_shared():
+    pytest.importorskip("multiprocessing.shared_memory")
+    with jshared.freeze(jdict(x=3, y=4)) as shared:
+        assert shared.snapshot() == {"x": 3, "y": 4}
@@ -1,7 +1,15 @@
+import asyncio
+import collections.abc
+import copy
+import io
+import json
+import pickle
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pandas as pd
 import pytest
 
-from jdict import jdict
+from jdict import jarray, jcache, jdict, jordered, jqueue, jrecord, jsorted, jtree
 
 
 @pytest.fixture
@@ -58,6 +66,58 @@ def test_getattr(empty, nonempty):
         nonempty.w
 
 
+def test_getattr_miss_has_no_chained_exception(nonempty):
+    with pytest.raises(AttributeError) as info:
+        nonempty.w
+    assert info.value.__cause__ is None
+    assert info.value.__context__ is None
+
+
+def test_setitem_goes_through_overridden_store():
+    class Upper(jdict):
+        __slots__ = ()
+
+        def _store(self, key, value):
+            super()._store(key.upper(), value)
+
+    upper = Upper()
+    upper["x"] = 3
+    assert upper.data == {"X": 3}
+
+
+def test_getattr_goes_through_overridden_getitem():
+    class Doubled(jdict):
+        __slots__ = ()
+
+        def __getitem__(self, key):
+            return 2 * self.data[key]
+
+    class Tripled(Doubled):
+        __slots__ = ()
+
+        def __getitem__(self, key):
+            return 3 * self.data[key]
+
+    assert Doubled(x=3).x == 6
+    assert Tripled(x=3).x == 9
+    with pytest.raises(AttributeError):
+        Tripled(x=3).y
+
+
+def test_protected_keys():
+    assert isinstance(jdict.protected_keys, frozenset)
+    assert "data" in jdict.protected_keys
+
+
+def test_pickle(nonempty):
+    nonempty.key_list
+    unpickled = pickle.loads(pickle.dumps(nonempty))
+    assert unpickled == nonempty
+    unpickled.w = 6
+    assert unpickled.key_list == ["x", "y", "z", "w"]
+    assert copy.deepcopy(nonempty) == nonempty
+
+
 def test_setattr(empty, nonempty):
     with pytest.raises(AttributeError):
         empty.x
@@ -425,3 +485,684 @@ def test_key_select():
 
 def test_value_select():
     assert jdict(x=3, y=4, z=5).value_select(lambda v: v != 4) == jdict(x=3, z=5)
+
+
+def test_index_of(empty, nonempty):
+    assert nonempty.index_of("x") == 0
+    assert nonempty.index_of("y") == 1
+    assert nonempty.index_of("z") == 2
+
+    with pytest.raises(KeyError):
+        empty.index_of("x")
+    with pytest.raises(KeyError):
+        nonempty.index_of("w")
+
+
+def test_position_index(empty, nonempty):
+    assert not nonempty.has_position_index
+    assert nonempty.enable_position_index() is nonempty
+    assert nonempty.has_position_index
+    assert empty.enable_position_index().has_position_index
+
+    assert nonempty.at(0) == ("x", 3)
+    assert nonempty.key_at(2) == "z"
+    assert nonempty.index_of("y") == 1
+
+    nonempty.w = 6
+    nonempty["v"] = 7
+    del nonempty["x"]
+    nonempty.pop_first()
+    nonempty += jdict(u=8)
+    assert [nonempty.key_at(idx) for idx in nonempty.range] == ["z", "w", "v", "u"]
+    assert [nonempty.index_of(key) for key in nonempty] == [0, 1, 2, 3]
+
+    with pytest.raises(IndexError):
+        nonempty.at(-1)
+    with pytest.raises(IndexError):
+        nonempty.at(4)
+    with pytest.raises(IndexError):
+        empty.at(0)
+    with pytest.raises(KeyError):
+        nonempty.index_of("x")
+
+    assert not nonempty.disable_position_index().has_position_index
+    assert nonempty.at(0) == ("z", 5)
+
+
+def test_position_index_many_keys():
+    big = jdict({str(idx): idx for idx in range(5000)}).enable_position_index()
+    for idx in range(0, 5000, 3):
+        del big[str(idx)]
+    for idx in range(5000, 6000):
+        big[str(idx)] = idx
+    for _ in range(100):
+        big.pop_last()
+
+    expected = list(big.data)
+    assert [big.key_at(idx) for idx in big.range] == expected
+    assert [big.index_of(key) for key in expected] == list(big.range)
+
+
+def test_caches_patched_in_place(nonempty):
+    keys, values, items = nonempty.key_list, nonempty.value_list, nonempty.list
+
+    nonempty.w = 6
+    nonempty.w = 7
+    nonempty.x = 1
+    assert nonempty.pop_last() == ("w", 7)
+    assert nonempty.pop_first() == ("x", 1)
+    nonempty.v = 8
+
+    assert nonempty.key_list is keys
+    assert nonempty.value_list is values
+    assert nonempty.list is items
+    assert keys == ["y", "z", "v"]
+    assert values == [4, 5, 8]
+    assert items == [("y", 4), ("z", 5), ("v", 8)]
+    assert nonempty.last_value == 8
+
+
+def test_caches_after_overwrite_in_middle(nonempty):
+    nonempty.key_list, nonempty.value_list, nonempty.list
+    nonempty.y = 40
+    assert nonempty.key_list == ["x", "y", "z"]
+    assert nonempty.value_list == [3, 40, 5]
+    assert nonempty.list == [("x", 3), ("y", 40), ("z", 5)]
+
+    nonempty.enable_position_index()
+    nonempty.y = 400
+    assert nonempty.value_list == [3, 400, 5]
+    assert nonempty.list == [("x", 3), ("y", 400), ("z", 5)]
+
+
+def _set_attr(j):
+    j.w = 6
+
+
+def _overwrite_attr(j):
+    j.y = 40
+
+
+def _set_item(j):
+    j["w"] = 6
+
+
+def _overwrite_item(j):
+    j["y"] = 40
+
+
+def _del_item(j):
+    del j["y"]
+
+
+def _pop(j):
+    j.pop("y")
+
+
+def _popitem(j):
+    j.popitem()
+
+
+def _update(j):
+    j.update({"y": 40, "w": 6})
+
+
+def _setdefault(j):
+    j.setdefault("w", 6)
+
+
+def _iadd(j):
+    j += jdict(y=40, w=6)
+
+
+def _ior(j):
+    j |= {"y": 40, "w": 6}
+
+
+def _clear(j):
+    j.clear()
+
+
+def _pop_first(j):
+    j.pop_first()
+
+
+def _pop_last(j):
+    j.pop_last()
+
+
+def _sort_by_value(j):
+    j.sort_by_value(reverse=True)
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        _set_attr,
+        _overwrite_attr,
+        _set_item,
+        _overwrite_item,
+        _del_item,
+        _pop,
+        _popitem,
+        _update,
+        _setdefault,
+        _iadd,
+        _ior,
+        _clear,
+        _pop_first,
+        _pop_last,
+        _sort_by_value,
+    ],
+)
+@pytest.mark.parametrize("indexed", [False, True])
+def test_caches_consistent_after_mutation(nonempty, mutate, indexed):
+    if indexed:
+        nonempty.enable_position_index()
+    nonempty.key_list, nonempty.value_list, nonempty.list
+
+    mutate(nonempty)
+
+    expected = list(nonempty.data.items())
+    assert nonempty.list == expected
+    assert nonempty.key_list == [key for key, _ in expected]
+    assert nonempty.value_list == [value for _, value in expected]
+    assert nonempty.last == (expected[-1] if expected else None)
+    assert [nonempty.at(idx) for idx in nonempty.range] == expected
+
+
+@pytest.mark.parametrize("cls", [jdict, jqueue, jtree, jrecord, jarray, jordered, lambda data: jcache(10, data=data)])
+@pytest.mark.parametrize("indexed", [False, True])
+def test_insert_and_move(in_data, cls, indexed):
+    nonempty = cls(in_data)
+    if indexed:
+        nonempty.enable_position_index()
+    nonempty.key_list, nonempty.list
+    nonempty.insert_at(1, "w", 6)
+    assert nonempty.list == [("x", 3), ("w", 6), ("y", 4), ("z", 5)]
+    nonempty.insert_at(4, "v", 7)
+    nonempty.insert_at(0, "y", 40)
+    assert nonempty.list == [("y", 40), ("x", 3), ("w", 6), ("z", 5), ("v", 7)]
+    nonempty.move_to("v", 2)
+    nonempty.move_to_end("y")
+    nonempty.move_to_end("z", last=False)
+    assert nonempty.key_list == ["z", "x", "v", "w", "y"]
+    nonempty.swap(0, 4)
+    assert nonempty.key_list == ["y", "x", "v", "w", "z"]
+    assert [nonempty.key_at(idx) for idx in nonempty.range] == list(nonempty.data)
+    assert nonempty.index_of("z") == 4
+    assert nonempty.json == '{"y": 40, "x": 3, "v": 7, "w": 6, "z": 5}'
+    with pytest.raises(IndexError):
+        nonempty.insert_at(6, "u", 8)
+    with pytest.raises(IndexError):
+        nonempty.move_to("x", 5)
+    with pytest.raises(IndexError):
+        nonempty.swap(0, 5)
+    with pytest.raises(KeyError):
+        nonempty.move_to_end("u")
+    assert len(nonempty) == 5
+
+
+def test_insert_at_goes_through_store():
+    array = jarray(a=1, b=2)
+    array.insert_at(0, "c", 3.7)
+    assert len(array) == 3
+    assert array.list == [("c", 3), ("a", 1), ("b", 2)]
+
+    cache = jcache(2, ttl=10, data={"a": 1, "b": 2})
+    cache.insert_at(0, "c", 3)
+    assert cache.list == [("c", 3), ("b", 2)]
+    assert "c" in cache and "a" not in cache
+
+    tree = jtree(a=1)
+    tree.insert_at(0, "b", jdict(x=1))
+    assert tree.json == '{"b": {"x": 1}, "a": 1}'
+    assert tree.b.x == 1
+
+
+def test_insert_at_replaces_json_fragment():
+    j = jdict(a=1, b=2)
+    j.json
+    j.c = 3
+    j.json
+    j.insert_at(0, "a", 100)
+    assert j.json == '{"a": 100, "b": 2, "c": 3}'
+    j.insert_at(2, "a", 200)
+    assert j.json == '{"b": 2, "c": 3, "a": 200}'
+
+
+@pytest.mark.parametrize("indexed", [False, True])
+def test_keys_of_and_group_by(indexed):
+    j = jdict(a=1, b=2, c=1, d=3)
+    if indexed:
+        j.enable_value_index()
+    assert j.has_value_index == indexed
+    assert j.keys_of(1) == ["a", "c"]
+    assert j.keys_of(4) == []
+    assert j.count_of(1) == 2
+    assert j.count_of(4) == 0
+    assert j.group_by() == {1: ["a", "c"], 2: ["b"], 3: ["d"]}
+    assert j.group_by().key_list == [1, 2, 3]
+    assert isinstance(j.group_by(), jdict)
+
+
+@pytest.mark.parametrize("cls", [jdict, jqueue, jtree, jsorted, jordered, jrecord, jarray])
+def test_value_index_follows_writes(cls):
+    j = cls(a=1, b=2, c=1, d=3).enable_value_index()
+    j.e = 2
+    j["a"] = 2
+    j.c = 1
+    del j["d"]
+    j.pop_first()
+    j.pop_last()
+    j.setdefault("f", 1)
+    j.update(g=3)
+    if cls is not jsorted:
+        j.move_to_end("b")
+        j.move_to("g", 0)
+        j.insert_at(1, "i", 5)
+        j.insert_at(0, "b", 6)
+        assert j.keys_of(5) == ["i"]
+        assert j.keys_of(6) == ["b"]
+        j.pop_first()
+    expected = {}
+    for key, value in j.items():
+        expected.setdefault(value, []).append(key)
+    assert {value: sorted(keys) for value, keys in j.group_by().items()} == {
+        value: sorted(keys) for value, keys in expected.items()
+    }
+    assert j.count_of(1) == len(expected[1])
+    j.clear()
+    assert j.has_value_index
+    assert j.group_by() == {}
+    j.h = 4
+    assert j.keys_of(4) == ["h"]
+
+
+def test_value_index_with_projection():
+    j = jdict(a=[1, 2], b=[3], c=[4, 5]).enable_value_index(len)
+    assert j.keys_of(2) == ["a", "c"]
+    j.b = [6, 7]
+    assert j.keys_of(2) == ["a", "c", "b"]
+    assert j.count_of(1) == 0
+    j.pop("a")
+    assert j.group_by() == {2: ["c", "b"]}
+    copied = j.copy()
+    copied.d = [8]
+    assert copied.keys_of(1) == ["d"]
+    assert j.keys_of(1) == []
+    j.disable_value_index()
+    assert not j.has_value_index
+    assert j.keys_of([4, 5]) == ["c"]
+
+
+def test_value_index_order():
+    j = jdict(a=1, b=2, c=1).enable_value_index()
+    j.sort_by_key(reverse=True)
+    assert j.group_by() == {1: ["c", "a"], 2: ["b"]}
+    assert j.group_by().key_list == [1, 2]
+
+
+def test_top_k_and_bottom_k():
+    j = jdict(a=3, b=1, c=4, d=1, e=5)
+    assert j.top_k(2).list == [("e", 5), ("c", 4)]
+    assert j.bottom_k(3).list == [("b", 1), ("d", 1), ("a", 3)]
+    assert j.top_k(2, by="key").list == [("e", 5), ("d", 1)]
+    assert j.bottom_k(1, key=lambda value: abs(value - 4)).list == [("c", 4)]
+    assert j.top_k(10) == j
+    assert j.top_k(0) == {}
+    assert isinstance(j.top_k(1), jdict)
+    with pytest.raises(ValueError):
+        j.top_k(1, by="item")
+
+
+def test_sort_in_place(nonempty):
+    nonempty.w = 1
+    nonempty.key_list, nonempty.list
+    nonempty.enable_position_index()
+    json_before = nonempty.json
+    nonempty.sort_by_value()
+    assert nonempty.list == [("w", 1), ("x", 3), ("y", 4), ("z", 5)]
+    assert nonempty.key_list == ["w", "x", "y", "z"]
+    assert nonempty.key_at(0) == "w"
+    assert nonempty.index_of("z") == 3
+    assert nonempty.json != json_before
+    nonempty.sort_by_key(reverse=True)
+    assert list(nonempty.data) == ["z", "y", "x", "w"]
+    nonempty.sort_by_key(key=lambda key: "xwzy".index(key))
+    assert nonempty.key_list == ["x", "w", "z", "y"]
+
+
+def test_sort_does_not_change_snapshot(nonempty):
+    snapshot = nonempty.snapshot()
+    nonempty.sort_by_key(reverse=True)
+    assert list(snapshot) == ["x", "y", "z"]
+    assert list(nonempty) == ["z", "y", "x"]
+
+
+def test_copy_does_not_share_caches(nonempty):
+    nonempty.enable_position_index()
+    nonempty.key_list
+    copied = nonempty.copy()
+    copied.w = 6
+    assert nonempty.key_list == ["x", "y", "z"]
+    assert copied.key_list == ["x", "y", "z", "w"]
+    assert copied.has_position_index
+    assert copied.key_at(3) == "w"
+
+
+def test_compact_layout(nonempty):
+    assert not hasattr(nonempty, "__dict__")
+    assert nonempty._state is None
+    nonempty.w = 6
+    assert nonempty._state is None
+    assert nonempty.key_list == ["x", "y", "z", "w"]
+    assert nonempty._state.values is None and nonempty._state.items is None
+
+
+def test_mapping_api(nonempty):
+    assert isinstance(nonempty, collections.abc.MutableMapping)
+    assert repr(nonempty) == "{'x': 3, 'y': 4, 'z': 5}"
+    assert nonempty | {"w": 6} == {"x": 3, "y": 4, "z": 5, "w": 6}
+    assert type(nonempty | jdict(w=6)) is jdict
+    assert {"w": 6} | nonempty == {"w": 6, "x": 3, "y": 4, "z": 5}
+    assert jdict.fromkeys("ab", 0) == {"a": 0, "b": 0}
+    assert nonempty.setdefault("w", 6) == 6
+    assert nonempty.key_list[-1] == "w"
+
+
+def test_query():
+    j = jdict(x=3, y=4, z=5, w=6)
+    query = j.query().where_key(lambda k: k != "y").map_value(lambda v: v * 10).where_value(lambda v: v < 60)
+    assert query.collect() == jdict(x=30, z=50)
+    assert list(query) == [("x", 30), ("z", 50)]
+    assert query.first() == ("x", 30)
+    assert query.take(1) == jdict(x=30)
+    assert j.query().map_key(lambda k: k * 2).where(lambda k, v: v % 2).collect() == jdict(xx=3, zz=5)
+    assert j.query().map_item(lambda k, v: (v, k)).take(2) == {3: "x", 4: "y"}
+    assert j.query().where_value(lambda v: v > 100).first() is None
+
+
+def test_query_is_lazy():
+    seen = []
+    j = jdict(x=3, y=4, z=5)
+    query = j.query().map_value(lambda v: seen.append(v) or v)
+    assert seen == []
+    assert query.first() == ("x", 3)
+    assert seen == [3]
+
+    j.w = 6
+    assert query.collect() == jdict(x=3, y=4, z=5, w=6)
+
+
+def _double(x):
+    return x * 2
+
+
+def _is_odd(x):
+    return x % 2 == 1
+
+
+@pytest.mark.parametrize("executor_class", [ThreadPoolExecutor, ProcessPoolExecutor])
+@pytest.mark.parametrize("chunksize", [None, 1, 7, 1000])
+def test_mapping_and_select_in_executor(executor_class, chunksize):
+    j = jdict({f"k{idx}": idx for idx in range(50)})
+    with executor_class(max_workers=2) as executor:
+        mapped = j.mapping(_double, _double, executor=executor, chunksize=chunksize)
+        value_mapped = j.value_mapping(_double, executor=executor, chunksize=chunksize)
+        selected = j.value_select(_is_odd, executor=executor, chunksize=chunksize)
+
+    assert mapped.list == j.mapping(_double, _double).list
+    assert value_mapped.list == j.value_mapping(_double).list
+    assert selected.list == j.value_select(_is_odd).list
+
+
+class _ConcurrencyTracker:
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    async def double(self, value):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.001 * (5 - value % 5))
+        self.running -= 1
+        return value * 2
+
+
+@pytest.mark.parametrize("limit", [None, 1, 3])
+def test_async_mapping(limit):
+    tracker = _ConcurrencyTracker()
+    j = jdict({f"k{idx}": idx for idx in range(20)})
+
+    mapped = asyncio.run(j.async_value_mapping(tracker.double, limit=limit))
+    assert mapped.list == j.value_mapping(lambda v: v * 2).list
+    assert tracker.max_running == (limit or 20)
+
+    mapped = asyncio.run(j.async_mapping(lambda k: k * 2, tracker.double, limit=limit))
+    assert mapped.list == j.mapping(lambda k: k * 2, lambda v: v * 2).list
+
+
+@pytest.mark.parametrize("limit", [None, 2])
+def test_async_select(limit):
+    async def is_odd(value):
+        await asyncio.sleep(0)
+        return value % 2 == 1
+
+    j = jdict({f"k{idx}": idx for idx in range(10)})
+    selected = asyncio.run(j.async_select(key_func=lambda k: k != "k1", value_func=is_odd, limit=limit))
+    assert selected == jdict(k3=3, k5=5, k7=7, k9=9)
+
+
+def test_async_iter_value_mapping():
+    tracker = _ConcurrencyTracker()
+    j = jdict({f"k{idx}": idx for idx in range(10)})
+
+    async def collect():
+        return [item async for item in j.async_iter_value_mapping(tracker.double, limit=5)]
+
+    results = asyncio.run(collect())
+    assert sorted(results) == sorted(j.value_mapping(lambda v: v * 2).list)
+    assert results != j.value_mapping(lambda v: v * 2).list
+    assert tracker.max_running == 5
+
+
+def test_async_iter_value_mapping_error():
+    async def fail(value):
+        raise ValueError(value)
+
+    async def collect():
+        return [item async for item in jdict(x=3).async_iter_value_mapping(fail)]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_async_invalid_limit(limit):
+    async def collect():
+        return [item async for item in jdict(x=3).async_iter_value_mapping(_double, limit=limit)]
+
+    j = jdict(x=3)
+    with pytest.raises(ValueError):
+        asyncio.run(j.async_select(limit=limit))
+    with pytest.raises(ValueError):
+        asyncio.run(j.async_mapping(limit=limit))
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
+
+
+def test_async_error_cancels_other_workers():
+    started = []
+
+    async def slow_or_fail(value):
+        started.append(value)
+        if value == 0:
+            raise ValueError(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    async def run():
+        with pytest.raises(ValueError):
+            await jdict({idx: idx for idx in range(10)}).async_value_mapping(slow_or_fail, limit=2)
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert started == [0, 1]
+
+
+def test_series_cached_until_modified(nonempty):
+    series = nonempty.series
+    assert nonempty.series is series
+
+    nonempty.w = 6
+    assert nonempty.series is not series
+    assert list(nonempty.series) == [3, 4, 5, 6]
+
+    series = nonempty.series
+    nonempty.pop_first()
+    assert list(nonempty.series.index) == ["y", "z", "w"]
+
+
+def test_frame():
+    records = [jdict(x=idx, y=idx * 2, z=str(idx)) for idx in range(5)]
+    expected = pd.concat([record.datarow for record in records], ignore_index=True)
+
+    pd.testing.assert_frame_equal(jdict.frame(records), expected)
+    pd.testing.assert_frame_equal(jdict.frame(iter(records)), expected)
+    pd.testing.assert_frame_equal(jdict.frame([record.data for record in records]), expected)
+    pd.testing.assert_frame_equal(
+        jdict.frame(records, columns=["z", "x", "y"]), expected[["z", "x", "y"]]
+    )
+    assert list(jdict.frame([]).columns) == []
+
+
+@pytest.mark.parametrize("record", [jdict(x=3, y=4, w=5), jdict(x=3, y=4), jdict(x=3, y=4, z=5, w=6)])
+def test_frame_mismatched_keys(record):
+    with pytest.raises(ValueError):
+        jdict.frame([jdict(x=3, y=4, z=5), record])
+
+
+def test_frame_arrow():
+    pa = pytest.importorskip("pyarrow")
+    table = jdict.frame([jdict(x=3, y=4), jdict(x=5, y=6)], arrow=True)
+    assert isinstance(table, pa.Table)
+    assert table.to_pydict() == {"x": [3, 5], "y": [4, 6]}
+
+
+def test_json_cached_until_modified(nonempty):
+    encoded = nonempty.json
+    assert nonempty.json is encoded
+
+    nonempty.w = 6
+    assert nonempty.json == '{"x": 3, "y": 4, "z": 5, "w": 6}'
+    nonempty.y = [1, {"a": None}]
+    del nonempty["x"]
+    assert nonempty.json == json.dumps(nonempty.data)
+    nonempty.clear()
+    assert nonempty.json == "{}"
+
+
+def test_json_incremental_matches_dumps():
+    j = jdict({"x": 3, 1: "one", None: 1.5, True: [1, 2], 2.5: {"nested": "æøå"}})
+    for step in range(4):
+        assert j.json == json.dumps(j.data)
+        j[step] = step
+        j.x = {"step": step}
+        j.pop_first()
+
+
+@pytest.mark.parametrize(
+    "encoder",
+    [
+        json.JSONEncoder(separators=(",", ":")),
+        json.JSONEncoder(sort_keys=True),
+        json.JSONEncoder(indent=2),
+        json.JSONEncoder(ensure_ascii=False),
+    ],
+)
+def test_json_encoder(nonempty, encoder):
+    nonempty.set_json_encoder(encoder)
+    nonempty.w = "æ"
+    assert nonempty.json == encoder.encode(nonempty.data)
+    nonempty.a = 1
+    assert nonempty.json == encoder.encode(nonempty.data)
+    assert "".join(nonempty.iter_json()) == encoder.encode(nonempty.data)
+    assert nonempty.copy().json == encoder.encode(nonempty.data)
+
+
+def test_json_encoder_skipkeys():
+    encoder = json.JSONEncoder(skipkeys=True)
+    j = jdict({"a": 1, (2, 3): 2, "b": 3}).set_json_encoder(encoder)
+    j.json
+    j.c = 4
+    assert j.json == '{"a": 1, "b": 3, "c": 4}'
+    j[(4, 5)] = 5
+    j.a = 0
+    assert j.json == encoder.encode(j.data)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 65536])
+def test_dump_json(chunk_size):
+    j = jdict({f"k{idx}": [idx, str(idx)] for idx in range(100)})
+    chunks = []
+
+    class Writer:
+        def write(self, chunk):
+            chunks.append(chunk)
+
+    j.dump_json(Writer(), chunk_size=chunk_size)
+    assert "".join(chunks) == json.dumps(j.data)
+    if chunk_size == 10:
+        assert len(chunks) > 1
+        assert all(len(chunk) >= 10 for chunk in chunks[:-1])
+
+    stream = io.StringIO()
+    j.json
+    j.dump_json(stream)
+    assert stream.getvalue() == json.dumps(j.data)
+
+
+_STREAM_DATA = {
+    "x": 3,
+    "long number": 12345678901234567890,
+    "float": -1.5e-10,
+    "ünïcødé ✓": "välüé ✓",
+    "nested": {"a": [1, 2, {"b": None}], "c": "}{,:\""},
+    "t": True,
+    "f": False,
+    "n": None,
+    "": [],
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 65536])
+@pytest.mark.parametrize("binary", [False, True])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_json_stream(chunk_size, binary, indent):
+    text = json.dumps(_STREAM_DATA, indent=indent, ensure_ascii=False)
+    fp = io.BytesIO(text.encode()) if binary else io.StringIO(text)
+    assert list(jdict.iter_json_stream(fp, chunk_size)) == list(_STREAM_DATA.items())
+
+
+@pytest.mark.parametrize("text", ["{}", " { } ", "{}\n"])
+def test_iter_json_stream_empty(text):
+    assert list(jdict.iter_json_stream(io.StringIO(text), 1)) == []
+
+
+@pytest.mark.parametrize(
+    "text", ["", "[]", "{", '{"x"', '{"x": }', '{"x": 1', '{"x": 1,}', '{"x": 1 "y": 2}', '{x: 1}', '{"x": 1} 2']
+)
+@pytest.mark.parametrize("chunk_size", [1, 65536])
+def test_iter_json_stream_invalid(text, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        list(jdict.iter_json_stream(io.StringIO(text), chunk_size))
+
+
+def test_from_json_stream():
+    fp = io.StringIO(json.dumps(_STREAM_DATA))
+    assert jdict.from_json_stream(fp, chunk_size=5).list == list(_STREAM_DATA.items())
+
+    fp = io.StringIO(json.dumps({f"k{idx}": idx for idx in range(100)}))
+    selected = jdict.from_json_stream(fp, key_func=lambda k: k != "k1", value_func=lambda v: v < 4)
+    assert selected == jdict(k0=0, k2=2, k3=3)
@@ -0,0 +1,116 @@
+import pickle
+import random
+
+import pytest
+
+from jdict import jdict, jordered
+
+
+@pytest.fixture
+def ordered():
+    return jordered(x=3, y=4, z=5)
+
+
+def test_is_jdict(ordered):
+    assert isinstance(ordered, jdict)
+    assert ordered == {"x": 3, "y": 4, "z": 5}
+    assert repr(ordered) == "{'x': 3, 'y': 4, 'z': 5}"
+    assert ordered.has_position_index
+
+
+def test_edits(ordered):
+    ordered.insert_at(1, "w", 6)
+    ordered.move_to("x", 3)
+    ordered.swap(0, 1)
+    assert list(ordered) == ["y", "w", "z", "x"]
+    assert list(ordered.data) == ["y", "w", "z", "x"]
+    assert ordered.first == ("y", 4)
+    assert ordered.last_key == "x"
+    assert ordered.at(2) == ("z", 5)
+    assert ordered.index_of("x") == 3
+    ordered.move_to_end("y")
+    ordered.move_to_end("x", last=False)
+    assert ordered.key_list == ["x", "w", "z", "y"]
+    assert ordered.pop_first() == ("x", 3)
+    assert ordered.pop_last() == ("y", 4)
+    assert ordered.list == [("w", 6), ("z", 5)]
+
+
+def test_errors(ordered):
+    with pytest.raises(IndexError):
+        ordered.insert_at(4, "w", 6)
+    with pytest.raises(IndexError):
+        ordered.move_to("x", 3)
+    with pytest.raises(KeyError):
+        ordered.move_to("w", 0)
+    with pytest.raises(IndexError):
+        ordered.swap(0, 3)
+    assert ordered.key_list == ["x", "y", "z"]
+
+
+def test_cached_lists_and_json(ordered):
+    assert ordered.json == '{"x": 3, "y": 4, "z": 5}'
+    keys, values = ordered.key_list, ordered.value_list
+    ordered.w = 6
+    ordered.x = 30
+    assert keys == ["x", "y", "z", "w"]
+    assert values == [30, 4, 5, 6]
+    ordered.insert_at(0, "w", 60)
+    assert ordered.value_list == [60, 30, 4, 5]
+    assert ordered.json == '{"w": 60, "x": 30, "y": 4, "z": 5}'
+    ordered.sort_by_value()
+    assert ordered.key_list == ["y", "z", "x", "w"]
+    assert ordered.key_at(0) == "y"
+
+
+def test_matches_list_under_random_edits():
+    rng = random.Random(0)
+    size = 3000
+    ordered = jordered({idx: idx for idx in range(size)})
+    expected = list(range(size))
+    for step in range(2000):
+        op = rng.randrange(4)
+        if op == 0:
+            idx = rng.randrange(len(expected) + 1)
+            key = size + step
+            ordered.insert_at(idx, key, key)
+            expected.insert(idx, key)
+        elif op == 1:
+            key = rng.choice(expected)
+            idx = rng.randrange(len(expected))
+            ordered.move_to(key, idx)
+            expected.remove(key)
+            expected.insert(idx, key)
+        elif op == 2:
+            i, j = rng.randrange(len(expected)), rng.randrange(len(expected))
+            ordered.swap(i, j)
+            expected[i], expected[j] = expected[j], expected[i]
+        else:
+            key = rng.choice(expected)
+            del ordered[key]
+            expected.remove(key)
+    assert list(ordered) == expected
+    assert list(ordered.data) == expected
+    assert [ordered.key_at(idx) for idx in range(0, len(expected), 97)] == expected[::97]
+    assert [ordered.index_of(key) for key in expected[::89]] == list(range(0, len(expected), 89))
+
+
+def test_snapshot(ordered):
+    snapshot = ordered.snapshot()
+    ordered.insert_at(0, "w", 2)
+    ordered.x = 6
+    del ordered["z"]
+    assert snapshot.list == [("x", 3), ("y", 4), ("z", 5)]
+    assert ordered.snapshot().list == [("w", 2), ("x", 6), ("y", 4)]
+
+
+def test_clear_copy_and_pickle(ordered):
+    ordered.move_to("z", 0)
+    copied = ordered.copy()
+    assert isinstance(copied, jordered)
+    assert copied.key_list == ["z", "x", "y"]
+    assert pickle.loads(pickle.dumps(ordered)).key_list == ["z", "x", "y"]
+    ordered.clear()
+    assert ordered == {}
+    ordered.w = 6
+    assert ordered.list == [("w", 6)]
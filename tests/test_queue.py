@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from jdict import jdict, jqueue
+
+
+def test_is_jdict():
+    assert isinstance(jqueue(), jdict)
+    assert jqueue(x=3, y=4) == {"x": 3, "y": 4}
+
+
+def test_pop_first_in_insertion_order():
+    q = jqueue(x=3, y=4, z=5)
+    assert q.first == ("x", 3)
+    assert q.pop_first() == ("x", 3)
+    assert q.pop_first_key() == "y"
+    assert q.pop_first_value() == 5
+    assert q.first is None
+    assert q.first_key is None
+    assert q.first_value is None
+    with pytest.raises(IndexError):
+        q.pop_first()
+
+
+def test_removed_and_reinserted_keys():
+    q = jqueue(x=3, y=4, z=5)
+    del q["y"]
+    q.pop_last()
+    q.y = 6
+    q.x = 7
+    q.pop("y")
+    q.y = 8
+    assert q.first_key == "x"
+    assert [q.pop_first() for _ in range(len(q))] == [("x", 7), ("y", 8)]
+
+
+def test_matches_jdict_under_churn():
+    rng = random.Random(0)
+    q = jqueue()
+    reference = jdict()
+    for step in range(5000):
+        action = rng.random()
+        if action < 0.4:
+            key = rng.randrange(100)
+            q[key] = step
+            reference[key] = step
+        elif action < 0.6 and reference:
+            key = rng.choice(reference.key_list)
+            del q[key]
+            del reference[key]
+        elif action < 0.9 and reference:
+            assert q.pop_first() == reference.pop_first()
+        elif reference:
+            assert q.pop_last() == reference.pop_last()
+        assert q.first == reference.first
+        assert q.list == reference.list
+
+
+def test_clear():
+    q = jqueue(x=3, y=4)
+    q.clear()
+    q.z = 5
+    assert q.pop_first() == ("z", 5)
+
+
+def test_sort_in_place():
+    q = jqueue(x=5, y=3, z=4)
+    q.pop_first()
+    q.x = 6
+    q.sort_by_value()
+    assert [q.pop_first() for _ in range(len(q))] == [("y", 3), ("z", 4), ("x", 6)]
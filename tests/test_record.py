@@ -0,0 +1,131 @@
+import copy
+import pickle
+
+import pytest
+
+from jdict import Schema, jdict, jrecord
+
+
+@pytest.fixture
+def schema():
+    return Schema(["x", "y", "z"])
+
+
+@pytest.fixture
+def record(schema):
+    return schema(3, 4, 5)
+
+
+def test_is_jdict(record):
+    assert isinstance(record, jdict)
+    assert record == {"x": 3, "y": 4, "z": 5}
+    assert record.data == {"x": 3, "y": 4, "z": 5}
+    assert repr(record) == "{'x': 3, 'y': 4, 'z': 5}"
+
+
+def test_constructors(schema):
+    assert schema.from_dict({"z": 5, "x": 3, "y": 4}).list == [("x", 3), ("y", 4), ("z", 5)]
+    assert jrecord(x=3, y=4).list == [("x", 3), ("y", 4)]
+    assert jrecord({"x": 3}).schema.keys == ("x",)
+    with pytest.raises(ValueError):
+        schema(3, 4)
+    with pytest.raises(ValueError):
+        schema.from_dict({"x": 3, "y": 4, "w": 5})
+    with pytest.raises(ValueError):
+        Schema(["x", "x"])
+
+
+def test_access(record):
+    assert record.x == 3
+    assert record["y"] == 4
+    assert "z" in record
+    assert "w" not in record
+    with pytest.raises(AttributeError):
+        record.w
+    with pytest.raises(KeyError):
+        record["w"]
+    assert record.first == ("x", 3)
+    assert record.last == ("z", 5)
+    assert record.first_value == 3
+    assert record.last_key == "z"
+    assert record.at(1) == ("y", 4)
+    assert record.value_at(2) == 5
+    assert record.index_of("z") == 2
+    assert record.key_list == ["x", "y", "z"]
+    assert record.value_list == [3, 4, 5]
+    assert list(record.enum) == [(0, "x", 3), (1, "y", 4), (2, "z", 5)]
+    assert record.json == '{"x": 3, "y": 4, "z": 5}'
+    with pytest.raises(IndexError):
+        record.at(3)
+
+
+def test_shares_schema(schema):
+    first = schema(3, 4, 5)
+    second = schema(6, 7, 8)
+    assert first.schema is second.schema is schema
+    first.x = 30
+    assert first.x == 30
+    assert second.x == 6
+    assert first.schema is schema
+
+
+def test_changing_keys_detaches_from_schema(schema, record):
+    other = schema(6, 7, 8)
+    record.w = 6
+    assert record.key_list == ["x", "y", "z", "w"]
+    assert record.last == ("w", 6)
+    del record["x"]
+    assert record.list == [("y", 4), ("z", 5), ("w", 6)]
+    assert record.pop_first() == ("y", 4)
+    assert record.at(0) == ("z", 5)
+    assert schema.keys == ("x", "y", "z")
+    assert other.key_list == ["x", "y", "z"]
+    record.clear()
+    assert len(record) == 0
+    assert record.first is None
+
+
+def test_mapping(schema, record):
+    mapped = record.value_mapping(lambda value: value * 10)
+    assert isinstance(mapped, jrecord)
+    assert mapped.schema is schema
+    assert mapped == {"x": 30, "y": 40, "z": 50}
+    assert record.key_mapping(str.upper) == {"X": 3, "Y": 4, "Z": 5}
+    assert record.select(value_func=lambda value: value > 3) == {"y": 4, "z": 5}
+
+
+def test_copy(schema, record):
+    copied = record.copy()
+    copied.x = 30
+    assert record.x == 3
+    assert copied.schema is schema
+
+
+def test_pickle_and_deepcopy(schema):
+    rows = [schema(idx, idx + 1, idx + 2) for idx in range(3)]
+    unpickled = pickle.loads(pickle.dumps(rows))
+    assert unpickled == rows
+    assert all(isinstance(row, jrecord) for row in unpickled)
+    assert unpickled[0].schema is unpickled[2].schema
+    copied = copy.deepcopy(rows[0])
+    copied.x = 30
+    assert copied == {"x": 30, "y": 1, "z": 2}
+    assert rows[0].x == 0
+
+
+def test_json_cache(record):
+    assert record.json == '{"x": 3, "y": 4, "z": 5}'
+    record.y = 40
+    assert record.json == '{"x": 3, "y": 40, "z": 5}'
+
+
+def test_frame(schema):
+    frame = jdict.frame([schema(1, 2, 3), schema(4, 5, 6)])
+    assert frame.to_dict("list") == {"x": [1, 4], "y": [2, 5], "z": [3, 6]}
+
+
+def test_sort_in_place(schema, record):
+    record.sort_by_key(reverse=True)
+    assert record.list == [("z", 5), ("y", 4), ("x", 3)]
+    assert record.index_of("x") == 2
+    assert schema.keys == ("x", "y", "z")
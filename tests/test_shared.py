@@ -0,0 +1,161 @@
+import gc
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from jdict import _shared, jdict, jfile, jshared
+
+# jshared requires Python 3.8
+shared_memory = pytest.importorskip("multiprocessing.shared_memory")
+
+
+@pytest.fixture
+def shared():
+    with jshared.freeze(jdict(x=3, y=[4], z={"five": 5})) as frozen:
+        yield frozen
+
+
+def _lookup(name, key):
+    with jshared(name) as attached:
+        return attached[key], attached.at(0), attached.key_list
+
+
+def _last(table):
+    return table.last
+
+
+def test_is_jdict(shared):
+    assert isinstance(shared, jdict)
+    assert shared == {"x": 3, "y": [4], "z": {"five": 5}}
+
+
+def test_access(shared):
+    assert shared.x == 3
+    assert shared["y"] == [4]
+    assert "z" in shared
+    assert "w" not in shared
+    with pytest.raises(AttributeError):
+        shared.w
+    assert shared.get("w") is None
+
+    assert shared.first == ("x", 3)
+    assert shared.last == ("z", {"five": 5})
+    assert shared.at(1) == ("y", [4])
+    assert shared.value_at(2) == {"five": 5}
+    assert shared.index_of("z") == 2
+    assert shared.key_list == ["x", "y", "z"]
+    assert shared.select(value_func=lambda value: value != 3) == {"y": [4], "z": {"five": 5}}
+    assert shared.json == '{"x": 3, "y": [4], "z": {"five": 5}}'
+    with pytest.raises(IndexError):
+        shared.at(3)
+    with pytest.raises(KeyError):
+        shared.index_of("w")
+
+
+def test_read_only(shared):
+    with pytest.raises(TypeError):
+        shared.w = 6
+    with pytest.raises(TypeError):
+        shared["x"] = 6
+    with pytest.raises(TypeError):
+        del shared["x"]
+    with pytest.raises(TypeError):
+        shared.pop_first()
+    with pytest.raises(TypeError):
+        shared.clear()
+    assert shared == {"x": 3, "y": [4], "z": {"five": 5}}
+
+
+def test_empty():
+    with jshared.freeze(jdict()) as frozen:
+        assert len(frozen) == 0
+        assert frozen.first is None
+        assert frozen.key_list == []
+
+
+def test_attach(shared):
+    with jshared(shared.name) as attached:
+        assert attached == shared
+        assert attached.list == shared.list
+
+
+def test_garbage_collected_without_close(shared, monkeypatch):
+    unraisable = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable.append)
+    attached = pickle.loads(pickle.dumps(shared))
+    assert attached.x == 3
+    del attached
+    gc.collect()
+    assert unraisable == []
+
+
+def test_frozenset_keys_from_other_hash_seeds():
+    key = (frozenset("abcdefgh"), frozenset({1, "z", frozenset("xy")}))
+    with jshared.freeze(jdict({key: 1})) as frozen:
+        code = f"from jdict import jshared; print(jshared({frozen.name!r}).get({key!r}))"
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for seed in ("0", "1"):
+            env = dict(os.environ, PYTHONHASHSEED=seed, PYTHONPATH=root)
+            result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+            assert result.stdout.strip() == "1"
+
+
+def test_attach_skips_registering_only_in_its_own_thread(shared, monkeypatch):
+    jshared(shared.name).close()
+    registered = []
+    monkeypatch.setattr(_shared, "_register", lambda name, rtype: registered.append(name))
+    with jshared(shared.name) as attached:
+        assert attached.x == 3
+    assert registered == []
+
+    monkeypatch.setattr(_shared._attaching, "names", {shared.name}, raising=False)
+    _shared._register_unless_attaching(shared.name, "shared_memory")
+    other = threading.Thread(target=_shared._register_unless_attaching, args=(shared.name, "shared_memory"))
+    other.start()
+    other.join()
+    assert registered == [shared.name]
+
+
+def test_attach_invalid():
+    other = shared_memory.SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            jshared(other.name)
+    finally:
+        other.close()
+        other.unlink()
+
+
+def test_pickle_is_by_name(shared):
+    pickled = pickle.dumps(shared)
+    assert len(pickled) < 100
+    with pickle.loads(pickled) as attached:
+        assert attached == shared
+
+
+def test_freeze_jfile(tmp_path):
+    with jfile(str(tmp_path / "table")) as table:
+        table.update(x=3, y=4)
+        with jshared.freeze(table) as frozen:
+            assert frozen.list == [("x", 3), ("y", 4)]
+
+
+def test_many_keys():
+    source = jdict({idx: str(idx) for idx in range(1000)})
+    with jshared.freeze(source) as frozen:
+        assert len(frozen) == 1000
+        assert all(frozen[idx] == str(idx) for idx in range(0, 1000, 37))
+        assert frozen.at(999) == (999, "999")
+        assert 1000 not in frozen
+
+
+def test_other_processes(shared):
+    with multiprocessing.get_context("fork").Pool(2) as pool:
+        assert pool.apply(_lookup, (shared.name, "y")) == ([4], ("x", 3), ["x", "y", "z"])
+        assert pool.apply(_last, (shared,)) == ("z", {"five": 5})
+    assert shared.x == 3
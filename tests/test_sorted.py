@@ -0,0 +1,140 @@
+import pickle
+import random
+
+import pytest
+
+from jdict import jdict, jsorted
+
+
+@pytest.fixture
+def srt():
+    return jsorted(c=3, a=1, e=5)
+
+
+def test_is_jdict(srt):
+    assert isinstance(srt, jdict)
+    assert srt == {"a": 1, "c": 3, "e": 5}
+    assert repr(srt) == "{'a': 1, 'c': 3, 'e': 5}"
+    assert list(srt) == ["a", "c", "e"]
+    assert jsorted(b=2, a=1).key_list == ["a", "b"]
+
+
+def test_keeps_key_order(srt):
+    srt.d = 4
+    srt["b"] = 2
+    srt.f = 6
+    assert srt.key_list == ["a", "b", "c", "d", "e", "f"]
+    assert list(srt.data) == ["a", "b", "c", "d", "e", "f"]
+    assert srt.json == '{"a": 1, "b": 2, "c": 3, "d": 4, "e": 5, "f": 6}'
+    assert list(srt.enum_values) == [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5), (5, 6)]
+
+
+def test_positional_access(srt):
+    srt.b = 2
+    assert srt.first == ("a", 1)
+    assert srt.first_key == "a"
+    assert srt.last == ("e", 5)
+    assert srt.last_value == 5
+    assert srt.at(1) == ("b", 2)
+    assert srt.key_at(2) == "c"
+    assert srt.index_of("e") == 3
+    with pytest.raises(IndexError):
+        srt.at(4)
+    with pytest.raises(KeyError):
+        srt.index_of("d")
+    assert srt.pop_first() == ("a", 1)
+    assert srt.pop_last() == ("e", 5)
+    assert srt == {"b": 2, "c": 3}
+
+
+def test_empty():
+    srt = jsorted()
+    assert srt.first is None
+    assert srt.last_key is None
+    assert srt.floor(1) is None
+    assert srt.ceiling(1) is None
+    assert srt.range_keys() == []
+    with pytest.raises(IndexError):
+        srt.pop_first()
+
+
+def test_range_queries():
+    srt = jsorted({key: str(key) for key in range(0, 20, 2)})
+    assert srt.range_keys(4, 10) == [4, 6, 8]
+    assert srt.range_keys(5, 9) == [6, 8]
+    assert srt.range_keys(hi=4) == [0, 2]
+    assert srt.range_keys(16) == [16, 18]
+    assert srt.range_keys(10, 4) == []
+    assert list(srt.irange(4, 10)) == [4, 6, 8, 10]
+    assert list(srt.irange(4, 10, inclusive=(False, False))) == [6, 8]
+    assert list(srt.irange(4, 10, reverse=True)) == [10, 8, 6, 4]
+    assert list(srt.irange()) == srt.key_list
+    assert srt.floor(5) == 4
+    assert srt.floor(4) == 4
+    assert srt.floor(-1) is None
+    assert srt.ceiling(5) == 6
+    assert srt.ceiling(6) == 6
+    assert srt.ceiling(19) is None
+
+
+def test_cached_lists_follow_writes(srt):
+    assert srt.list == [("a", 1), ("c", 3), ("e", 5)]
+    assert srt.value_list == [1, 3, 5]
+    srt.b = 2
+    srt.c = 30
+    del srt["e"]
+    srt.f = 6
+    assert srt.list == [("a", 1), ("b", 2), ("c", 30), ("f", 6)]
+    assert srt.value_list == [1, 2, 30, 6]
+    assert srt.key_list == ["a", "b", "c", "f"]
+
+
+def test_random_writes_match_sorted_dict():
+    rng = random.Random(0)
+    srt = jsorted()
+    srt.value_list
+    expected = {}
+    for _ in range(2000):
+        key = rng.randrange(200)
+        if key in expected and rng.random() < 0.4:
+            del srt[key]
+            del expected[key]
+        else:
+            srt[key] = key * 2
+            expected[key] = key * 2
+    assert srt.key_list == sorted(expected)
+    assert srt.value_list == [expected[key] for key in sorted(expected)]
+    assert list(srt.data.items()) == sorted(expected.items())
+
+
+def test_clear_copy_and_pickle(srt):
+    copied = srt.copy()
+    assert isinstance(copied, jsorted)
+    copied.b = 2
+    assert "b" not in srt
+    assert pickle.loads(pickle.dumps(copied)).key_list == ["a", "b", "c", "e"]
+    srt.clear()
+    assert srt == {}
+    srt.z = 26
+    assert srt.list == [("z", 26)]
+
+
+def test_snapshot(srt):
+    snapshot = srt.snapshot()
+    srt.b = 2
+    srt.c = 4
+    del srt["e"]
+    assert snapshot.list == [("a", 1), ("c", 3), ("e", 5)]
+    assert srt.snapshot().list == [("a", 1), ("b", 2), ("c", 4)]
+
+
+def test_can_not_be_reordered(srt):
+    with pytest.raises(TypeError):
+        srt.sort_by_value()
+    with pytest.raises(TypeError):
+        srt.move_to("a", 2)
+    with pytest.raises(TypeError):
+        srt.move_to_end("a")
+    with pytest.raises(TypeError):
+        srt.swap(0, 1)
+    assert srt.top_k(1, by="key") == {"e": 5}
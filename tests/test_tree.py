@@ -0,0 +1,90 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jdict import jdict, jtree
+
+
+@pytest.fixture
+def tree():
+    return jtree({"a": {"b": {"c": 1, "d": [2]}, "e": 3}, "f": 4})
+
+
+def test_nested_access(tree):
+    assert tree.a.b.c == 1
+    assert tree["a"]["b"]["d"] == [2]
+    assert tree.a.e == 3
+    assert tree.f == 4
+    assert isinstance(tree.a, jtree)
+    assert isinstance(tree.get("a"), jtree)
+    with pytest.raises(AttributeError):
+        tree.a.x
+    with pytest.raises(KeyError):
+        tree.a["x"]
+
+
+def test_sub_views_are_cached_and_share_data(tree):
+    assert tree.a is tree.a
+    assert tree.a.b is tree["a"]["b"]
+    assert tree.a.data is tree.data["a"]
+    tree.a.b.c = 10
+    assert tree.data["a"]["b"]["c"] == 10
+
+
+def test_wrapping_is_lazy(tree):
+    assert tree._children is None
+    tree.f
+    assert tree._children is None
+    tree.a
+    assert list(tree._children) == ["a"]
+
+
+def test_writes_invalidate_parents(tree):
+    assert tree.json == '{"a": {"b": {"c": 1, "d": [2]}, "e": 3}, "f": 4}'
+    assert tree.a.json == '{"b": {"c": 1, "d": [2]}, "e": 3}'
+    tree.a.b.c = 10
+    assert tree.a.json == '{"b": {"c": 10, "d": [2]}, "e": 3}'
+    assert tree.json == '{"a": {"b": {"c": 10, "d": [2]}, "e": 3}, "f": 4}'
+    del tree.a.b["d"]
+    assert tree.json == '{"a": {"b": {"c": 10}, "e": 3}, "f": 4}'
+    tree.a.b.clear()
+    assert tree.json == '{"a": {"b": {}, "e": 3}, "f": 4}'
+
+
+def test_replacing_a_sub_dict(tree):
+    old = tree.a
+    tree.a = jdict(x=5)
+    assert tree.a is not old
+    assert tree.a.x == 5
+    assert tree.data["a"] == {"x": 5}
+    assert type(tree.data["a"]) is dict
+    old.e = 30
+    assert tree.json == '{"a": {"x": 5}, "f": 4}'
+
+
+def test_list_properties_return_dicts(tree):
+    assert tree.first == ("a", {"b": {"c": 1, "d": [2]}, "e": 3})
+    assert tree.value_list[1] == 4
+
+
+def test_mapping(tree):
+    mapped = tree.mapping(str.upper, lambda value: value * 2)
+    assert isinstance(mapped, jtree)
+    assert mapped == {"A": {"B": {"C": 2, "D": [2, 2]}, "E": 6}, "F": 8}
+    assert mapped.A.B.C == 2
+    assert tree.value_mapping(str).data == {"a": {"b": {"c": "1", "d": "[2]"}, "e": "3"}, "f": "4"}
+    with ThreadPoolExecutor(2) as executor:
+        assert tree.mapping(value_func=str, executor=executor, chunksize=1) == tree.value_mapping(str)
+
+
+def test_copy_copies_the_dicts(tree):
+    copied = tree.copy()
+    copied.a.b.c = 10
+    assert tree.a.b.c == 1
+    assert copied.a.b.d is tree.a.b.d
+
+
+def test_sort_invalidates_parents(tree):
+    assert tree.json == '{"a": {"b": {"c": 1, "d": [2]}, "e": 3}, "f": 4}'
+    tree.a.sort_by_key(reverse=True)
+    assert tree.json == '{"a": {"e": 3, "b": {"c": 1, "d": [2]}}, "f": 4}'
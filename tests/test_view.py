@@ -0,0 +1,86 @@
+import numpy as np
+import pytest
+
+from jdict import PositionView, jarray, jdict, jfile, jordered, jrecord, jsorted
+
+
+@pytest.fixture
+def squares():
+    return jdict({idx: idx * idx for idx in range(10)})
+
+
+def test_slicing(squares):
+    view = squares[2:8:2]
+    assert isinstance(view, PositionView)
+    assert list(view) == [(2, 4), (4, 16), (6, 36)]
+    assert len(view) == 3
+    assert view[1] == (4, 16)
+    assert view[-1] == (6, 36)
+    assert list(view[1:]) == [(4, 16), (6, 36)]
+    assert list(squares[::-4]) == [(9, 81), (5, 25), (1, 1)]
+    assert list(squares[-2:]) == [(8, 64), (9, 81)]
+    assert list(squares[20:]) == []
+    assert list(squares.islice(7)) == [(7, 49), (8, 64), (9, 81)]
+    assert repr(squares[:2]) == "PositionView([(0, 0), (1, 1)])"
+
+
+def test_gather(squares):
+    assert list(squares.values_at([9, 0, 3])) == [81, 0, 9]
+    assert list(squares.items_at(iter([1, 1]))) == [(1, 1), (1, 1)]
+    assert squares.values_at(range(3))[2] == 4
+    with pytest.raises(IndexError):
+        squares.values_at([10])
+    with pytest.raises(IndexError):
+        squares.items_at([-1])
+
+
+def test_view_follows_the_jdict(squares):
+    view = squares.values_at([0, 1])
+    squares[0] = -1
+    assert list(view) == [-1, 1]
+
+
+def test_materialize(squares):
+    view = squares[1:4]
+    assert view.to_jdict() == {1: 1, 2: 4, 3: 9}
+    assert isinstance(view.to_jdict(), jdict)
+    values = squares.values_at([3, 1]).to_numpy()
+    assert isinstance(values, np.ndarray)
+    assert values.tolist() == [9, 1]
+    assert view.to_numpy(dtype=float).dtype == np.float64
+
+
+def test_missing_still_works():
+    class Defaulting(jdict):
+        __slots__ = ()
+
+        def __missing__(self, key):
+            return 0
+
+    defaulting = Defaulting(x=3)
+    assert defaulting["y"] == 0
+    assert list(defaulting[:]) == [("x", 3)]
+
+
+@pytest.mark.parametrize("cls", [jsorted, jordered, jrecord, jarray])
+def test_subclasses(cls):
+    j = cls({idx: idx * idx for idx in range(10)})
+    assert list(j[2:8:2]) == [(2, 4), (4, 16), (6, 36)]
+    assert list(j.values_at([9, 0])) == [81, 0]
+    assert j[::3].to_numpy().tolist() == [0, 9, 36, 81]
+
+
+def test_jarray_slices_are_array_views():
+    j = jarray({idx: float(idx) for idx in range(10)})
+    values = j[2:8:2].to_numpy()
+    assert values.tolist() == [2.0, 4.0, 6.0]
+    assert np.shares_memory(values, j.value_list)
+    assert j[::-1].to_numpy().tolist() == list(map(float, range(9, -1, -1)))
+    assert j.values_at([3, 1]).to_numpy().tolist() == [3.0, 1.0]
+
+
+def test_jfile(tmp_path):
+    with jfile(str(tmp_path / "table")) as table:
+        table.update({idx: str(idx) for idx in range(5)})
+        assert list(table[1:3]) == [(1, "1"), (2, "2")]
+        assert list(table.values_at([4, 0])) == ["4", "0"]